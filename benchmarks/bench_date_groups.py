@@ -0,0 +1,72 @@
+"""
+Compare update time bucketing of result view: original per-row strptime grouping against
+OutputHandler._date_groups (one parse per distinct day, bisect against precomputed cutoffs).
+
+Usage: python benchmarks/bench_date_groups.py [ROWS] [REPEAT]
+"""
+from datetime import datetime, timedelta
+from os.path import dirname, realpath
+import random
+import sys
+import timeit
+
+sys.path.insert(0, dirname(dirname(realpath(__file__))))
+from manga_tracker.output import OutputHandler
+
+def _date_grouper(today_dt, date_str, pattern='%d-%m-%Y %H:%M'):
+    """
+    Original per-row time grouping (before chunked bucketing).
+
+    Parameters
+    ------
+        today_dt: date. System current date.
+        date_str: str. Date in string format.
+        pattern : str (default='%d-%m-%Y %H:%M'). String literal to extract date data.
+
+    Returns
+    -------
+        group   : int. Time group (1 for 'today', 2 for 'last 7 days', 3 for 'last 30 days', 4 for 'older')
+    """
+    query_dt = datetime.strptime(date_str, pattern).date()
+    if (query_dt == today_dt):
+        return 1
+    elif (query_dt >= today_dt - timedelta(days=7)):
+        return 2
+    elif (query_dt >= today_dt - timedelta(days=30)):
+        return 3
+    else:
+        return 4
+
+def _dates(count, today_dt):
+    """
+    Generate update times spread over the last year.
+
+    Parameters
+    ------
+        count       : int. Number of update times.
+        today_dt    : date. System current date.
+
+    Returns
+    -------
+        date_strs   : list. Update times in output string format.
+    """
+    rng = random.Random(0)
+    now = datetime.combine(today_dt, datetime.min.time())
+    return [(now - timedelta(minutes=rng.randrange(365 * 24 * 60))).strftime('%d-%m-%Y %H:%M') for _ in range(count)]
+
+def main(count=200000, repeat=3):
+    today_dt = datetime.now().date()
+    date_strs = _dates(count, today_dt)
+    old = [_date_grouper(today_dt, date_str) for date_str in date_strs]
+    new = OutputHandler._date_groups(date_strs, today_dt)
+    assert old == new, 'time groups differ'
+
+    old_time = min(timeit.repeat(lambda: [_date_grouper(today_dt, date_str) for date_str in date_strs],
+                                 number=1, repeat=repeat))
+    new_time = min(timeit.repeat(lambda: OutputHandler._date_groups(date_strs, today_dt), number=1, repeat=repeat))
+    print(f'{count} rows, best of {repeat}')
+    print(f'per-row strptime : {old_time:.3f}s')
+    print(f'_date_groups     : {new_time:.3f}s ({old_time / new_time:.1f}x)')
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,101 @@
+"""
+Measure CLI startup: wall time of each subcommand in a fresh interpreter, and `python -X importtime`
+breakdown of importing the CLI module. Crawl-only dependencies should not be imported at startup.
+
+Usage: python benchmarks/bench_startup.py [--repeat N] [--top N] [--cwd DIR]
+       (subcommands run with --help, unless --cwd points to a directory with a result folder)
+"""
+from os.path import dirname, isdir, join, realpath
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = dirname(dirname(realpath(__file__)))
+CLI = 'from manga_tracker.scripts.cli_interface import cli; cli()'
+COMMANDS = [
+    ['show-bounty'], ['show-log'], ['show-output', '-n', '20'], ['result', '--limit', '20'], ['changes'], ['stats'],
+    ['crawl', '--help'], ['watch', '--help'], ['merge', '--help'],
+]
+DEFERRED = ('requests', 'bs4', 'concurrent.futures', 'asyncio', 'multiprocessing')
+
+def _env():
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [ROOT, env.get('PYTHONPATH')]))
+    return env
+
+def _time(args, cwd, repeat):
+    """
+    Run command in fresh interpreter several times.
+
+    Parameters
+    ------
+        args    : list. Interpreter arguments.
+        cwd     : str. Working directory of command.
+        repeat  : int. Number of runs.
+
+    Returns
+    -------
+        median  : float. Median wall time in milliseconds.
+        code    : int. Exit code of last run.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable] + args, cwd=cwd, env=_env(),
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), proc.returncode
+
+def _importtime(top):
+    """
+    Get slowest imports (cumulative) of CLI module.
+
+    Parameters
+    ------
+        top     : int. Number of shown imports.
+
+    Returns
+    -------
+        total   : int. Cumulative import time of CLI module in microseconds.
+        rows    : list. (cumulative microseconds, module name) of slowest imports.
+        loaded  : list. Deferred modules which are imported at startup.
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import manga_tracker.scripts.cli_interface'],
+                          env=_env(), capture_output=True, text=True, check=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if (not line.startswith('import time:')) or ('cumulative' in line):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative), name.rstrip()))
+    total = next(cumulative for cumulative, name in rows if (name.strip() == 'manga_tracker.scripts.cli_interface'))
+    loaded = [module for module in DEFERRED if any(name.strip() == module for _, name in rows)]
+    return total, sorted(rows, reverse=True)[:top], loaded
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10, help='Runs per command (median is shown).')
+    parser.add_argument('--top', type=int, default=10, help='Number of slowest imports shown.')
+    parser.add_argument('--cwd', default=None, help='Working directory with result folder to run commands in.')
+    args = parser.parse_args()
+    run_cmds = (args.cwd is not None) and isdir(join(args.cwd, 'result'))
+
+    base, _ = _time(['-c', 'pass'], ROOT, args.repeat)
+    print(f'{"interpreter":28} {base:7.1f} ms')
+    for cmd in COMMANDS:
+        cmd = cmd if (run_cmds or cmd[-1] == '--help') else cmd[:1] + ['--help']
+        median, code = _time(['-c', CLI] + cmd, args.cwd if (run_cmds) else ROOT, args.repeat)
+        status = '' if (code == 0) else f' (exit {code})'
+        print(f'{" ".join(cmd):28} {median:7.1f} ms{status}')
+
+    total, rows, loaded = _importtime(args.top)
+    print(f'\nimport manga_tracker.scripts.cli_interface: {total / 1000:.1f} ms cumulative')
+    for cumulative, name in rows:
+        print(f'{cumulative / 1000:7.1f} ms {name}')
+    print(f'\ndeferred modules imported at startup: {", ".join(loaded) if (loaded) else "none"}')
+
+if __name__ == '__main__':
+    main()
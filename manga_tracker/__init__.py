@@ -1,17 +1,37 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
+from functools import partial
 from os import mkdir
+from os.path import join
+from threading import Lock
+import random
 import time
 
-from .bounty import BountyHandler
+from .bounty import BountyHandler, BountyStore
+from .cache import ValidatorCache
+from .changes import ChangeSet
+from .checkpoint import Checkpoint
 from .log import LogHandler
+from .metrics import Metrics
 from .output import OutputHandler
+from .ratelimit import RateLimiter
+from .schedule import Scheduler
+from .shard import ShardRing
+from .summary import ResultSummary
+from .writer import JobWriter
 
 class MangaTracker:
     """
     [Static Class] Main interface to manga web crawling job.
     """
+    DEFAULT_DELAY = 10
+    MAX_THROTTLE_RETRY = 3
+    MAX_RETRY = 3
+    RETRY_BACKOFF = 1.0
+    RETRY_STATUS = (500, 502, 504)
+    TIMEOUT = (5, 30)
+    JOB_RESOURCES = ('checkpoint', 'metrics', 'changeset')
+    _jobs = {}
+    _jobs_lock = Lock()
 
     @staticmethod
     def _preproccess(data):
@@ -40,45 +60,244 @@ class MangaTracker:
         return processed
 
     @staticmethod
-    def _scrape(url):
+    def _session(pool_size):
         """
-        Start scraping page with inputted URL.
+        Create HTTP session that keep connections alive and reuse them for every request to the same host.
+
+        Parameters
+        ----------
+            pool_size   : int. Maximum number of kept connections per host.
+
+        Returns
+        -------
+            session     : Session. Pooled HTTP session.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    @staticmethod
+    def _fetch(url, session=None, limiter=None, reserved=False, headers=None, timings=None):
+        """
+        Get page with inputted URL, respecting host's rate limiter and retrying throttled request. Request has
+        connect and read timeout, and transient error (connection error, timeout or server error) is retried
+        with jittered exponential backoff.
 
         Parameters
         ----------
             url     : str. Manga (target) main page URL.
+            session : Session (default=None). Pooled HTTP session. New connection will be opened if not given.
+            limiter : RateLimiter (default=None). Rate limiter of URL's host.
+            reserved: boolean (default=False). Flag if first request slot is already reserved from limiter.
+            headers : dict (default=None). Additional request headers.
+            timings : dict (default=None). Stage timings. Request duration ('fetch', without rate limiter wait)
+                      and downloaded 'bytes' are recorded if given.
 
         Returns
         -------
-            data    : dict. Extracted data from web scraping in dictionary format.
-            response: int. Request status code while trying to get web page.
+            req     : Response. Page response.
         """
-        # Get and parse page
-        req = requests.get(url)
-        page = BeautifulSoup(req.content, 'html.parser')
-
-        # Extract block of data
-        info_panel = page.find('div', class_="story-info-right")
-        info_table = info_panel.table.tbody.find_all('tr')
-        info_extent = info_panel.div.find_all("p")
-
-        # Extract information
-        extracted = {
-            'title': info_panel.h1.text,
-            'ongoing': info_table[2].find_all('td')[1].text,
-            'updated_at': info_extent[0].find_all('span')[1].text,
-            'latest_chapter': info_extent[3].find_all('span')[1].a.text,
-            'latest_chapter_link': info_extent[3].find_all('span')[1].a['href'],
-        }
+        import requests
+
+        throttled, failed, elapsed = 0, 0, 0
+
+        while True:
+            if (limiter) and (throttled or failed or not reserved):
+                limiter.acquire()
+            start = time.perf_counter()
+            try:
+                req = (session or requests).get(url, headers=headers, timeout=MangaTracker.TIMEOUT)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                failed += 1
+                if (failed > MangaTracker.MAX_RETRY):
+                    raise
+                time.sleep(random.uniform(0, MangaTracker.RETRY_BACKOFF * 2 ** (failed - 1)))
+                continue
+
+            finally:
+                elapsed += time.perf_counter() - start
+
+            if (req.status_code in MangaTracker.RETRY_STATUS) and (failed < MangaTracker.MAX_RETRY):
+                failed += 1
+                time.sleep(random.uniform(0, MangaTracker.RETRY_BACKOFF * 2 ** (failed - 1)))
+                continue
+            if (limiter is None) or (not limiter.feedback(req.status_code, req.headers.get('Retry-After'))):
+                break
+            throttled += 1
+            if (throttled > MangaTracker.MAX_THROTTLE_RETRY):
+                break
+        if (timings is not None):
+            timings['fetch'] = elapsed
+            timings['bytes'] = len(req.content)
+        return req
+
+    @staticmethod
+    def _parse(content, extractor=None, timings=None, encoding=None):
+        """
+        Parse page and extract manga information.
+
+        Parameters
+        ----------
+            content     : bytes. Page content.
+            extractor   : Extractor (default=None). Page extractor. Default to MangaBat streaming extractor.
+            timings     : dict (default=None). Stage timings. 'parse' and 'preprocess' durations are recorded if given.
+            encoding    : str (default=None). Charset of response (detected from page if not given).
+
+        Returns
+        -------
+            data        : dict. Extracted data from web scraping in dictionary format.
+        """
+        from .extractor import ExtractorRegistry
+
+        start = time.perf_counter()
+        extracted = (extractor or ExtractorRegistry.get(ExtractorRegistry.DEFAULT)).extract(content, encoding)
+        parsed = time.perf_counter()
 
         # Preprocess data
         data = MangaTracker._preproccess(extracted)
+        if (timings is not None):
+            timings['parse'] = parsed - start
+            timings['preprocess'] = time.perf_counter() - parsed
+        return data
+
+    @staticmethod
+    def _fetch_cached(url, session=None, limiter=None, reserved=False, cache=None, timings=None, version=None):
+        """
+        Get page with inputted URL. If cache is given, page is requested conditionally
+        and last extracted data is returned on not modified (304) response. Not modified response without
+        cached data (e.g. cache entry was dropped) is refetched unconditionally. Any other response than page (200)
+        raises HTTPError, so error pages are never parsed.
+
+        Parameters
+        ----------
+            url     : str. Manga (target) main page URL.
+            session : Session (default=None). Pooled HTTP session. New connection will be opened if not given.
+            limiter : RateLimiter (default=None). Rate limiter of URL's host.
+            reserved: boolean (default=False). Flag if first request slot is already reserved from limiter.
+            cache   : ValidatorCache (default=None). HTTP validator cache.
+            timings : dict (default=None). Stage timings to be recorded.
+            version : str (default=None). Version of extractor used for URL (see `Extractor.version`).
+
+        Returns
+        -------
+            req     : Response. Page response.
+            data    : dict. Cached extracted data (None if page need to be parsed).
+        """
+        import requests
+
+        headers = cache.headers(url, version) if (cache) else None
+        req = MangaTracker._fetch(url, session, limiter, reserved, headers, timings)
+        if (cache) and (req.status_code == 304):
+            data = cache.hit(url, version)
+            if (data is not None):
+                return req, data
+            req = MangaTracker._fetch(url, session, limiter, False, None, timings)
+        if (req.status_code != 200):
+            req.raise_for_status()
+            raise requests.exceptions.HTTPError(f'Unexpected status {req.status_code} for url: {url}', response=req)
+        return req, None
+
+    @staticmethod
+    def _scrape(url, session=None, limiter=None, reserved=False, cache=None, extractor=None, timings=None):
+        """
+        Start scraping page with inputted URL. If cache is given, page is requested conditionally
+        and last extracted data is reused on not modified (304) response.
+
+        Parameters
+        ----------
+            url     : str. Manga (target) main page URL.
+            session : Session (default=None). Pooled HTTP session. New connection will be opened if not given.
+            limiter : RateLimiter (default=None). Rate limiter of URL's host.
+            reserved: boolean (default=False). Flag if first request slot is already reserved from limiter.
+            cache   : ValidatorCache (default=None). HTTP validator cache.
+            extractor: Extractor (default=None). Page extractor. Default to MangaBat streaming extractor.
+            timings : dict (default=None). Stage timings to be recorded.
+
+        Returns
+        -------
+            data    : dict. Extracted data from web scraping in dictionary format.
+            response: int. Request status code while trying to get web page.
+        """
+        from .extractor import Extractor, ExtractorRegistry
+
+        extractor = extractor or ExtractorRegistry.get(ExtractorRegistry.DEFAULT)
+        req, data = MangaTracker._fetch_cached(url, session, limiter, reserved, cache, timings, extractor.version)
+        if (data is not None):
+            return data, req.status_code
+
+        data = MangaTracker._parse(req.content, extractor, timings, Extractor.charset(req.headers.get('Content-Type')))
+        if (cache) and (req.status_code == 200):
+            cache.store(url, req.headers, data, extractor.version)
         return data, req.status_code
 
     @staticmethod
-    def _load(path, website, alias, response, data, columns, delimiter, silent):
+    async def _scrape_async(url, session, limiter, cache, extractor, semaphore, executor, timings=None):
+        """
+        Asynchronous version of `_scrape`. Blocking I/O and parsing are run in executor, while semaphore
+        limit the number of in-flight requests.
+
+        Parameters
+        ----------
+            url         : str. Manga (target) main page URL.
+            session     : Session. Pooled HTTP session shared by all targets.
+            limiter     : RateLimiter. Rate limiter of URL's host.
+            cache       : ValidatorCache. HTTP validator cache (None if disabled).
+            extractor   : Extractor. Page extractor.
+            semaphore   : Semaphore. Asyncio semaphore to cap in-flight requests.
+            executor    : ThreadPoolExecutor. Executor to run blocking request.
+            timings     : dict (default=None). Stage timings to be recorded.
+
+        Returns
+        -------
+            data        : dict. Extracted data from web scraping in dictionary format.
+            response    : int. Request status code while trying to get web page.
+        """
+        import asyncio
+
+        await asyncio.sleep(limiter.reserve())
+        async with semaphore:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(executor, MangaTracker._scrape, url, session, limiter, True, cache, extractor,
+                                              timings)
+
+    @staticmethod
+    async def _fetch_async(url, session, limiter, cache, semaphore, executor, timings=None, version=None):
         """
-        Load data to output and log file.
+        Asynchronous version of `_fetch_cached`.
+
+        Parameters
+        ----------
+            url         : str. Manga (target) main page URL.
+            session     : Session. Pooled HTTP session shared by all targets.
+            limiter     : RateLimiter. Rate limiter of URL's host.
+            cache       : ValidatorCache. HTTP validator cache (None if disabled).
+            semaphore   : Semaphore. Asyncio semaphore to cap in-flight requests.
+            executor    : ThreadPoolExecutor. Executor to run blocking request.
+            timings     : dict (default=None). Stage timings to be recorded.
+            version     : str (default=None). Version of extractor used for URL.
+
+        Returns
+        -------
+            req         : Response. Page response.
+            data        : dict. Cached extracted data (None if page need to be parsed).
+        """
+        import asyncio
+
+        await asyncio.sleep(limiter.reserve())
+        async with semaphore:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(executor, MangaTracker._fetch_cached, url, session, limiter, True, cache,
+                                              timings, version)
+
+    @staticmethod
+    def _load(path, website, alias, response, data, columns, delimiter, silent, url=None, timings=None, resources=None):
+        """
+        Load data to output and log file, and record it to job's checkpoint, change set (and metrics).
 
         Parameters
         ----------
@@ -89,15 +308,273 @@ class MangaTracker:
             data        : dict. Extracted data from web scraping in dictionary format.
             delimiter   : str. Data delimiter in output file.
             silent      : boolean. Flag to silence progress messages.
+            url         : str (default=None). Manga (target) main page URL.
+            timings     : dict (default=None). Stage timings of target. Load duration is added and timings are
+                          recorded to job's metrics if given.
+            resources   : dict (default=None). Crawl resources holding job's checkpoint, change set and metrics.
         """
-        LogHandler.log_scrape(path, alias, response, silent)
+        start = time.perf_counter()
+        resources = resources or {}
+        LogHandler.log_scrape(path, alias, response, silent, website)
         OutputHandler.load_data(path, website, alias, data, columns, delimiter)
+        checkpoint = resources.get('checkpoint')
+        if (checkpoint):
+            checkpoint.record(website, alias, response, [website, alias] + [str(data[col]) for col in columns[2:]])
+        changeset = resources.get('changeset')
+        if (changeset):
+            changeset.record(website, alias, data)
+
+        metrics = resources.get('metrics')
+        if (metrics) and (timings is not None):
+            timings['load'] = time.perf_counter() - start
+            metrics.record(website, alias, url, response, timings)
+
+    @staticmethod
+    def _fail(path, website, alias, url, error, silent):
+        """
+        Record target which can't be fetched or parsed to failure ledger, so crawl can continue with other targets.
+
+        Parameters
+        ----------
+            path        : str. Pathname for output and log directory.
+            website     : str. Website's name of target.
+            alias       : str. Manga's alias of target.
+            url         : str. Manga (target) main page URL.
+            error       : Exception. Raised error.
+            silent      : boolean. Flag to silence progress messages.
+        """
+        import requests
+
+        stage = 'fetch' if (isinstance(error, requests.exceptions.RequestException)) else 'parse'
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+        LogHandler.log_failure(path, website, alias, url, stage, error, silent, status)
+
+    @staticmethod
+    def _write(result_path, columns, delimiter, silent, resources, website, alias, url, response, headers, data,
+               timings=None):
+        """
+        Pipeline's writer. Store parsed data to validator cache and load it to output and log file.
+
+        Parameters
+        ----------
+            result_path : str. Relative pathname for output and log directory.
+            columns     : list. List of columns name for output table.
+            delimiter   : str. Delimiter for separating data.
+            silent      : boolean. Flag to silence progress messages.
+            resources   : dict. Resources shared by all group workers.
+            website     : str. Website's name of scraped data.
+            alias       : str. Manga's alias of scraped data.
+            url         : str. Manga (target) main page URL.
+            response    : int. Request status code while trying to get web page.
+            headers     : dict. Response headers.
+            data        : dict. Extracted data from web scraping in dictionary format.
+            timings     : dict (default=None). Stage timings of target.
+        """
+        cache = resources['cache']
+        if (cache) and (response == 200):
+            cache.store(url, headers, data, resources['extractors'][website].version)
+        MangaTracker._load(result_path, website, alias, response, data, columns, delimiter, silent, url, timings, resources)
+
+    @staticmethod
+    def _job(result_path):
+        """
+        Get resources of job initiated in result directory (see `init_job`), which are used until job ends.
+
+        Parameters
+        ----------
+            result_path : str. Relative pathname for output and log directory.
+
+        Returns
+        -------
+            job         : dict. Job's checkpoint, metrics and change set (None for each if no job was initiated).
+        """
+        with MangaTracker._jobs_lock:
+            return MangaTracker._jobs.get(result_path) or dict.fromkeys(MangaTracker.JOB_RESOURCES)
+
+    @staticmethod
+    def _resources(groups, result_path, columns, delimiter, silent, use_cache, extractor, parse_workers, queue_size,
+                   limiters=None):
+        """
+        Create resources shared by all group workers in a crawl.
+
+        Parameters
+        ----------
+            groups          : list. List of groups (website) and its Manga targets information.
+            result_path     : str. Relative pathname for output and log directory.
+            columns         : list. List of columns name for output table.
+            delimiter       : str. Delimiter for separating data.
+            silent          : boolean. Flag to silence progress messages.
+            use_cache       : boolean. Flag to use HTTP validator cache.
+            extractor       : str. Name of page extractor backend.
+            parse_workers   : int. Number of parser worker processes. Pages are parsed by fetcher if 0.
+            queue_size      : int. Maximum number of pages waiting to be parsed.
+            limiters        : dict (default=None). Rate limiters kept from previous crawls, new hosts are added to it.
+
+        Returns
+        -------
+            resources       : dict. Write lock, rate limiter for each host, validator cache, extractor for each website,
+                              parse pipeline (None if parsed by fetcher), and job's checkpoint, metrics and change set
+                              (None if no job was initiated).
+        """
+        from .extractor import ExtractorRegistry
+        from .pipeline import ParsePipeline
+
+        resources = {
+            'lock': Lock(),
+            'limiters': RateLimiter.from_groups(groups, MangaTracker.DEFAULT_DELAY, limiters),
+            'cache': ValidatorCache(join(result_path, 'cache.json')) if (use_cache) else None,
+            'extractors': ExtractorRegistry.build(groups, extractor),
+            'pipeline': None,
+            **MangaTracker._job(result_path),
+        }
+        if (parse_workers > 0):
+            writer = partial(MangaTracker._write, result_path, columns, delimiter, silent, resources)
+            failed = partial(MangaTracker._fail, result_path, silent=silent)
+            resources['pipeline'] = ParsePipeline(resources['extractors'], parse_workers, queue_size, writer, failed)
+        return resources
+
+    @staticmethod
+    def _release(groups, result_path, columns, delimiter, silent, resources):
+        """
+        Log crawl statistics, persist shared resources and record targets' check to schedule state. Previous
+        record of planned target which failed is carried forward, so output still holds every target, and the
+        failure is recorded to schedule state so target is retried with backoff.
+
+        Parameters
+        ----------
+            groups      : list. List of crawled groups (website) and its Manga targets information.
+            result_path : str. Relative pathname for output and log directory.
+            columns     : list. List of columns name for output table.
+            delimiter   : str. Delimiter for separating data.
+            silent      : boolean. Flag to silence progress messages.
+            resources   : dict. Resources shared by all group workers.
+        """
+        if (resources['pipeline']):
+            resources['pipeline'].close()
+        OutputHandler.flush(result_path)
+
+        now = time.time()
+        state = Scheduler.load(result_path)
+        crawled = {(group['website'], alias) for group in groups for (alias, _) in group['targets']}
+        checkpoint = resources['checkpoint']
+        if (checkpoint):
+            for group in checkpoint.remaining():
+                for (alias, _) in group['targets']:
+                    Scheduler.fail(state, group['website'], alias, now)
+            failed = checkpoint.failed()
+            for row in failed:
+                OutputHandler.load_row(result_path, row, delimiter)
+                checkpoint.record(row[0], row[1], None, row)
+            if (failed):
+                OutputHandler.flush(result_path)
+                LogHandler.logging(path=result_path, silent=silent, event='carry_forward', records=len(failed),
+                            message=f'[Output] {len(failed)} record(s) of failed target(s) carried forward')
+            crawled -= {(row[0], row[1]) for row in failed}
+            crawled |= checkpoint.crawled()
+        for key, row in OutputHandler.read_records(result_path, delimiter).items():
+            if (key in crawled):
+                Scheduler.observe(state, *key, dict(zip(columns, row)), now)
+        Scheduler.save(result_path, state)
+
+        for host, limiter in resources['limiters'].items():
+            LogHandler.log_rate(result_path, host, limiter.effective_rate(), limiter.rate, silent)
+            limiter.reset_stats()
+
+        cache = resources['cache']
+        if (cache):
+            cache.save()
+            LogHandler.log_cache(result_path, cache.hits, cache.lookups, silent)
+
+    @staticmethod
+    def _crawl_group(group, result_path, columns, delimiter, silent, resources):
+        """
+        Crawl all targets of one group (website) sequentially, paced by its hosts' rate limiter.
+
+        Parameters
+        ----------
+            group       : dict. Group (website) and its Manga targets information.
+            result_path : str. Relative pathname for output and log directory.
+            columns     : list. List of columns name for output table.
+            delimiter   : str. Delimiter for separating data.
+            silent      : boolean. Flag to silence progress messages.
+            resources   : dict. Resources shared by all group workers.
+        """
+        website = group['website']
+        extractor = resources['extractors'][website]
+        session = MangaTracker._session(1)
+        pipeline = resources['pipeline']
+        for (title, url) in group['targets']:
+            limiter = resources['limiters'][RateLimiter.host(url)]
+            timings = {}
+            try:
+                if (pipeline):
+                    req, data = MangaTracker._fetch_cached(url, session, limiter, cache=resources['cache'], timings=timings,
+                                                           version=extractor.version)
+                else:
+                    data, response = MangaTracker._scrape(url, session, limiter, cache=resources['cache'], extractor=extractor,
+                                                          timings=timings)
+            except Exception as e:
+                with resources['lock']:
+                    MangaTracker._fail(result_path, website, title, url, e, silent)
+                continue
+            if (pipeline):
+                pipeline.put(website, title, url, req.status_code, req.headers, req.content, data, timings)
+                continue
+            with resources['lock']:
+                MangaTracker._load(result_path, website, title, response, data, columns, delimiter, silent, url, timings,
+                                   resources)
+        session.close()
+
+    @staticmethod
+    async def _crawl_group_async(group, result_path, columns, delimiter, silent, resources):
+        """
+        Asynchronous version of `_crawl_group`.
+
+        Parameters
+        ----------
+            group       : dict. Group (website) and its Manga targets information.
+            result_path : str. Relative pathname for output and log directory.
+            columns     : list. List of columns name for output table.
+            delimiter   : str. Delimiter for separating data.
+            silent      : boolean. Flag to silence progress messages.
+            resources   : dict. Resources shared by all group workers, with pooled session, semaphore and executor.
+        """
+        import asyncio
+
+        website = group['website']
+        extractor = resources['extractors'][website]
+        pipeline = resources['pipeline']
+        loop = asyncio.get_event_loop()
+        for (title, url) in group['targets']:
+            limiter = resources['limiters'][RateLimiter.host(url)]
+            timings = {}
+            try:
+                if (pipeline):
+                    req, data = await MangaTracker._fetch_async(url, resources['session'], limiter, resources['cache'],
+                                                                resources['semaphore'], resources['executor'], timings,
+                                                                extractor.version)
+                else:
+                    data, response = await MangaTracker._scrape_async(url, resources['session'], limiter, resources['cache'],
+                                                                      extractor, resources['semaphore'], resources['executor'],
+                                                                      timings)
+            except Exception as e:
+                MangaTracker._fail(result_path, website, title, url, e, silent)
+                continue
+            if (pipeline):
+                await loop.run_in_executor(resources['executor'], pipeline.put,
+                                           website, title, url, req.status_code, req.headers, req.content, data, timings)
+                continue
+            MangaTracker._load(result_path, website, title, response, data, columns, delimiter, silent, url, timings,
+                               resources)
 
     # Public Method
     @staticmethod
-    def init_job(bounty_path, result_path, columns, delimiter, silent=False):
+    def init_job(bounty_path, result_path, columns, delimiter, silent=False, incremental=False, resume=False, shard=None):
         """
-        Initiate job by reading bounty and define job metadata.
+        Initiate job by reading bounty and define job metadata. In incremental mode, only targets that are due
+        (by their observed update cadence) are returned, and previous records of other targets are carried forward.
+        In resume mode, interrupted job is continued from its checkpoint: records of completed targets are restored
+        and only remaining targets are returned. If shard is given, only targets owned by the shard are crawled.
 
         Parameters
         ----------
@@ -106,35 +583,121 @@ class MangaTracker:
             columns     : list. List of columns name for output table.
             delimiter   : str. Delimiter for separating data.
             silent      : boolean (default=False). Flag to silence progress messages.
+            incremental : boolean (default=False). Flag to only crawl due targets.
+            resume      : boolean (default=False). Flag to continue interrupted job (new job is started if none).
+            shard       : str (default=None). Shard of this node in 'i/N' format (shard number i of N shards).
+
         Returns
         -------
             groups      : list. List of extracted bounty target list.
         """
+        from .extractor import ExtractorRegistry
+
+        groups = BountyHandler.read_bounty(bounty_path)
+        # Fail on website without page layout or invalid rate before job files are touched
+        ExtractorRegistry.build(groups)
+        RateLimiter.from_groups(groups, MangaTracker.DEFAULT_DELAY)
+
         # Create folder if not exist
         try:
             mkdir(result_path)
         except FileExistsError:
             pass
+        shard_index, shard_count = ShardRing.parse(shard) if (shard) else (None, None)
 
         # Initiate job
-        LogHandler.log_start(result_path, silent)
+        checkpoint = Checkpoint.resume(result_path) if (resume) else None
+        previous = OutputHandler.read_records(result_path, delimiter) if (incremental and not checkpoint) else {}
+        JobWriter.open(result_path)
+        job_id = LogHandler.log_start(result_path, silent, checkpoint.job_id if (checkpoint) else None)
+        job = {
+            'checkpoint': checkpoint,
+            'metrics': Metrics(result_path, job_id),
+            'changeset': ChangeSet.open(result_path, job_id),
+        }
+        with MangaTracker._jobs_lock:
+            MangaTracker._jobs[result_path] = job
 
-        groups = BountyHandler.read_bounty(bounty_path)
+        if (shard):
+            groups = ShardRing(shard_count).partition(groups, shard_index)
         w_count = sum([1 for group in groups])
         t_count = sum([1 for group in groups for target in group['targets']])
-        LogHandler.logging(path=result_path, silent=silent,
-                    message=f'[Init] Target aquired from bounty file from "{bounty_path}". {t_count} target(s) from {w_count} website(s)')
+        LogHandler.log_bounty(result_path, bounty_path, t_count, w_count, silent)
 
         OutputHandler.init_output(result_path, columns, delimiter)
-        LogHandler.logging(path=result_path, silent=silent,
+        LogHandler.logging(path=result_path, silent=silent, event='output_init',
                     message=f'[Init] Output file successfully created at "{result_path}"')
+        if (shard):
+            LogHandler.logging(path=result_path, silent=silent, event='shard', shard=shard_index + 1, shards=shard_count,
+                        message=f'[Init] Shard {shard_index + 1}/{shard_count}. Targets are partitioned by URL')
 
+        if (checkpoint):
+            for entry in checkpoint.entries:
+                OutputHandler.load_row(result_path, entry['row'], delimiter)
+                if (entry['response'] is not None):
+                    LogHandler.log_scrape(result_path, entry['alias'], entry['response'], True, entry['website'])
+                    job['changeset'].record(entry['website'], entry['alias'], dict(zip(columns, entry['row'])))
+            groups = checkpoint.remaining()
+            r_count = sum([len(group['targets']) for group in groups])
+            LogHandler.logging(path=result_path, silent=silent, event='resume', restored=len(checkpoint.entries),
+                        remaining=r_count, message=f'[Init] Resume job. {len(checkpoint.entries)} record(s) restored, {r_count} target(s) remaining')
+            return groups
+
+        carried = []
+        if (incremental):
+            groups, carried = Scheduler.plan(groups, Scheduler.load(result_path), previous, time.time())
+            d_count = sum([len(group['targets']) for group in groups])
+            LogHandler.log_incremental(result_path, d_count, len(carried), silent)
+
+        fallback = [
+            previous[(group['website'], alias)] for group in groups for (alias, _) in group['targets']
+            if ((group['website'], alias) in previous)
+        ]
+        checkpoint = job['checkpoint'] = Checkpoint.start(result_path, job_id, groups, fallback)
+        for row in carried:
+            OutputHandler.load_row(result_path, row, delimiter)
+            checkpoint.record(row[0], row[1], None, row)
         return groups
 
     @staticmethod
-    def crawl(groups, result_path, columns, delimiter, silent):
+    def crawl(groups, result_path, columns, delimiter, silent, use_cache=True, extractor='stream',
+              parse_workers=0, queue_size=64, limiters=None):
+        """
+        Run the web-crawling process. Each group (website) is crawled by its own worker,
+        so websites are fetched in parallel while requests to the same host are paced by its rate limiter.
+
+        Parameters
+        ----------
+            groups      : list. List of groups (website) and its Manga targets information.
+            result_path : str. Relative pathname for output and log directory.
+            columns     : list. List of columns name for output table.
+            delimiter   : str. Delimiter for separating data.
+            silent      : boolean (default=False). Flag to silence progress messages.
+            use_cache   : boolean (default=True). Flag to use HTTP validator cache.
+            extractor   : str (default='stream'). Name of page extractor backend ('stream' or 'soup').
+            parse_workers: int (default=0). Number of parser worker processes. Pages are parsed by fetcher if 0.
+            queue_size  : int (default=64). Maximum number of fetched pages waiting to be parsed.
+            limiters    : dict (default=None). Rate limiters kept from previous crawls (e.g. by watch mode).
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        resources = MangaTracker._resources(groups, result_path, columns, delimiter, silent, use_cache, extractor,
+                                            parse_workers, queue_size, limiters)
+        with ThreadPoolExecutor(max_workers=max(len(groups), 1)) as executor:
+            futures = [
+                executor.submit(MangaTracker._crawl_group, group, result_path, columns, delimiter, silent, resources)
+                for group in groups
+            ]
+            for future in futures:
+                future.result()
+        MangaTracker._release(groups, result_path, columns, delimiter, silent, resources)
+
+    @staticmethod
+    def crawl_async(groups, result_path, columns, delimiter, silent, max_inflight=8, use_cache=True, extractor='stream',
+                    parse_workers=0, queue_size=64, limiters=None):
         """
-        Run the web-crawling process.
+        Run the web-crawling process in asyncio event loop. All targets share one pooled HTTP session,
+        so connection to the same host is reused across targets.
 
         Parameters
         ----------
@@ -143,26 +706,124 @@ class MangaTracker:
             columns     : list. List of columns name for output table.
             delimiter   : str. Delimiter for separating data.
             silent      : boolean (default=False). Flag to silence progress messages.
+            max_inflight: int (default=8). Maximum number of in-flight requests.
+            use_cache   : boolean (default=True). Flag to use HTTP validator cache.
+            extractor   : str (default='stream'). Name of page extractor backend ('stream' or 'soup').
+            parse_workers: int (default=0). Number of parser worker processes. Pages are parsed by fetcher if 0.
+            queue_size  : int (default=64). Maximum number of fetched pages waiting to be parsed.
+            limiters    : dict (default=None). Rate limiters kept from previous crawls (e.g. by watch mode).
         """
-        for group in groups:
-            website = group['website']
-            targets = group['targets']
-            for (title, url) in targets:
-                data, response = MangaTracker._scrape(url)
-                MangaTracker._load(result_path, website, title, response, data, columns, delimiter, silent)
-                time.sleep(10)
-                
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        async def _run():
+            resources['semaphore'] = asyncio.Semaphore(max_inflight)
+            await asyncio.gather(*[
+                MangaTracker._crawl_group_async(group, result_path, columns, delimiter, silent, resources)
+                for group in groups
+            ])
+
+        resources = MangaTracker._resources(groups, result_path, columns, delimiter, silent, use_cache, extractor,
+                                            parse_workers, queue_size, limiters)
+        resources['session'] = MangaTracker._session(max_inflight)
+        with ThreadPoolExecutor(max_workers=max_inflight) as executor:
+            resources['executor'] = executor
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(_run())
+            finally:
+                loop.close()
+        resources['session'].close()
+        MangaTracker._release(groups, result_path, columns, delimiter, silent, resources)
+
+    @staticmethod
+    def watch(bounty_path, result_path, columns, delimiter, silent=False, poll=60, use_cache=True, extractor='stream',
+              max_jobs=0):
+        """
+        Keep tracking targets in a long-running loop. Targets are kept in priority queue ordered by next check time
+        (by observed update cadence, or retry backoff of failed target), and an incremental job is run once the first
+        target is due. Rate limiters are kept across jobs, so adapted rate and Retry-After block of each host carry
+        over to the next job. Bounty file is checked for changes on every wake up.
+
+        Parameters
+        ----------
+            bounty_path : str. Pathname for bounty file (with extension).
+            result_path : str. Pathname for output and log directory.
+            columns     : list. List of columns name for output table.
+            delimiter   : str. Delimiter for separating data.
+            silent      : boolean (default=False). Flag to silence progress messages.
+            poll        : float (default=60). Maximum seconds between wake ups, also minimum seconds between jobs.
+            use_cache   : boolean (default=True). Flag to use HTTP validator cache.
+            extractor   : str (default='stream'). Name of page extractor backend ('stream' or 'soup').
+            max_jobs    : int (default=0). Stop after this number of jobs (0 to run until interrupted).
+        """
+        store = BountyStore.open(bounty_path)
+        queue, jobs, last_job, limiters = None, 0, float('-inf'), {}
+        while (not max_jobs) or (jobs < max_jobs):
+            if (store.load()) or (queue is None):
+                queue = Scheduler.queue(store.groups, Scheduler.load(result_path), time.time())
+
+            now = time.time()
+            start_at = max(queue[0][0] if (queue) else float('inf'), last_job + poll)
+            if (start_at > now):
+                time.sleep(min(start_at - now, poll))
+                continue
+
+            groups = MangaTracker.init_job(bounty_path, result_path, columns, delimiter, silent, incremental=True)
+            MangaTracker.crawl(groups, result_path, columns, delimiter, silent, use_cache, extractor, limiters=limiters)
+            MangaTracker.end_job(result_path, silent, delimiter)
+            jobs, last_job, queue = jobs + 1, time.time(), None
+
+    @staticmethod
+    def merge(result_path, shard_paths, columns, delimiter, silent=False):
+        """
+        Merge result directories of shards into one result set, change set and job log.
+
+        Parameters
+        ----------
+            result_path : str. Pathname for merged output and log directory.
+            shard_paths : list. Pathnames for output and log directory of each shard.
+            columns     : list. List of columns name for output table.
+            delimiter   : str. Delimiter for separating data.
+            silent      : boolean (default=False). Flag to silence progress messages.
+        """
+        try:
+            mkdir(result_path)
+        except FileExistsError:
+            pass
+
+        OutputHandler.init_output(result_path, columns, delimiter)
+        for shard_path in shard_paths:
+            records = OutputHandler.read_records(shard_path, delimiter)
+            for key in sorted(records):
+                OutputHandler.load_row(result_path, records[key], delimiter)
+        OutputHandler.flush(result_path)
+        ChangeSet.merge(result_path, shard_paths)
+        LogHandler.merge_logs(result_path, shard_paths, silent)
+        ResultSummary.build(result_path, delimiter)
+
     @staticmethod
-    def end_job(result_path, silent):
+    def end_job(result_path, silent, delimiter='|'):
         """
-        Logging job's end time.
+        Logging job's end time, close job's writer, remove job's checkpoint and write job's metrics, change set
+        and result summary.
 
         Parameters
         ----------
             result_path : str. Pathname for output and log directory.
             silent      : boolean (default=False). Flag to silence progress messages.
+            delimiter   : str (default='|'). Delimiter for separating data.
         """
+        with MangaTracker._jobs_lock:
+            job = MangaTracker._jobs.pop(result_path, None)
+        OutputHandler.flush(result_path)
         LogHandler.log_end(result_path, silent)
+        JobWriter.close_job(result_path)
+        if (job):
+            job['checkpoint'].finish()
+            job['metrics'].save()
+            job['changeset'].save()
+        ResultSummary.build(result_path, delimiter)
 
 # Handler Utilization
 MangaTracker.show_bounty = staticmethod(BountyHandler.show_bounty)
@@ -170,7 +831,14 @@ MangaTracker.check_target = staticmethod(BountyHandler.check_target)
 MangaTracker.add_target = staticmethod(BountyHandler.add_target)
 MangaTracker.remove_target = staticmethod(BountyHandler.remove_target)
 MangaTracker.update_target = staticmethod(BountyHandler.update_target)
+MangaTracker.read_targets = staticmethod(BountyHandler.read_targets)
+MangaTracker.apply_mutations = staticmethod(BountyHandler.apply_mutations)
 MangaTracker.show_log = staticmethod(LogHandler.show_log)
 MangaTracker.show_output = staticmethod(OutputHandler.show_output)
 MangaTracker.result = staticmethod(OutputHandler.result)
 MangaTracker.extract_meta = staticmethod(LogHandler.extract_meta)
+MangaTracker.set_backend = staticmethod(OutputHandler.set_backend)
+MangaTracker.stats = staticmethod(Metrics.summary)
+MangaTracker.changes = staticmethod(ChangeSet.read)
+MangaTracker.summary = staticmethod(ResultSummary.result)
+MangaTracker.parse_shard = staticmethod(ShardRing.parse)
@@ -1,15 +1,158 @@
+from os import fsync, replace, stat
+from os.path import exists, splitext
+from threading import Lock
+import csv
 import json
 
+class BountyStore:
+    """
+    [Class] In-memory bounty list with hash indexes by website and by (website, alias). Bounty list is kept as
+    snapshot file and append-only journal of edits (replayed on read). Files are read once and only re-read
+    when their modification time (or size) changes.
+    """
+    _stores = {}
+    _stores_lock = Lock()
+
+    def __init__(self, path):
+        """
+        Parameters
+        ----------
+            path    : str. Pathname for bounty file (with extension).
+        """
+        self.path = path
+        self.journal_path = f'{path}.journal'
+        self._lock = Lock()
+        self._version = None
+        self.groups = []
+        self.websites = {}
+        self.targets = {}
+        self.seq = 0
+        self.journal_size = 0
+        self.journal_clean = True
+
+    # Private Method
+    def _file_version(self):
+        st = stat(self.path)
+        journal = stat(self.journal_path) if (exists(self.journal_path)) else None
+        return (st.st_mtime_ns, st.st_size, journal and journal.st_mtime_ns, journal and journal.st_size)
+
+    def _index(self):
+        """
+        Rebuild website and target indexes from groups. Caller must hold store's lock.
+        """
+        self.websites, self.targets = {}, {}
+        for gid, group in enumerate(self.groups):
+            self.websites.setdefault(group['website'], gid)
+        for group in (self.groups[gid] for gid in self.websites.values()):
+            for tid, target in enumerate(group['targets']):
+                self.targets.setdefault((group['website'], target[0]), tid)
+
+    # Public Method
+    @staticmethod
+    def open(path):
+        """
+        Get store of bounty file. Store is opened once per process.
+
+        Parameters
+        ----------
+            path    : str. Pathname for bounty file (with extension).
+
+        Returns
+        -------
+            store   : BountyStore. Bounty store.
+        """
+        with BountyStore._stores_lock:
+            if (path not in BountyStore._stores):
+                BountyStore._stores[path] = BountyStore(path)
+            return BountyStore._stores[path]
+
+    @staticmethod
+    def read(path):
+        """
+        Read bounty snapshot and replay journal edits which are newer than snapshot. Each journal line is one
+        batch of edits ([seq, [mutation, ...]]), and a line which can't be parsed is dropped as a whole.
+
+        Parameters
+        ----------
+            path    : str. Pathname for bounty file (with extension).
+
+        Returns
+        -------
+            groups  : list. All of listed groups in bounty list.
+            seq     : int. Sequence number of last applied edit.
+            size    : int. Journal size in bytes.
+            clean   : boolean. Flag whether journal ends with complete line.
+        """
+        with open(path, 'r') as f:
+            bounty = json.loads(f.read())
+        groups, seq = bounty['groups'], bounty.get('seq', 0)
+
+        journal_path = f'{path}.journal'
+        if (not exists(journal_path)):
+            return groups, seq, 0, True
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        mutations = []
+        for line in content.splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # Incomplete batch (e.g. crash while appending), none of its edits are replayed
+            if (entry[0] > seq):
+                seq = entry[0]
+                mutations.extend(entry[1] if (isinstance(entry[1], list)) else [entry[1:]])  # Older single-edit line
+        BountyHandler._mutate(groups, mutations)
+        return groups, seq, len(content.encode('utf-8')), (content == '' or content.endswith('\n'))
+
+    def load(self):
+        """
+        Read bounty file and journal if they were changed since last read.
+
+        Returns
+        -------
+            reloaded    : boolean. Flag whether bounty list was read again.
+        """
+        with self._lock:
+            version = self._file_version()
+            if (version == self._version):
+                return False
+            self.groups, self.seq, self.journal_size, self.journal_clean = BountyStore.read(self.path)
+            self._version = version
+            self._index()
+            return True
+
+    def reset(self, groups, seq, journal_size):
+        """
+        Replace bounty list after it was written to bounty file or journal.
+
+        Parameters
+        ----------
+            groups          : list. All of listed groups in bounty list.
+            seq             : int. Sequence number of last applied edit.
+            journal_size    : int. Journal size in bytes.
+        """
+        with self._lock:
+            self.groups = groups
+            self.seq = seq
+            self.journal_size = journal_size
+            self.journal_clean = True
+            self._version = self._file_version()
+            self._index()
+
 class BountyHandler:
     """
     [Static Class] Handler to use and manage bounty list.
     """
 
+    JOURNAL_LIMIT = 64 * 1024
+
     # Private Method
     @staticmethod
     def _reconstruct(path, bounty, message=None):
         """
-        Reconstruct bounty list with new bounty list.
+        Reconstruct bounty list with new bounty list (compact journal into snapshot). New list is written to
+        temporary file and renamed over bounty file, so bounty file is never left half written. Snapshot keeps
+        sequence number of last edit, so journal edits are not replayed twice if journal can't be emptied.
 
         Parameters
         ----------
@@ -21,15 +164,114 @@ class BountyHandler:
         -------
             message : str. Message upon successfull bounty list reconstruct attempt.
         """
-        with open(path, 'w') as f:
-            f.write(json.dumps({'groups': bounty}))
+        store = BountyStore.open(path)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(json.dumps({'groups': bounty, 'seq': store.seq}))
+            f.flush()
+            fsync(f.fileno())
+        replace(tmp_path, path)
+        if (exists(store.journal_path)):
+            open(store.journal_path, 'w').close()
+        store.reset(bounty, store.seq, 0)
+        return message
+
+    @staticmethod
+    def _journal(path, bounty, mutations, message=None):
+        """
+        Append edits to bounty journal as a single line, so a batch is either replayed whole or not at all.
+        Journal is compacted into snapshot when it passes size limit.
+
+        Parameters
+        ----------
+            path        : str. Pathname for bounty file (with extension).
+            bounty      : dict. Bounty list with edits already applied.
+            mutations   : list. Applied edits (see apply_mutations).
+            message     : str (default=None). Message for successfull edit attempt.
+
+        Returns
+        -------
+            message     : str. Message upon successfull edit attempt.
+        """
+        store = BountyStore.open(path)
+        seq = store.seq + 1
+        lines = [] if (store.journal_clean) else ['']
+        lines.append(json.dumps([seq, [list(mutation) for mutation in mutations]]))
+        content = '\n'.join(lines) + '\n'
+        with open(store.journal_path, 'a', encoding='utf-8') as f:
+            f.write(content)
+            f.flush()
+            fsync(f.fileno())
+        store.reset(bounty, seq, store.journal_size + len(content.encode('utf-8')))
+
+        if (store.journal_size > BountyHandler.JOURNAL_LIMIT):
+            BountyHandler._reconstruct(path, bounty)
         return message
 
+    @staticmethod
+    def _mutate(bounty_list, mutations):
+        """
+        Apply target mutations to bounty list in place.
+
+        Parameters
+        ----------
+            bounty_list : list. All of listed groups in bounty list.
+            mutations   : list. Mutations in order (see apply_mutations).
+
+        Returns
+        -------
+            applied     : list. Applied mutations.
+            errors      : list. Message for each mutation which can't be applied.
+        """
+        websites = {}
+        for group in bounty_list:
+            websites.setdefault(group['website'], group)
+        targets = {}
+        for website, group in websites.items():
+            for target in group['targets']:
+                targets.setdefault((website, target[0]), target)
+
+        applied, errors, removed = [], [], set()
+        for mutation in mutations:
+            action, website, alias, *args = mutation
+            key = (website, alias)
+            if (website not in websites):
+                errors.append(f"Group with website '{website}' was not found!")
+            elif (action == 'add'):
+                if (key in targets):
+                    errors.append(f"Target with alias '{alias}' already exist in '{website}' group's!")
+                    continue
+                targets[key] = [alias, args[0]]
+                websites[website]['targets'].append(targets[key])
+                applied.append(mutation)
+            elif (key not in targets):
+                errors.append(f"Target with alias '{alias}' was not found in '{website}' group's!")
+            elif (action == 'remove'):
+                removed.add(id(targets.pop(key)))
+                applied.append(mutation)
+            elif (action == 'update'):
+                newalias, newlink = args
+                if (newalias not in ('', alias)) and ((website, newalias) in targets):
+                    errors.append(f"Target with alias '{newalias}' already exist in '{website}' group's!")
+                    continue
+                target = targets.pop(key)
+                target[0] = target[0] if (newalias == '') else newalias
+                target[1] = target[1] if (newlink == '') else newlink
+                targets[(website, target[0])] = target
+                applied.append(mutation)
+            else:
+                errors.append(f"Unknown mutation '{action}'!")
+
+        if (removed):
+            for group in bounty_list:
+                group['targets'] = [target for target in group['targets'] if (id(target) not in removed)]
+        return applied, errors
+
     # Public Method
     @staticmethod
     def read_bounty(path):
         """
-        Validate and read bounty list from path.
+        Validate and read bounty list from path, with journal edits replayed.
 
         Parameters
         ----------
@@ -39,9 +281,7 @@ class BountyHandler:
         -------
             groups  : list. All of listed groups in bounty list.
         """
-        with open(path, 'r') as f:
-            bounty = json.loads(f.read())
-        return bounty['groups']
+        return BountyStore.read(path)[0]
 
     @staticmethod
     def show_bounty(path):
@@ -83,26 +323,20 @@ class BountyHandler:
         else:
             error_code  : int. (-1) if group or target doesn't exist or duplicate.
         """
-        bounty_list = BountyHandler.read_bounty(path)
+        store = BountyStore.open(path)
+        store.load()
+        bounty_list = store.groups
 
         # Check Group
-        group_id = None
-        for id, group in enumerate(bounty_list):
-            if (group['website'] == website):
-                group_id = id
-                break
+        group_id = store.websites.get(website)
         if (group_id is None):
             return (-1, f"Group with website '{website}' was not found!")
         elif (alias is None):
             return (bounty_list, group_id)
 
         # Check Target
-        targets = bounty_list[group_id]['targets']
-        result = None
-        for id, target in enumerate(targets):
-            if (target[0] == alias):
-                result = (bounty_list, group_id, id)
-                break
+        target_id = store.targets.get((website, alias))
+        result = None if (target_id is None) else (bounty_list, group_id, target_id)
         if (duplicate):
             return (bounty_list, group_id) if (result is None) else (-1, f"Target with alias '{alias}' already exist in '{website}' group's!")
         else:
@@ -127,7 +361,7 @@ class BountyHandler:
             message : str. Message upon successfull add target attempt.
         """
         bounty_list[group_id]['targets'].append([alias, link])
-        message = BountyHandler._reconstruct(path, bounty_list,
+        message = BountyHandler._journal(path, bounty_list, [('add', website, alias, link)],
                     f"Successfully add '{alias}' to '{website}'")
         return message
 
@@ -150,7 +384,7 @@ class BountyHandler:
         website = bounty_list[group_id]['website']
         alias = bounty_list[group_id]['targets'][target_id][0]
         bounty_list[group_id]['targets'].pop(target_id)
-        message = BountyHandler._reconstruct(path, bounty_list,
+        message = BountyHandler._journal(path, bounty_list, [('remove', website, alias)],
                     f"Successfully remove '{alias}' from '{website}'")
         return message
 
@@ -179,6 +413,57 @@ class BountyHandler:
         oldalias = target[0]
         target[0] = target[0] if (newalias == "") else newalias
         target[1] = target[1] if (newlink == "") else newlink
-        message = BountyHandler._reconstruct(path, bounty_list,
+        mutation = ('update', bounty_list[group_id]['website'], oldalias, newalias, newlink)
+        message = BountyHandler._journal(path, bounty_list, [mutation],
                     f"Successfully changed target '{oldalias}' from '{website}'")
         return message
+
+    @staticmethod
+    def read_targets(path):
+        """
+        Read targets to be imported from CSV or JSON file. CSV file has header with 'website', 'alias' and 'link'
+        columns. JSON file is a list of objects with the same keys, or a bounty list.
+
+        Parameters
+        ----------
+            path    : str. Pathname for import file (with '.csv' or '.json' extension).
+
+        Returns
+        -------
+            targets : list. List of [website, alias, link].
+        """
+        if (splitext(path)[1].lower() == '.csv'):
+            with open(path, 'r', newline='', encoding='utf-8') as f:
+                return [[row['website'], row['alias'], row['link']] for row in csv.DictReader(f)]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.loads(f.read())
+        if (isinstance(data, dict)):
+            return [[group['website'], alias, link] for group in data['groups'] for alias, link in group['targets']]
+        return [[row['website'], row['alias'], row['link']] for row in data]
+
+    @staticmethod
+    def apply_mutations(path, mutations):
+        """
+        Apply many target mutations in memory and persist them in a single journal append.
+
+        Parameters
+        ----------
+            path        : str. Pathname for bounty file (with extension).
+            mutations   : list. Mutations in order, each one of:
+                          ('add', website, alias, link),
+                          ('remove', website, alias),
+                          ('update', website, alias, newalias, newlink). Give value "" to keep alias or link.
+
+        Returns
+        -------
+            applied     : int. Number of applied mutations.
+            errors      : list. Message for each mutation which can't be applied.
+        """
+        store = BountyStore.open(path)
+        store.load()
+        bounty_list = json.loads(json.dumps(store.groups))
+        applied, errors = BountyHandler._mutate(bounty_list, mutations)
+        if (applied):
+            BountyHandler._journal(path, bounty_list, applied)
+        return len(applied), errors
@@ -0,0 +1,106 @@
+from os.path import exists
+from threading import Lock
+import json
+
+class ValidatorCache:
+    """
+    [Class] On-disk HTTP validator (ETag / Last-Modified) cache of extracted target data. Each entry is keyed
+    by URL and version of extractor that produced its data, so entries of older layout are not reused.
+    """
+
+    def __init__(self, path):
+        """
+        Parameters
+        ----------
+            path    : str. Pathname for cache file (with extension).
+        """
+        self.path = path
+        self.hits = 0
+        self.lookups = 0
+        self._lock = Lock()
+        self._entries = {}
+        if (exists(path)):
+            with open(path, 'r', encoding='utf-8') as f:
+                self._entries = json.loads(f.read())
+
+    def _entry(self, url, version):
+        """
+        Get cached record of URL extracted by given extractor version (None if not found or outdated).
+        """
+        entry = self._entries.get(url)
+        if (entry is None) or (entry.get('version') != version):
+            return None
+        return entry
+
+    def headers(self, url, version=None):
+        """
+        Get conditional request headers for URL.
+
+        Parameters
+        ----------
+            url     : str. Manga (target) main page URL.
+            version : str (default=None). Version of extractor used for URL.
+
+        Returns
+        -------
+            headers : dict. Conditional request headers. Empty if URL has no cached record of the version.
+        """
+        with self._lock:
+            self.lookups += 1
+            entry = self._entry(url, version)
+        if (entry is None):
+            return {}
+        headers = {}
+        if (entry.get('etag')):
+            headers['If-None-Match'] = entry['etag']
+        if (entry.get('last_modified')):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def hit(self, url, version=None):
+        """
+        Get last extracted data of URL upon not modified response.
+
+        Parameters
+        ----------
+            url     : str. Manga (target) main page URL.
+            version : str (default=None). Version of extractor used for URL.
+
+        Returns
+        -------
+            data    : dict. Last extracted data of URL (None if URL has no cached record of the version).
+        """
+        with self._lock:
+            entry = self._entry(url, version)
+            if (entry is None):
+                return None
+            self.hits += 1
+            return dict(entry['data'])
+
+    def store(self, url, headers, data, version=None):
+        """
+        Store response validators and extracted data of URL. Response without validator is not cached.
+
+        Parameters
+        ----------
+            url     : str. Manga (target) main page URL.
+            headers : dict. Response headers.
+            data    : dict. Extracted data from web scraping in dictionary format.
+            version : str (default=None). Version of extractor which extracted data.
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        with self._lock:
+            if (etag or last_modified):
+                self._entries[url] = {'etag': etag, 'last_modified': last_modified, 'version': version,
+                                      'data': data}
+            else:
+                self._entries.pop(url, None)
+
+    def save(self):
+        """
+        Persist cache to file.
+        """
+        with self._lock:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(self._entries))
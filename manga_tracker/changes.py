@@ -0,0 +1,129 @@
+from os.path import exists, join
+from threading import Lock
+import json
+
+class ChangeSet:
+    """
+    [Class] New chapter detector. Latest chapter of every target is kept in chapter index (chapters.json), so each
+    loaded record is compared with previous record of the same target by key lookup. Targets with new latest
+    chapter are written to job's change set (changes.json) when job ends.
+    """
+    INDEX = 'chapters.json'
+    FILENAME = 'changes.json'
+    FIELDS = ('title', 'latest_chapter', 'latest_chapter_link', 'updated_at')
+
+    def __init__(self, path, job_id, index):
+        """
+        Parameters
+        ----------
+            path    : str. Pathname for result directory.
+            job_id  : str. Id of running job.
+            index   : dict. Latest known [title, latest_chapter, latest_chapter_link, updated_at] for each target.
+        """
+        self.path = path
+        self.job_id = job_id
+        self.index = index
+        self.changes = {}
+        self._lock = Lock()
+
+    # Private Method
+    @staticmethod
+    def _key(website, alias):
+        return f'{website}|{alias}'
+
+    @staticmethod
+    def _read(filepath, default):
+        if (not exists(filepath)):
+            return default
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.loads(f.read())
+
+    # Public Method
+    @staticmethod
+    def open(path, job_id):
+        """
+        Start detecting changes of job in result directory, against chapter index of previous jobs.
+
+        Parameters
+        ----------
+            path    : str. Pathname for result directory.
+            job_id  : str. Id of running job.
+
+        Returns
+        -------
+            changeset   : ChangeSet. Change detector.
+        """
+        return ChangeSet(path, job_id, ChangeSet._read(join(path, ChangeSet.INDEX), {}))
+
+    def save(self):
+        """
+        Write change set of job and updated chapter index to result directory. Index is only updated when job
+        ends, so records restored by resumed job are compared again.
+        """
+        with self._lock:
+            content = {'job_id': self.job_id, 'changes': list(self.changes.values())}
+            index = self.index
+        with open(join(self.path, ChangeSet.FILENAME), 'w', encoding='utf-8') as f:
+            f.write(json.dumps(content))
+        with open(join(self.path, ChangeSet.INDEX), 'w', encoding='utf-8') as f:
+            f.write(json.dumps(index))
+
+    def record(self, website, alias, data):
+        """
+        Compare loaded record with previous record of target. Target is added to change set if its latest
+        chapter is changed (target seen for the first time is only indexed).
+
+        Parameters
+        ----------
+            website : str. Website's name of record.
+            alias   : str. Manga's alias of record.
+            data    : dict. Extracted data of record.
+        """
+        key = ChangeSet._key(website, alias)
+        entry = [str(data[field]) for field in ChangeSet.FIELDS]
+        with self._lock:
+            previous = self.index.get(key)
+            self.index[key] = entry
+            if (previous is None) or (previous[1] == entry[1]):
+                return
+            self.changes[key] = {
+                'website': website, 'alias': alias, 'title': entry[0],
+                'previous_chapter': previous[1], 'latest_chapter': entry[1],
+                'latest_chapter_link': entry[2], 'updated_at': entry[3],
+            }
+
+    @staticmethod
+    def read(path):
+        """
+        Get new chapters found by latest job.
+
+        Parameters
+        ----------
+            path    : str. Pathname for result directory.
+
+        Returns
+        -------
+            job_id  : str. Id of latest job (None if there is no change set).
+            changes : list. Changed targets, each as dict with website, alias, title, previous_chapter,
+                      latest_chapter, latest_chapter_link and updated_at.
+        """
+        content = ChangeSet._read(join(path, ChangeSet.FILENAME), {'job_id': None, 'changes': []})
+        return content['job_id'], content['changes']
+
+    @staticmethod
+    def merge(path, shard_paths):
+        """
+        Merge change sets of shards into one change set.
+
+        Parameters
+        ----------
+            path        : str. Pathname for merged result directory.
+            shard_paths : list. Pathnames for result directory of each shard.
+        """
+        job_id, changes = None, []
+        for shard_path in shard_paths:
+            shard_job_id, shard_changes = ChangeSet.read(shard_path)
+            job_id = job_id or shard_job_id
+            changes.extend(shard_changes)
+        with open(join(path, ChangeSet.FILENAME), 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'job_id': job_id, 'changes': changes}))
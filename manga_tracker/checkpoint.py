@@ -0,0 +1,159 @@
+from os import remove
+from os.path import exists, join
+from threading import Lock
+import json
+
+class Checkpoint:
+    """
+    [Class] Job checkpoint. Crawl plan of a job and every loaded record are appended to checkpoint file as soon as
+    they are known, so an interrupted job can be resumed without fetching completed targets again.
+    """
+    FILENAME = 'checkpoint.jsonl'
+
+    def __init__(self, path, job_id, groups, entries=None, fallback=None):
+        """
+        Parameters
+        ----------
+            path    : str. Pathname for result directory.
+            job_id  : str. Id of checkpointed job.
+            groups  : list. Groups (website) and its Manga targets planned to be crawled in job.
+            entries : list (default=None). Loaded records, each as dict with website, alias, response and row.
+            fallback: list (default=None). Previous output rows of planned targets, kept if target fails.
+        """
+        self.path = path
+        self.job_id = job_id
+        self.groups = groups
+        self.entries = entries or []
+        self.fallback = fallback or []
+        self._lock = Lock()
+        self._file = None
+
+    # Private Method
+    @staticmethod
+    def _filepath(path):
+        return join(path, Checkpoint.FILENAME)
+
+    def _append(self, obj):
+        """
+        Append line to checkpoint file. Caller must hold checkpoint's lock.
+        """
+        self._file.write(json.dumps(obj) + '\n')
+        self._file.flush()
+
+    # Public Method
+    @staticmethod
+    def start(path, job_id, groups, fallback=None):
+        """
+        Create checkpoint for new job. Checkpoint of previous job is discarded.
+
+        Parameters
+        ----------
+            path    : str. Pathname for result directory.
+            job_id  : str. Id of new job.
+            groups  : list. Groups (website) and its Manga targets planned to be crawled in job.
+            fallback: list (default=None). Previous output rows of planned targets, kept if target fails.
+
+        Returns
+        -------
+            checkpoint  : Checkpoint. Opened checkpoint.
+        """
+        checkpoint = Checkpoint(path, job_id, groups, fallback=fallback)
+        checkpoint._file = open(Checkpoint._filepath(path), 'w', encoding='utf-8')
+        checkpoint._append({'job_id': job_id, 'groups': groups, 'fallback': checkpoint.fallback})
+        return checkpoint
+
+    @staticmethod
+    def resume(path):
+        """
+        Reopen checkpoint of interrupted job.
+
+        Parameters
+        ----------
+            path    : str. Pathname for result directory.
+
+        Returns
+        -------
+            checkpoint  : Checkpoint. Opened checkpoint (None if there is no interrupted job).
+        """
+        filepath = Checkpoint._filepath(path)
+        if (not exists(filepath)):
+            return None
+        with open(filepath, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        try:
+            header = json.loads(lines[0])
+        except (IndexError, ValueError):
+            return None
+
+        entries = []
+        for line in lines[1:]:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue  # Incomplete record (e.g. killed while appending)
+
+        checkpoint = Checkpoint(path, header['job_id'], header['groups'], entries, header.get('fallback'))
+        checkpoint._file = open(filepath, 'w', encoding='utf-8')
+        for obj in [header] + entries:
+            checkpoint._append(obj)
+        return checkpoint
+
+    def finish(self):
+        """
+        Close and remove checkpoint of completed job.
+        """
+        with self._lock:
+            self._file.close()
+        if (exists(Checkpoint._filepath(self.path))):
+            remove(Checkpoint._filepath(self.path))
+
+    def record(self, website, alias, response, row):
+        """
+        Append loaded record to checkpoint.
+
+        Parameters
+        ----------
+            website : str. Website's name of record.
+            alias   : str. Manga's alias of record.
+            response: int. Request status code of record (None if record is carried forward from previous job).
+            row     : list. Output row values in output columns order.
+        """
+        entry = {'website': website, 'alias': alias, 'response': response, 'row': row}
+        with self._lock:
+            self.entries.append(entry)
+            self._append(entry)
+
+    def crawled(self):
+        """
+        Get targets fetched in this job, including before job was interrupted.
+
+        Returns
+        -------
+            keys    : set. (website, alias) of fetched targets.
+        """
+        return {(entry['website'], entry['alias']) for entry in self.entries if (entry['response'] is not None)}
+
+    def failed(self):
+        """
+        Get previous output rows of planned targets which have no record (e.g. failed to be fetched or parsed).
+
+        Returns
+        -------
+            rows    : list. Previous output rows in output columns order.
+        """
+        keys = {(group['website'], alias) for group in self.remaining() for (alias, _) in group['targets']}
+        return [row for row in self.fallback if ((row[0], row[1]) in keys)]
+
+    def remaining(self):
+        """
+        Get planned targets which have no record yet.
+
+        Returns
+        -------
+            groups  : list. Groups (website) with remaining targets only.
+        """
+        done = {(entry['website'], entry['alias']) for entry in self.entries}
+        return [
+            {**group, 'targets': [[alias, url] for (alias, url) in group['targets'] if ((group['website'], alias) not in done)]}
+            for group in self.groups
+        ]
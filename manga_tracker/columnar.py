@@ -0,0 +1,325 @@
+from array import array
+from contextlib import ExitStack
+from datetime import datetime
+from os import makedirs, replace
+from os.path import exists, getsize, join
+from threading import Lock
+import json
+import mmap
+
+class ColumnarStore:
+    """
+    [Class] Columnar result store. Each column is kept in its own file and memory-mapped on read, so a view only
+    scans the columns it needs. Website and alias are dictionary-encoded ids, update time is epoch seconds,
+    ongoing flag is a bit, and text columns are offsets and UTF-8 data files. Rows of every job are appended,
+    so history of all jobs is preserved. Meta file (meta.json) is the commit point: it holds committed size of
+    every file, and data written after it (by an interrupted flush) is truncated when store is opened.
+    """
+    BATCH_SIZE = 1000
+    DIRNAME = 'outputs.col'
+    PATTERN = '%d-%m-%Y %H:%M'
+    FIELDS = ('website', 'alias', 'title', 'ongoing', 'updated_at', 'latest_chapter', 'latest_chapter_link')
+    DICTIONARY = {'website': 'H', 'alias': 'I'}
+    TEXT = ('title', 'latest_chapter', 'latest_chapter_link')
+    FILES = tuple(
+        [f'{field}.col' for field in DICTIONARY] + [f'{field}.dict.jsonl' for field in DICTIONARY]
+        + ['updated_at.col', 'ongoing.col'] + [f'{field}.{ext}' for field in TEXT for ext in ('dat', 'off')]
+    )
+    NULL_DATE = -2 ** 63
+    _stores = {}
+    _stores_lock = Lock()
+
+    def __init__(self, path):
+        """
+        Parameters
+        ----------
+            path    : str. Pathname for result directory.
+        """
+        self.dir = join(path, ColumnarStore.DIRNAME)
+        makedirs(self.dir, exist_ok=True)
+        self._lock = Lock()
+        self._batch = []
+        self._recover()
+
+    # Private Method
+    def _file(self, name):
+        return join(self.dir, name)
+
+    def _size(self, name):
+        path = self._file(name)
+        return getsize(path) if (exists(path)) else 0
+
+    def _recover(self):
+        """
+        Read committed meta, truncate every file to its committed size and load dictionaries.
+        """
+        path = self._file('meta.json')
+        self.meta = {'rows': 0, 'jobs': [], 'sizes': {}}
+        if (exists(path)):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.meta = json.loads(f.read())
+
+        for name in ColumnarStore.FILES:
+            size = self.meta['sizes'].get(name, 0)
+            if (self._size(name) > size):
+                with open(self._file(name), 'r+b') as f:
+                    f.truncate(size)
+
+        self.values = {}
+        for field in ColumnarStore.DICTIONARY:
+            name = self._file(f'{field}.dict.jsonl')
+            if (exists(name)):
+                with open(name, 'r', encoding='utf-8') as f:
+                    self.values[field] = [json.loads(line) for line in f]
+            else:
+                self.values[field] = []
+        self.ids = { field: {value: i for i, value in enumerate(values)} for field, values in self.values.items() }
+
+    def _commit(self):
+        """
+        Atomically replace meta file with current meta and size of every file.
+        """
+        self.meta['sizes'] = {name: self._size(name) for name in ColumnarStore.FILES}
+        path = self._file('meta.json')
+        with open(f'{path}.tmp', 'w', encoding='utf-8') as f:
+            f.write(json.dumps(self.meta))
+        replace(f'{path}.tmp', path)
+
+    @staticmethod
+    def _timestamp(date_str):
+        try:
+            return int(datetime.strptime(date_str, ColumnarStore.PATTERN).timestamp())
+        except (TypeError, ValueError):
+            return ColumnarStore.NULL_DATE
+
+    def _append_bits(self, name, bits):
+        """
+        Append bits to packed bit column. Caller must hold store's lock.
+
+        Parameters
+        ----------
+            name    : str. Column file name.
+            bits    : list. Bits (0 or 1) to be appended.
+        """
+        rows = self.meta['rows']
+        path = self._file(name)
+        size = rows // 8
+
+        # Continue from partially filled last byte, dropping bits of uncommitted rows
+        packed = bytearray()
+        if (rows % 8):
+            with open(path, 'rb') as f:
+                f.seek(size)
+                packed.append(f.read(1)[0] & ((1 << (rows % 8)) - 1))
+        for i, bit in enumerate(bits, start=rows):
+            if (i % 8 == 0):
+                packed.append(0)
+            if (bit):
+                packed[-1] |= 1 << (i % 8)
+        with open(path, 'r+b' if (exists(path)) else 'wb') as f:
+            f.seek(size)
+            f.write(packed)
+            f.truncate()
+
+    def _flush(self):
+        """
+        Append pending rows to column files and commit them. Caller must hold store's lock. If flush fails
+        partway, uncommitted data is truncated and pending rows are kept for next flush.
+        """
+        if (not self._batch):
+            return
+        try:
+            self._append(self._batch)
+        except BaseException:
+            self._recover()
+            raise
+        self.meta['rows'] += len(self._batch)
+        self._commit()
+        self._batch = []
+
+    def _append(self, rows):
+        """
+        Append rows to the end of every column file (without commit). Caller must hold store's lock.
+
+        Parameters
+        ----------
+            rows    : list. Rows in output columns order.
+        """
+        columns = list(zip(*rows))
+        named = dict(zip(ColumnarStore.FIELDS, columns))
+
+        for field, typecode in ColumnarStore.DICTIONARY.items():
+            ids, index, values, added = array(typecode), self.ids[field], self.values[field], []
+            for value in named[field]:
+                if (value not in index):
+                    index[value] = len(values)
+                    values.append(value)
+                    added.append(value)
+                ids.append(index[value])
+            with open(self._file(f'{field}.col'), 'ab') as f:
+                ids.tofile(f)
+            if (added):
+                with open(self._file(f'{field}.dict.jsonl'), 'a', encoding='utf-8') as f:
+                    f.write(''.join(json.dumps(value) + '\n' for value in added))
+
+        with open(self._file('updated_at.col'), 'ab') as f:
+            array('q', [ColumnarStore._timestamp(value) for value in named['updated_at']]).tofile(f)
+        self._append_bits('ongoing.col', [int(value) for value in named['ongoing']])
+
+        for field in ColumnarStore.TEXT:
+            end = self._size(f'{field}.dat')
+            offsets, data = array('Q'), bytearray()
+            for value in named[field]:
+                data += str(value).encode('utf-8')
+                offsets.append(end + len(data))
+            with open(self._file(f'{field}.dat'), 'ab') as f:
+                f.write(data)
+            with open(self._file(f'{field}.off'), 'ab') as f:
+                offsets.tofile(f)
+
+    def _map(self, name, stack, typecode=None):
+        """
+        Memory-map column file. Mapping is closed when stack is closed.
+
+        Parameters
+        ----------
+            name        : str. Column file name.
+            stack       : ExitStack. Stack which owns the mapping and its views.
+            typecode    : str (default=None). Array typecode to cast mapped bytes into.
+
+        Returns
+        -------
+            column      : memoryview. Mapped column (None if column is empty).
+        """
+        path = self._file(name)
+        if (not exists(path)) or (getsize(path) == 0):
+            return None
+        with open(path, 'rb') as f:
+            mapped = stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        view = stack.enter_context(memoryview(mapped))
+        return stack.enter_context(view.cast(typecode)) if (typecode) else view
+
+    # Public Method
+    @staticmethod
+    def open(path):
+        """
+        Get store of result directory. Store is opened once per process and shared between threads.
+
+        Parameters
+        ----------
+            path    : str. Pathname for result directory.
+
+        Returns
+        -------
+            store   : ColumnarStore. Result store.
+        """
+        with ColumnarStore._stores_lock:
+            if (path not in ColumnarStore._stores):
+                ColumnarStore._stores[path] = ColumnarStore(path)
+            return ColumnarStore._stores[path]
+
+    def start_job(self):
+        """
+        Register new job. Following inserted rows belong to this job.
+        """
+        with self._lock:
+            self._flush()
+            self.meta['jobs'].append(self.meta['rows'])
+            self._commit()
+
+    def insert(self, row):
+        """
+        Add row to latest job. Rows are appended to column files in batches.
+
+        Parameters
+        ----------
+            row     : list. Row values in output columns order.
+        """
+        with self._lock:
+            self._batch.append(tuple(row))
+            if (len(self._batch) >= ColumnarStore.BATCH_SIZE):
+                self._flush()
+
+    def flush(self):
+        """
+        Append pending rows to column files.
+        """
+        with self._lock:
+            self._flush()
+
+    def iter_records(self, website=None, ongoing=None, fields=None):
+        """
+        Iterate rows of latest job lazily. Only columns of requested fields (and filters) are mapped and scanned.
+
+        Parameters
+        ----------
+            website : str (default=None). Only get rows of this website.
+            ongoing : int (default=None). Only get ongoing (1) or completed (0) rows.
+            fields  : list (default=None). Fields to be read. Other fields are returned as empty string.
+
+        Yields
+        ------
+            row     : list. Row in output columns order (as string values).
+        """
+        self.flush()
+        fields = set(fields or ColumnarStore.FIELDS)
+        start = self.meta['jobs'][-1] if (self.meta['jobs']) else self.meta['rows']
+        end = self.meta['rows']
+        if (start == end):
+            return
+
+        website_id = None
+        if (website is not None):
+            website_id = self.ids['website'].get(website)
+            if (website_id is None):
+                return
+
+        # Map needed columns only, mappings are closed once iteration ends
+        with ExitStack() as stack:
+            cols = {}
+            for field, typecode in ColumnarStore.DICTIONARY.items():
+                if (field in fields) or (field == 'website' and website_id is not None):
+                    cols[field] = self._map(f'{field}.col', stack, typecode)
+            if ('updated_at' in fields):
+                cols['updated_at'] = self._map('updated_at.col', stack, 'q')
+            if ('ongoing' in fields) or (ongoing is not None):
+                cols['ongoing'] = self._map('ongoing.col', stack)
+            for field in ColumnarStore.TEXT:
+                if (field in fields):
+                    cols[field] = (self._map(f'{field}.off', stack, 'Q'), self._map(f'{field}.dat', stack))
+
+            def _text(field, i):
+                offsets, data = cols[field]
+                begin = offsets[i - 1] if (i) else 0
+                return bytes(data[begin:offsets[i]]).decode('utf-8') if (data is not None) else ''
+
+            def _date(i):
+                ts = cols['updated_at'][i]
+                return '' if (ts == ColumnarStore.NULL_DATE) else datetime.fromtimestamp(ts).strftime(ColumnarStore.PATTERN)
+
+            _read = {
+                'website': lambda i: self.values['website'][cols['website'][i]],
+                'alias': lambda i: self.values['alias'][cols['alias'][i]],
+                'title': lambda i: _text('title', i),
+                'ongoing': lambda i: str((cols['ongoing'][i >> 3] >> (i & 7)) & 1),
+                'updated_at': _date,
+                'latest_chapter': lambda i: _text('latest_chapter', i),
+                'latest_chapter_link': lambda i: _text('latest_chapter_link', i),
+            }
+            readers = [ _read[field] if (field in fields) else None for field in ColumnarStore.FIELDS ]
+            for i in range(start, end):
+                if (website_id is not None) and (cols['website'][i] != website_id):
+                    continue
+                if (ongoing is not None) and (((cols['ongoing'][i >> 3] >> (i & 7)) & 1) != int(ongoing)):
+                    continue
+                yield [ reader(i) if (reader) else '' for reader in readers ]
+
+    def records(self, **kw):
+        """
+        Get rows of latest job.
+
+        Returns
+        -------
+            rows    : list. Rows in output columns order (as string values).
+        """
+        return list(self.iter_records(**kw))
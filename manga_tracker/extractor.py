@@ -0,0 +1,336 @@
+from abc import ABC, abstractmethod
+from html.parser import HTMLParser
+import hashlib
+import json
+import re
+
+class _Node:
+    """
+    [Class] Minimal element tree node built by streaming extractor.
+    """
+    __slots__ = ('tag', 'attrs', 'children')
+
+    def __init__(self, tag, attrs):
+        self.tag = tag
+        self.attrs = attrs
+        self.children = []
+
+    def __getitem__(self, key):
+        return self.attrs[key]
+
+    def find(self, tag):
+        """
+        Get first descendant element with tag name (depth-first), None if not found.
+        """
+        for child in self.children:
+            if (isinstance(child, _Node)):
+                if (child.tag == tag):
+                    return child
+                found = child.find(tag)
+                if (found is not None):
+                    return found
+        return None
+
+    def find_all(self, tag):
+        """
+        Get all descendant elements with tag name in document order.
+        """
+        result = []
+        for child in self.children:
+            if (isinstance(child, _Node)):
+                if (child.tag == tag):
+                    result.append(child)
+                result.extend(child.find_all(tag))
+        return result
+
+    @property
+    def text(self):
+        return ''.join([child if (isinstance(child, str)) else child.text for child in self.children])
+
+class _StopParsing(Exception):
+    pass
+
+class _PanelParser(HTMLParser):
+    """
+    [Class] HTML tokenizer that only build tree for the first element matching tag and class,
+    and stop tokenizing once that element is closed.
+    """
+    VOID = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr'}
+
+    def __init__(self, tag, cls):
+        super().__init__(convert_charrefs=True)
+        self.target = (tag, cls)
+        self.root = None
+        self.stack = []
+
+    def handle_starttag(self, tag, attrs):
+        if (not self.stack):
+            if (self.root is not None) or (tag != self.target[0]):
+                return
+            attrs = dict(attrs)
+            if (self.target[1] not in (attrs.get('class') or '').split()):
+                return
+            self.root = _Node(tag, attrs)
+            self.stack.append(self.root)
+            return
+        node = _Node(tag, dict(attrs))
+        self.stack[-1].children.append(node)
+        if (tag not in _PanelParser.VOID):
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        if (self.stack):
+            self.stack[-1].children.append(_Node(tag, dict(attrs)))
+
+    def handle_endtag(self, tag):
+        if (not self.stack) or (tag not in [node.tag for node in self.stack]):
+            return
+        while (self.stack.pop().tag != tag):
+            pass
+        if (not self.stack):
+            raise _StopParsing()
+
+    def handle_data(self, data):
+        if (self.stack):
+            self.stack[-1].children.append(data)
+
+class Extractor(ABC):
+    """
+    [Class] Base of page extractor. Extractor turns page content into raw (not preprocessed) manga information,
+    using website's panel and field selectors that are compiled once on creation.
+
+    Selector is a space separated path of descendant steps relative to panel, where "tag" is first descendant
+    with tag name and "tag[i]" is i-th descendant with tag name. Selector ends with "@attr" to get attribute
+    instead of text, e.g. "div p[3] span[1] a@href".
+
+    Extractor version is derived from `REVISION`, panel and selectors. Bump `REVISION` whenever extraction or
+    preprocessing changes the data of unchanged layout, so cached data of older extractor is not reused.
+    """
+    name = None
+    REVISION = 1
+    STEP = re.compile(r'^([\w-]+)(?:\[(\d+)\])?$')
+    CHARSET = re.compile(r'charset=["\']?([\w.:-]+)', re.I)
+    META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.I)
+
+    def __init__(self, panel, selectors):
+        """
+        Parameters
+        ----------
+            panel       : tuple. Tag name and class of information panel element.
+            selectors   : dict. Selector of each extracted field.
+        """
+        self.panel_spec = tuple(panel)
+        self.selectors = { field: Extractor._compile(selector) for field, selector in selectors.items() }
+        layout = json.dumps([Extractor.REVISION, list(panel), selectors], sort_keys=True)
+        self.version = hashlib.sha1(layout.encode('utf-8')).hexdigest()[:12]
+
+    @staticmethod
+    def _compile(selector):
+        """
+        Compile selector into list of steps.
+
+        Parameters
+        ----------
+            selector    : str. Field selector.
+
+        Returns
+        -------
+            steps       : tuple. Tuple of (tag, index) steps. Index is None for first descendant.
+            attr        : str. Attribute name (None for text).
+        """
+        path, _, attr = selector.partition('@')
+        steps = []
+        for step in path.split():
+            match = Extractor.STEP.match(step)
+            if (match is None):
+                raise ValueError(f"Invalid selector step '{step}' in '{selector}'")
+            tag, idx = match.groups()
+            steps.append((tag, None if (idx is None) else int(idx)))
+        return tuple(steps), (attr or None)
+
+    @staticmethod
+    def _select(node, steps, attr):
+        """
+        Get value of compiled selector from element.
+
+        Parameters
+        ----------
+            node    : object. Element to start selecting from.
+            steps   : tuple. Compiled selector steps.
+            attr    : str. Attribute name (None for text).
+
+        Returns
+        -------
+            value   : str. Selected text or attribute value.
+        """
+        for tag, idx in steps:
+            node = node.find(tag) if (idx is None) else node.find_all(tag)[idx]
+        return node[attr] if (attr) else node.text
+
+    @staticmethod
+    def charset(content_type):
+        """
+        Get charset declared in Content-Type header.
+
+        Parameters
+        ----------
+            content_type    : str. Content-Type header value (None if missing).
+
+        Returns
+        -------
+            encoding        : str. Declared charset (None if not declared).
+        """
+        match = Extractor.CHARSET.search(content_type or '')
+        return match.group(1) if (match) else None
+
+    @staticmethod
+    def _decode(content, encoding=None):
+        """
+        Decode page content with charset of response, then charset declared in page (meta tag), then UTF-8.
+        Windows-1252 is used if none of them can decode the page.
+
+        Parameters
+        ----------
+            content     : bytes. Page content.
+            encoding    : str (default=None). Charset of response.
+
+        Returns
+        -------
+            text        : str. Decoded page.
+        """
+        if (isinstance(content, str)):
+            return content
+        declared = Extractor.META_CHARSET.search(content[:4096])
+        for candidate in (encoding, declared.group(1).decode('ascii') if (declared) else None, 'utf-8'):
+            if (candidate):
+                try:
+                    return content.decode(candidate)
+                except (LookupError, UnicodeDecodeError):
+                    continue
+        return content.decode('windows-1252', errors='replace')
+
+    @abstractmethod
+    def panel(self, content, encoding=None):
+        """
+        Get information panel from page.
+
+        Parameters
+        ----------
+            content     : bytes. Page content.
+            encoding    : str (default=None). Charset of response (detected from page if not given).
+
+        Returns
+        -------
+            panel       : object. Information panel element (None if not found).
+        """
+
+    def extract(self, content, encoding=None):
+        """
+        Extract manga information from page.
+
+        Parameters
+        ----------
+            content     : bytes. Page content.
+            encoding    : str (default=None). Charset of response (detected from page if not given).
+
+        Returns
+        -------
+            extracted   : dict. Raw extracted manga information.
+        """
+        info_panel = self.panel(content, encoding)
+        if (info_panel is None):
+            raise AttributeError(f"Information panel {self.panel_spec} was not found")
+        extracted = {
+            field: Extractor._select(info_panel, steps, attr) for field, (steps, attr) in self.selectors.items()
+        }
+        return extracted
+
+class SoupExtractor(Extractor):
+    """
+    [Class] Extractor that parse full page tree with BeautifulSoup.
+    """
+    name = 'soup'
+
+    def panel(self, content, encoding=None):
+        from bs4 import BeautifulSoup
+        page = BeautifulSoup(content, 'html.parser', from_encoding=encoding if (isinstance(content, bytes)) else None)
+        return page.find(self.panel_spec[0], class_=self.panel_spec[1])
+
+class StreamExtractor(Extractor):
+    """
+    [Class] Extractor that tokenize page only until information panel is closed, building tree for the panel only.
+    Whole document is tokenized from the start, so panel-like text in scripts and styles is not mistaken for panel.
+    """
+    name = 'stream'
+
+    def panel(self, content, encoding=None):
+        parser = _PanelParser(*self.panel_spec)
+        try:
+            parser.feed(Extractor._decode(content, encoding))
+            parser.close()
+        except _StopParsing:
+            pass
+        return parser.root
+
+class ExtractorRegistry:
+    """
+    [Static Class] Registry of page layout for each bounty website.
+    """
+    BACKENDS = {
+        SoupExtractor.name: SoupExtractor,
+        StreamExtractor.name: StreamExtractor,
+    }
+    DEFAULT = 'MangaBat'
+    LAYOUTS = {
+        'MangaBat': {
+            'panel': ('div', 'story-info-right'),
+            'selectors': {
+                'title': 'h1',
+                'ongoing': 'table tbody tr[2] td[1]',
+                'updated_at': 'div p[0] span[1]',
+                'latest_chapter': 'div p[3] span[1] a',
+                'latest_chapter_link': 'div p[3] span[1] a@href',
+            },
+        },
+    }
+
+    @staticmethod
+    def get(website, backend='stream', layout=None):
+        """
+        Create extractor for website from given layout, or from website's registered layout.
+
+        Parameters
+        ----------
+            website     : str. Website name as written in bounty groups.
+            backend     : str (default='stream'). Name of extractor backend.
+            layout      : dict (default=None). Page layout with "panel" ([tag, class]) and "selectors" (field: selector).
+
+        Returns
+        -------
+            extractor   : Extractor. Extractor with compiled selectors.
+        """
+        layout = layout or ExtractorRegistry.LAYOUTS.get(website)
+        if (layout is None):
+            raise ValueError(f"Website '{website}' has no registered page layout, add \"layout\" to its bounty group")
+        if ('panel' not in layout) or ('selectors' not in layout):
+            raise ValueError(f"Page layout of website '{website}' needs both \"panel\" and \"selectors\"")
+        return ExtractorRegistry.BACKENDS[backend](layout['panel'], layout['selectors'])
+
+    @staticmethod
+    def build(groups, backend='stream'):
+        """
+        Create extractor for every website in bounty groups, so selectors are compiled once per run. Group's
+        optional "layout" key overrides registered layout of its website.
+
+        Parameters
+        ----------
+            groups      : list. List of groups (website) and its Manga targets information.
+            backend     : str (default='stream'). Name of extractor backend.
+
+        Returns
+        -------
+            extractors  : dict. Extractor for each website.
+        """
+        return {
+            group['website']: ExtractorRegistry.get(group['website'], backend, group.get('layout')) for group in groups
+        }
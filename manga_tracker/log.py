@@ -1,9 +1,20 @@
 from datetime import datetime
+from os.path import exists
+from threading import Lock
+import json
+
+from .writer import JobWriter
 
 class LogHandler:
     """
-    [Static Class] Handler to create and show job logs.
+    [Static Class] Handler to create and show job logs. Besides text log, every log line is written as structured
+    event (event type, job id, fields and text message) to JSON-lines log (logs.jsonl) which first line is
+    fixed-size job summary record, updated on job end.
     """
+    SUMMARY_SIZE = 4096
+    HEADER_EVENTS = ('job_start', 'job_start_time', 'bounty', 'output_init', 'job_end')
+    _summaries = {}
+    _summaries_lock = Lock()
 
     @staticmethod
     def _dtlog(message):
@@ -23,9 +34,64 @@ class LogHandler:
         return message
 
     @staticmethod
-    def logging(path, message, silent, mode='a'):
+    def _summary_line(summary):
+        """
+        Format job summary as fixed-size JSON line (padded with spaces), so it can be rewritten in place.
+
+        Parameters
+        ----------
+            summary : dict. Job summary.
+
+        Returns
+        -------
+            line    : str. Summary line (with line break).
+        """
+        line = json.dumps(summary)
+        return line.ljust(LogHandler.SUMMARY_SIZE - 1) + '\n'
+
+    @staticmethod
+    def _count(path, key):
+        """
+        Increase counter of running job's summary.
+
+        Parameters
+        ----------
+            path    : str. Pathname for log file directory (result directory).
+            key     : str. Counter name.
+        """
+        with LogHandler._summaries_lock:
+            summary = LogHandler._summaries.get(path)
+            if (summary is not None):
+                summary[key] += 1
+
+    @staticmethod
+    def _write_summary(path, summary):
+        """
+        Write job summary as first line of JSON-lines log.
+
+        Parameters
+        ----------
+            path    : str. Pathname for log file directory (result directory).
+            summary : dict. Job summary.
+        """
+        writer = JobWriter.get(path)
+        if (writer):
+            writer.flush()
+        line = LogHandler._summary_line(summary).encode('utf-8')
+        with open(f'{path}/logs.jsonl', 'r+b') as f:
+            if (len(line) == LogHandler.SUMMARY_SIZE):
+                f.write(line)
+                return
+            # Summary outgrows fixed size, rewrite whole log
+            content = f.read().split(b'\n', 1)[1]
+            f.seek(0)
+            f.write(line + content)
+            f.truncate()
+
+    @staticmethod
+    def logging(path, message, silent, mode='a', event='message', **fields):
         """
-        Create initiation activity or process log.
+        Create initiation activity or process log. Log is buffered by job's writer while a job is running.
 
         Paramaters
         ----------
@@ -33,15 +99,29 @@ class LogHandler:
             message : str. Message for successfull activity or process attempt.
             silent  : boolean (default=False). Flag to silence progress messages.
             mode    : str (default='a'). File opening mode.
+            event   : str (default='message'). Event type of structured log record.
+            fields  : dict. Event fields of structured log record (e.g. website, alias, status or stage).
         """
-        log_path = f'{path}/logs.txt'
-        with open(log_path, mode) as f:
-            f.write(LogHandler._dtlog(message) + '\n')
+        line = LogHandler._dtlog(message)
+        with LogHandler._summaries_lock:
+            summary = LogHandler._summaries.get(path)
+        record = {'time': line[1:20], 'event': event, 'job_id': summary and summary['job_id'], **fields, 'message': message}
+        event = json.dumps(record) + '\n'
+        writer = JobWriter.get(path)
+        if (writer):
+            writer.write('logs', line + '\n', truncate=(mode == 'w'))
+            writer.write('events', event)
+        else:
+            log_path = f'{path}/logs.txt'
+            with open(log_path, mode) as f:
+                f.write(line + '\n')
+            with open(f'{path}/logs.jsonl', 'a', encoding='utf-8') as f:
+                f.write(event)
         if (not silent):
-            print(LogHandler._dtlog(message))
+            print(line)
 
     @staticmethod
-    def log_start(path, silent):
+    def log_start(path, silent, job_id=None):
         """
         Create start of job log.
 
@@ -49,18 +129,81 @@ class LogHandler:
         ----------
             path    : str. Pathname for log file directory (result directory).
             silent  : boolean. Flag to silence progress messages.
+            job_id  : str (default=None). Id of resumed job. New job id is created if not given.
+
+        Returns
+        -------
+            job_id  : str. Id of started job.
         """
         # Init Job Id
         dt_start_time = datetime.now()
-        job_id = dt_start_time.strftime("%Y%m%d%H%M")
-        LogHandler.logging(path, f'[Job] Starting Job. Job Id: {job_id}', silent, mode='w')
+        resumed = job_id is not None
+        job_id = job_id or dt_start_time.strftime("%Y%m%d%H%M")
+        start_time = dt_start_time.strftime('%d/%m/%Y %H:%M:%S')
+
+        # Init Job Summary
+        summary = {
+            'job_id': job_id, 'resumed': resumed, 'start_time': start_time, 'end_time': None,
+            'bounty_path': None, 'result_path': path, 'targets': 0, 'websites': 0, 'due': None,
+            'success': 0, 'cache_hit': 0, 'failed': 0,
+        }
+        with LogHandler._summaries_lock:
+            LogHandler._summaries[path] = summary
+        with open(f'{path}/logs.jsonl', 'w', encoding='utf-8') as f:
+            f.write(LogHandler._summary_line(summary))
+
+        action = 'Resuming' if (resumed) else 'Starting'
+        LogHandler.logging(path, f'[Job] {action} Job. Job Id: {job_id}', silent, mode='w',
+                           event='job_start', resumed=resumed)
+
+        # Empty Failure Ledger
+        open(f'{path}/failures.jsonl', 'w').close()
 
         # Log Start Time
-        start_time = dt_start_time.strftime('%d/%m/%Y %H:%M:%S')
-        LogHandler.logging(path, f'[Job] Start Time: {start_time}', silent)
+        LogHandler.logging(path, f'[Job] Start Time: {start_time}', silent, event='job_start_time', start_time=start_time)
+        return job_id
+
+    @staticmethod
+    def log_bounty(path, bounty_path, t_count, w_count, silent):
+        """
+        Create acquired bounty log.
+
+        Parameters
+        ----------
+            path        : str. Pathname for log file directory (result directory).
+            bounty_path : str. Pathname for bounty file (with extension).
+            t_count     : int. Number of targets in bounty list.
+            w_count     : int. Number of websites (groups) in bounty list.
+            silent      : boolean. Flag to silence progress messages.
+        """
+        with LogHandler._summaries_lock:
+            summary = LogHandler._summaries.get(path)
+            if (summary is not None):
+                summary.update({'bounty_path': bounty_path, 'targets': t_count, 'websites': w_count})
+        LogHandler.logging(path=path, silent=silent, event='bounty', bounty_path=bounty_path, targets=t_count, websites=w_count,
+                    message=f'[Init] Target aquired from bounty file from "{bounty_path}". {t_count} target(s) from {w_count} website(s)')
 
     @staticmethod
-    def log_scrape(path, alias, response, silent):
+    def log_incremental(path, d_count, c_count, silent):
+        """
+        Create incremental crawl plan log.
+
+        Parameters
+        ----------
+            path        : str. Pathname for log file directory (result directory).
+            d_count     : int. Number of due targets to be crawled.
+            c_count     : int. Number of records carried forward from previous output.
+            silent      : boolean. Flag to silence progress messages.
+        """
+        with LogHandler._summaries_lock:
+            summary = LogHandler._summaries.get(path)
+            if (summary is not None):
+                summary['due'] = d_count
+        LogHandler.logging(path=path, silent=silent, event='incremental', due=d_count, carried=c_count,
+                    message=f'[Init] Incremental crawl. {d_count} target(s) due, {c_count} record(s) carried forward')
+
+    @staticmethod
+    def log_scrape(path, alias, response, silent, website=None):
         """
         Create scraping log.
 
@@ -70,20 +213,168 @@ class LogHandler:
             alias   : str. New manga title (or alias) to be inputted.
             response: int. Request status code while trying to get web page.
             silent  : boolean. Flag to silence progress messages.
+            website : str (default=None). Website's name of target.
         """
-        LogHandler.logging(path, f'[Scraping] {alias} - Response: {response}', silent)
+        if (response in (200, 304)):
+            LogHandler._count(path, 'success')
+        if (response == 304):
+            LogHandler._count(path, 'cache_hit')
+        LogHandler.logging(path, f'[Scraping] {alias} - Response: {response}', silent,
+                           event='scrape', website=website, alias=alias, status=response)
+
+    @staticmethod
+    def log_failure(path, website, alias, url, stage, error, silent, status=None):
+        """
+        Create failed target log and record it to failure ledger (one JSON record per line).
+
+        Parameters
+        ----------
+            path    : str. Pathname for log file directory (result directory).
+            website : str. Website's name of target.
+            alias   : str. Manga's alias of target.
+            url     : str. Manga (target) main page URL.
+            stage   : str. Failed stage ('fetch' or 'parse').
+            error   : Exception. Raised error.
+            silent  : boolean. Flag to silence progress messages.
+            status  : int (default=None). Response status code (None if there is no response).
+        """
+        LogHandler._count(path, 'failed')
+        response = f'Status: {status}, ' if (status is not None) else ''
+        LogHandler.logging(path, f'[Failure] {alias} - Stage: {stage}, {response}Error: {type(error).__name__}', silent,
+                           event='failure', website=website, alias=alias, stage=stage, status=status, error=type(error).__name__)
+        record = {
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'website': website,
+            'alias': alias,
+            'url': url,
+            'stage': stage,
+            'status': status,
+            'error': type(error).__name__,
+            'message': str(error),
+        }
+        line = json.dumps(record) + '\n'
+        writer = JobWriter.get(path)
+        if (writer):
+            writer.write('failures', line)
+        else:
+            with open(f'{path}/failures.jsonl', 'a', encoding='utf-8') as f:
+                f.write(line)
+
+    @staticmethod
+    def log_rate(path, host, effective, current, silent):
+        """
+        Create host request rate log.
+
+        Parameters
+        ----------
+            path        : str. Pathname for log file directory (result directory).
+            host        : str. Host of crawled targets.
+            effective   : float. Average request rate (request per second) during job.
+            current     : float. Latest adapted request rate (request per second).
+            silent      : boolean. Flag to silence progress messages.
+        """
+        LogHandler.logging(path, f'[RateLimit] {host} - Effective Rate: {effective:.3f} req/s, Current Rate: {current:.3f} req/s', silent,
+                           event='rate', host=host, effective_rate=effective, rate=current)
+
+    @staticmethod
+    def log_cache(path, hits, lookups, silent):
+        """
+        Create HTTP validator cache hit rate log.
+
+        Parameters
+        ----------
+            path    : str. Pathname for log file directory (result directory).
+            hits    : int. Number of not modified (cached) responses.
+            lookups : int. Number of cache lookups.
+            silent  : boolean. Flag to silence progress messages.
+        """
+        rate = (hits / lookups) * 100 if (lookups) else 0
+        LogHandler.logging(path, f'[Cache] Hit: {hits}/{lookups} ({rate:.0f}%)', silent,
+                           event='cache', hits=hits, lookups=lookups)
 
     @staticmethod
     def log_end(path, silent):
         """
-        Create end of job log.
+        Create end of job log and write job summary.
 
         Parameters
         ----------
             path    : str. Relative pathname for log file directory (result directory).
         """
         end_time = datetime.now().strftime('%d/%m/%Y %H:%M:%S')
-        LogHandler.logging(path, f'[Job] End Time: {end_time}', silent)
+        LogHandler.logging(path, f'[Job] End Time: {end_time}', silent, event='job_end', end_time=end_time)
+
+        with LogHandler._summaries_lock:
+            summary = LogHandler._summaries.pop(path, None)
+        if (summary is not None):
+            summary['end_time'] = end_time
+            LogHandler._write_summary(path, summary)
+
+    @staticmethod
+    def merge_logs(path, shard_paths, silent):
+        """
+        Merge job logs and failure ledgers of shards into one job log. Counters of job summary are summed and
+        job is timed from earliest shard start to latest shard end. Header and end events of each shard are
+        replaced by merged ones, and text log is rebuilt from events.
+
+        Parameters
+        ----------
+            path        : str. Pathname for merged log file directory (result directory).
+            shard_paths : list. Pathnames for log file directory of each shard.
+            silent      : boolean. Flag to silence progress messages.
+        """
+        summaries, events, failures = [], [], []
+        for shard_path in shard_paths:
+            with open(f'{shard_path}/logs.jsonl', 'r', encoding='utf-8') as f:
+                summaries.append(json.loads(f.readline()))
+                for line in f:
+                    record = json.loads(line)
+                    if (record.get('event') not in LogHandler.HEADER_EVENTS):
+                        events.append(record)
+            if (exists(f'{shard_path}/failures.jsonl')):
+                with open(f'{shard_path}/failures.jsonl', 'r', encoding='utf-8') as f:
+                    failures.append(f.read())
+
+        # Merge Job Summary
+        pattern = '%d/%m/%Y %H:%M:%S'
+        ended = [s['end_time'] for s in summaries if (s['end_time'])]
+        summary = {
+            'job_id': summaries[0]['job_id'], 'resumed': False,
+            'start_time': min((s['start_time'] for s in summaries), key=lambda t: datetime.strptime(t, pattern)),
+            'end_time': max(ended, key=lambda t: datetime.strptime(t, pattern)) if (len(ended) == len(summaries)) else None,
+            'bounty_path': summaries[0]['bounty_path'], 'result_path': path,
+            'targets': sum(s['targets'] for s in summaries),
+            'websites': max(s['websites'] for s in summaries),
+        }
+        for key in ('success', 'cache_hit', 'failed'):
+            summary[key] = sum(s[key] for s in summaries)
+
+        # Write Merged Logs
+        header = [
+            ('job_start', f'[Job] Merging Job. Job Id: {summary["job_id"]}', {'resumed': False}),
+            ('job_start_time', f'[Job] Start Time: {summary["start_time"]}', {'start_time': summary['start_time']}),
+            ('bounty', f'[Init] Target aquired from bounty file from "{summary["bounty_path"]}". '
+                       f'{summary["targets"]} target(s) from {summary["websites"]} website(s)',
+             {'bounty_path': summary['bounty_path'], 'targets': summary['targets'], 'websites': summary['websites']}),
+            ('output_init', f'[Init] Output file successfully created at "{path}"', {}),
+        ]
+        now = datetime.now().strftime('%d/%m/%Y %H:%M:%S')
+        header = [{'time': now, 'event': event, 'job_id': summary['job_id'], **fields, 'message': message}
+                  for event, message, fields in header]
+        with open(f'{path}/logs.txt', 'w') as f:
+            for record in header + events:
+                f.write(f"[{record['time']}] {record['message']}\n")
+        with open(f'{path}/logs.jsonl', 'w', encoding='utf-8') as f:
+            f.write(LogHandler._summary_line(summary))
+            f.writelines(json.dumps(record) + '\n' for record in header + events)
+        with open(f'{path}/failures.jsonl', 'w', encoding='utf-8') as f:
+            f.writelines(failures)
+
+        LogHandler.logging(path, f'[Job] Merged {len(shard_paths)} shard(s) into "{path}". '
+                           f'{summary["targets"]} target(s) from {summary["websites"]} website(s)', silent,
+                           event='merge', job_id=summary['job_id'], shards=len(shard_paths))
+        LogHandler.logging(path, f'[Job] End Time: {summary["end_time"]}', True,
+                           event='job_end', job_id=summary['job_id'], end_time=summary['end_time'])
 
     @staticmethod
     def show_log(path):
@@ -106,7 +397,41 @@ class LogHandler:
     @staticmethod
     def extract_meta(path):
         """
-        Extracting meta information about latest job from log file.
+        Extracting meta information about latest job from job summary (first line of JSON-lines log). Text log
+        is parsed instead if job has no JSON-lines log or job hasn't ended (e.g. interrupted).
+
+        Parameters
+        ----------
+            path    : str. Relative pathname for log file directory (result directory).
+
+        Returns
+        -------
+            meta    : dict. Meta information in dictionary format.
+        """
+        if (not exists(f'{path}/logs.jsonl')):
+            return LogHandler._extract_meta_text(path)
+        with open(f'{path}/logs.jsonl', 'r', encoding='utf-8') as f:
+            summary = json.loads(f.readline())
+        if (summary['end_time'] is None):
+            return LogHandler._extract_meta_text(path)
+        meta = {
+            'job_id': summary['job_id'],
+            'start_time': summary['start_time'],
+            'end_time': summary['end_time'],
+            'bounty_path': summary['bounty_path'],
+            'result_path': summary['result_path'],
+            'counter': f"{summary['targets']} target(s) from {summary['websites']} website(s)",
+            'due': summary.get('due'),
+            'success': summary['success'],
+            'cache_hit': summary['cache_hit'],
+            'failed': summary['failed']
+        }
+        return meta
+
+    @staticmethod
+    def _extract_meta_text(path):
+        """
+        Extracting meta information about latest job from text log file.
 
         Parameters
         ----------
@@ -124,6 +449,9 @@ class LogHandler:
             'bounty_path': logs[2].split('"')[1],
             'result_path': logs[3].split('"')[1],
             'counter': logs[2].split('.')[-1].strip(),
-            'success': sum([1 if (row[-3:] == '200') else 0 for row in logs])
+            'due': next((int(row.split('. ')[1].split()[0]) for row in logs if ('] [Init] Incremental crawl. ' in row)), None),
+            'success': sum([1 if (row[-3:] in ('200', '304')) else 0 for row in logs]),
+            'cache_hit': sum([1 if (row[-3:] == '304') else 0 for row in logs]),
+            'failed': sum([1 if ('] [Failure] ' in row) else 0 for row in logs])
         }
         return meta
@@ -0,0 +1,136 @@
+from os.path import exists, join
+from threading import Lock
+from urllib.parse import urlparse
+import bisect
+import json
+import math
+
+class Metrics:
+    """
+    [Class] Job metrics collector. Stage latencies (fetch, parse, preprocess, load) and downloaded bytes are
+    recorded per target, and aggregated into per-host latency histograms when job's metrics file is written.
+    """
+    FILENAME = 'metrics.json'
+    STAGES = ('fetch', 'parse', 'preprocess', 'load')
+    BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, path, job_id):
+        """
+        Parameters
+        ----------
+            path    : str. Pathname for result directory.
+            job_id  : str. Id of measured job.
+        """
+        self.path = path
+        self.job_id = job_id
+        self.targets = []
+        self._lock = Lock()
+
+    # Private Method
+    @staticmethod
+    def _percentile(samples, p):
+        """
+        Get nearest-rank percentile of sorted samples.
+        """
+        return samples[max(math.ceil(p / 100 * len(samples)) - 1, 0)]
+
+    def _histograms(self):
+        """
+        Aggregate targets' latencies (in milliseconds) into histogram per host and stage.
+
+        Returns
+        -------
+            hosts   : dict. Number of requests, downloaded bytes and histogram of each stage per host.
+                      Histogram count i is number of samples below BUCKETS[i] (last count is for the rest).
+        """
+        hosts = {}
+        for target in self.targets:
+            host = hosts.setdefault(target['host'], {
+                'requests': 0, 'bytes': 0, 'histogram': {stage: [0] * (len(Metrics.BUCKETS) + 1) for stage in Metrics.STAGES}
+            })
+            host['requests'] += 1
+            host['bytes'] += target['bytes']
+            for stage in Metrics.STAGES:
+                if (target.get(stage) is not None):
+                    host['histogram'][stage][bisect.bisect_right(Metrics.BUCKETS, target[stage])] += 1
+        return hosts
+
+    # Public Method
+    def save(self):
+        """
+        Write metrics of job to metrics file in result directory.
+        """
+        with self._lock:
+            content = {
+                'job_id': self.job_id,
+                'buckets': Metrics.BUCKETS,
+                'targets': self.targets,
+                'hosts': self._histograms(),
+            }
+        with open(join(self.path, Metrics.FILENAME), 'w', encoding='utf-8') as f:
+            f.write(json.dumps(content))
+
+    def record(self, website, alias, url, response, timings):
+        """
+        Record stage timings of target.
+
+        Parameters
+        ----------
+            website : str. Website's name of target.
+            alias   : str. Manga's alias of target.
+            url     : str. Manga (target) main page URL.
+            response: int. Request status code of target.
+            timings : dict. Stage durations in seconds and downloaded 'bytes'. Stage is skipped if not measured
+                      (e.g. parse on cached response).
+        """
+        target = {'website': website, 'alias': alias, 'host': urlparse(url).netloc, 'response': response,
+                  'bytes': timings.get('bytes', 0)}
+        for stage in Metrics.STAGES:
+            if (stage in timings):
+                target[stage] = round(timings[stage] * 1000, 3)
+        with self._lock:
+            self.targets.append(target)
+
+    @staticmethod
+    def summary(path):
+        """
+        Get latency percentiles of latest job per stage and website, and traffic per host.
+
+        Parameters
+        ----------
+            path    : str. Pathname for result directory.
+
+        Returns
+        -------
+            job_id  : str. Id of measured job (None if there is no metrics file).
+            stages  : list. [stage, website, count, p50, p95, p99] rows, latencies in milliseconds.
+            hosts   : list. [host, requests, bytes, p50, p95, p99] rows of fetch latencies in milliseconds.
+        """
+        filepath = join(path, Metrics.FILENAME)
+        if (not exists(filepath)):
+            return None, [], []
+        with open(filepath, 'r', encoding='utf-8') as f:
+            content = json.loads(f.read())
+
+        samples = {}
+        for target in content['targets']:
+            for stage in Metrics.STAGES:
+                if (target.get(stage) is not None):
+                    samples.setdefault((stage, target['website']), []).append(target[stage])
+                    samples.setdefault((stage, '(all)'), []).append(target[stage])
+                    if (stage == 'fetch'):
+                        samples.setdefault(('host', target['host']), []).append(target[stage])
+
+        stages = []
+        for stage in Metrics.STAGES:
+            keys = sorted(key for key in samples if (key[0] == stage))
+            for key in keys:
+                values = sorted(samples[key])
+                stages.append([stage, key[1], len(values)] + [Metrics._percentile(values, p) for p in Metrics.PERCENTILES])
+
+        hosts = []
+        for host, info in sorted(content['hosts'].items()):
+            values = sorted(samples.get(('host', host), [])) or [0]
+            hosts.append([host, info['requests'], info['bytes']] + [Metrics._percentile(values, p) for p in Metrics.PERCENTILES])
+        return content['job_id'], stages, hosts
@@ -1,72 +1,89 @@
-from datetime import datetime, timedelta
+from datetime import datetime
+from itertools import islice
+from os.path import exists
+import bisect
+import heapq
 import operator
 import re
 
+from .writer import JobWriter
+
 class OutputHandler:
     """
     [Static Method] Handler to create and show job outputs.
     """
+    BACKENDS = ('text', 'sqlite', 'columnar')
+    LABELS = {1: 'Today', 2: 'Last 7 Days', 3: 'Last 30 Days', 4: 'Older'}
+    backend = 'text'
+
     @staticmethod
-    def _date_grouper(today_dt, date_str, pattern='%d-%m-%Y %H:%M'):
+    def _date_groups(date_strs, today_dt, pattern='%d-%m-%Y', days=None):
         """
-        Function to convert date into time category.
+        Convert dates into time categories in one pass. Each distinct day is parsed once into day number and
+        bucketed against precomputed cutoffs.
 
         Parameters
         ------
-            today_dt: date. System current date.
-            date_str: str. Date in string format.
-            pattern : str (default='%d-%m-%Y %H:%M'). String literal to extract date data.
+            date_strs   : list. Dates in output string format (day part comes first).
+            today_dt    : date. System current date.
+            pattern     : str (default='%d-%m-%Y'). String literal to extract day part of date.
+            days        : dict (default=None). Time group of already parsed days, shared between calls.
 
         Returns
         -------
-            group   : int. Time group (1 for 'today', 2 for 'last 7 days', 3 for 'last 30 days', 4 for 'older')
+            groups      : list. Time group of each date (1 for 'today', 2 for 'last 7 days', 3 for 'last 30 days',
+                          4 for 'older')
         """
-        query_dt = datetime.strptime(date_str, pattern).date()
-        if (query_dt == today_dt):
-            return 1
-        elif (query_dt >= today_dt - timedelta(days=7)):
-            return 2
-        elif (query_dt >= today_dt - timedelta(days=30)):
-            return 3
-        else:
-            return 4
+        today = today_dt.toordinal()
+        cutoffs = (today - 30, today - 7, today, today + 1)
+        buckets = (4, 3, 2, 1, 2)
+        width = len(today_dt.strftime(pattern))
+
+        days = {} if (days is None) else days
+        for date_str in date_strs:
+            day_str = date_str[:width]
+            if (day_str not in days):
+                day = datetime.strptime(day_str, pattern).toordinal()
+                days[day_str] = buckets[bisect.bisect_right(cutoffs, day)]
+        return [days[date_str[:width]] for date_str in date_strs]
 
     @staticmethod
-    def _output_viz(data):
+    def _output_viz(rows, limit=None):
         """
         Format data for output visualisation.
 
         Parameters
         ------
-            data    : list. Output data in 2D list format.
+            rows    : iterable. Output rows (without header) in list format.
+            limit   : int (default=None). Only keep first n rows (by website and alias), using heap.
 
         Returns
         -------
-            header  : list. Header in list of string format.
             content : list. Transformed data in list of list format.
         """
         _tr = (
             lambda x: x,                                              # website
             lambda x: x,                                              # alias
             lambda x: ''.join((x[:17], '...')) if len(x) > 20 else x, # title
-            lambda x: 'Ongoing' if (x) else 'Completed',              # ongoing
+            lambda x: 'Ongoing' if (x == '1') else 'Completed',       # ongoing
             lambda x: x,                                              # updated_at
             lambda x: ''.join((x[:17], '...')) if len(x) > 20 else x, # latest_chapter
             lambda x: ''.join((x[:17], '...')) if len(x) > 20 else x, # latest_chapter_link
         )
-        header = data[0]
-        content = [[_tr[i](val) for i, val in enumerate(row)] for row in data[1:]]
-        content.sort(key=operator.itemgetter(0, 1))
-        return header, content
+        content = ([_tr[i](val) for i, val in enumerate(row)] for row in rows)
+        return OutputHandler._top(content, operator.itemgetter(0, 1), limit)
 
     @staticmethod
-    def _result_viz(data):
+    def _result_viz(rows, limit=None, label=True):
         """
         Rearrange and transform output data for result visualization.
 
         Parameters
         ------
-            data    : list. Output data in 2D list format.
+            rows    : iterable. Output rows (without header) in list format.
+            limit   : int (default=None). Only keep first n rows (by update time group, then most recent update
+                      time), using heap.
+            label   : boolean (default=True). Flag to replace time group number with its label.
 
         Returns
         -------
@@ -75,12 +92,11 @@ class OutputHandler:
         """
         # Extract and Rearrange Column
         _er = (4, 4, 1, 0, 5, 6)
-        er_data = [[ row[col_id] for col_id in _er] for row in data]
+        er_data = ([ row[col_id] for col_id in _er] for row in rows)
 
         # Transform
-        today = datetime.now().date()
         _tr = (
-            lambda x: OutputHandler._date_grouper(today, x),          # update_tag
+            lambda x: x,                                              # update_tag
             lambda x: x,                                              # update_at
             lambda x: x,                                              # title
             lambda x: x,                                              # website
@@ -88,24 +104,180 @@ class OutputHandler:
             lambda x: re.sub('http[s]*://', '', x),                   # chapter_link
         )
         header = ['Updated', 'Update Time', 'Title', 'Website', 'Chapter', 'Chapter Link']
-        content = [[_tr[i](val) for i, val in enumerate(row)] for row in er_data[1:]]
-        content.sort(key=operator.itemgetter(0, 1, 2))
+        content = OutputHandler._bucket_dates(([_tr[i](val) for i, val in enumerate(row)] for row in er_data))
+        content = OutputHandler._top(content, OutputHandler._result_key, limit)
 
         # Updated Time Labelling
-        mapper = {
-            1: 'Today',
-            2: 'Last 7 Days',
-            3: 'Last 30 Days',
-            4: 'Older'
-        }
-        for row in content:
-            row[0] = mapper[row[0]]
+        if (label):
+            for row in content:
+                row[0] = OutputHandler.LABELS[row[0]]
         return header, content
 
+    @staticmethod
+    def _timestamp(date_str):
+        """
+        Convert update time in output format ('%d-%m-%Y %H:%M') into sortable number without strptime.
+
+        Parameters
+        ------
+            date_str    : str. Update time in output format.
+
+        Returns
+        -------
+            timestamp   : int. Update time as YYYYmmddHHMM number (0 if date_str is not in output format).
+        """
+        digits = ''.join((date_str[6:10], date_str[3:5], date_str[:2], date_str[11:13], date_str[14:16]))
+        return int(digits) if (len(digits) == 12 and digits.isdigit()) else 0
+
+    @staticmethod
+    def _result_key(row):
+        """
+        Sort key of result row: update time group, then most recent update time first, then title.
+
+        Parameters
+        ------
+            row     : list. Result row with time group and update time as first columns.
+
+        Returns
+        -------
+            key     : tuple. Sort key.
+        """
+        return (row[0], -OutputHandler._timestamp(row[1]), row[2])
+
+    @staticmethod
+    def _bucket_dates(rows, chunk_size=1024):
+        """
+        Replace update time (first column) of rows with its time group, bucketing dates per chunk of rows.
+
+        Parameters
+        ------
+            rows        : iterable. Rows with update time as first column.
+            chunk_size  : int (default=1024). Number of rows bucketed at once.
+
+        Yields
+        ------
+            row         : list. Row with time group as first column.
+        """
+        today, days = datetime.now().date(), {}
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if (not chunk):
+                break
+            groups = OutputHandler._date_groups([row[0] for row in chunk], today, days=days)
+            for row, group in zip(chunk, groups):
+                row[0] = group
+                yield row
+
+    @staticmethod
+    def _top(rows, key, limit=None):
+        """
+        Sort rows, keeping only first n rows in memory if limit is given.
+
+        Parameters
+        ------
+            rows    : iterable. Rows to be sorted.
+            key     : function. Sort key.
+            limit   : int (default=None). Number of rows to keep.
+
+        Returns
+        -------
+            rows    : list. Sorted rows.
+        """
+        if (limit is None):
+            return sorted(rows, key=key)
+        return heapq.nsmallest(limit, rows, key=key)
+
+    @staticmethod
+    def _iter_output(path, delimiter):
+        """
+        Read output file lazily, one row at a time.
+
+        Parameters
+        ----------
+            path        : str. Pathname for output file directory (result directory).
+            delimiter   : str. Delimiter used for separating data.
+
+        Yields
+        ------
+            row         : list. Header, followed by every output row, in list format.
+        """
+        out_path = f'{path}/outputs.txt'
+        with open(out_path, 'r', encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip('\n')
+                if (line):
+                    yield line.split(delimiter)
+
+    @staticmethod
+    def _iter_rows(path, delimiter, website=None, ongoing=None, fields=None):
+        """
+        Read output rows lazily from current backend, with optional filters.
+
+        Parameters
+        ----------
+            path        : str. Pathname for output file directory (result directory).
+            delimiter   : str. Delimiter used for separating data.
+            website     : str (default=None). Only get rows of this website.
+            ongoing     : int (default=None). Only get ongoing (1) or completed (0) rows.
+            fields      : list (default=None). Fields needed by the view. Stores may skip reading other fields.
+
+        Returns
+        -------
+            header      : list. Output columns name.
+            rows        : iterable. Output rows (without header) in list format.
+        """
+        if (OutputHandler.backend != 'text'):
+            store = OutputHandler._store(path)
+            rows = store.iter_records(website=website, ongoing=ongoing, fields=fields)
+            return list(store.FIELDS), rows
+
+        rows = OutputHandler._iter_output(path, delimiter)
+        header = next(rows, [])
+        if (website is not None):
+            rows = (row for row in rows if (row[0] == website))
+        if (ongoing is not None):
+            rows = (row for row in rows if (row[3] == str(int(ongoing))))
+        return header, rows
+
+    @staticmethod
+    def _store(path):
+        """
+        Get result store of current (non text) backend.
+
+        Parameters
+        ----------
+            path        : str. Pathname for output file directory (result directory).
+
+        Returns
+        -------
+            store       : object. SQLiteStore or ColumnarStore of result directory.
+        """
+        if (OutputHandler.backend == 'sqlite'):
+            from .store import SQLiteStore
+            return SQLiteStore.open(path)
+        from .columnar import ColumnarStore
+        return ColumnarStore.open(path)
+
+    @staticmethod
+    def set_backend(backend):
+        """
+        Set output backend used by following output operations.
+
+        Parameters
+        ----------
+            backend     : str. Output backend name ('text' for outputs.txt, 'sqlite' for outputs.db
+                          or 'columnar' for outputs.col).
+        """
+        if (backend not in OutputHandler.BACKENDS):
+            raise ValueError(f"Unknown output backend '{backend}'")
+        OutputHandler.backend = backend
+
     @staticmethod
     def init_output(path, columns, delimiter):
         """
-        Initiate output file by pathname.
+        Initiate output file by pathname. For SQLite and columnar backend, a new job is registered instead of
+        truncating output.
 
         Paramaters
         ----------
@@ -113,6 +285,15 @@ class OutputHandler:
             columns     : list. List of columns name for output table.
             delimiter   : str. Delimiter used for separating data.
         """
+        if (OutputHandler.backend != 'text'):
+            OutputHandler._store(path).start_job()
+            return
+
+        writer = JobWriter.get(path)
+        if (writer):
+            writer.write('outputs', delimiter.join(columns) + '\n', truncate=True)
+            return
+
         out_path = f'{path}/outputs.txt'
         with open(out_path, 'w') as f:
             f.write(delimiter.join(columns) + '\n')
@@ -131,6 +312,10 @@ class OutputHandler:
             columns     : list. List of columns name for output table.
             delimiter   : str. Delimiter used for separating data.
         """
+        if (OutputHandler.backend != 'text'):
+            OutputHandler._store(path).insert([website, alias] + [data[col] for col in columns[2:]])
+            return
+
         # Transform data to row format
         trans_data = ''
         for col in columns[2:]:
@@ -138,48 +323,116 @@ class OutputHandler:
         row = f'{website}|{alias}{trans_data}\n'
 
         # Load to database
+        writer = JobWriter.get(path)
+        if (writer):
+            writer.write('outputs', row)
+            return
+
         out_path = f'{path}/outputs.txt'
         with open(out_path, 'a', encoding="utf-8") as f:
             f.write(row)
 
     @staticmethod
-    def show_output(path, delimiter):
+    def load_row(path, row, delimiter):
         """
-        Show full crawling result in table format.
+        Load already formatted row (e.g. previous job's record) to output file.
 
         Parameters
         ----------
             path        : str. Pathname for output file directory (result directory).
+            row         : list. Row values in columns order.
             delimiter   : str. Delimiter used for separating data.
+        """
+        if (OutputHandler.backend != 'text'):
+            OutputHandler._store(path).insert(row)
+            return
+
+        writer = JobWriter.get(path)
+        if (writer):
+            writer.write('outputs', delimiter.join(row) + '\n')
+            return
+
+        out_path = f'{path}/outputs.txt'
+        with open(out_path, 'a', encoding="utf-8") as f:
+            f.write(delimiter.join(row) + '\n')
+
+    @staticmethod
+    def flush(path):
+        """
+        Write pending (batched or buffered) rows to output.
+
+        Parameters
+        ----------
+            path        : str. Pathname for output file directory (result directory).
+        """
+        if (OutputHandler.backend != 'text'):
+            OutputHandler._store(path).flush()
+        writer = JobWriter.get(path)
+        if (writer):
+            writer.flush()
+
+    @staticmethod
+    def read_records(path, delimiter):
+        """
+        Read records of latest job from output file.
+
+        Parameters
+        ----------
+            path        : str. Pathname for output file directory (result directory).
+            delimiter   : str. Delimiter used for separating data.
+
+        Returns
+        -------
+            records     : dict. Row (in list format) for each (website, alias). Empty if output file doesn't exist.
+        """
+        if (OutputHandler.backend != 'text'):
+            return { (row[0], row[1]): row for row in OutputHandler._store(path).records() }
+
+        if (not exists(f'{path}/outputs.txt')):
+            return {}
+        _, rows = OutputHandler._iter_rows(path, delimiter)
+        records = { (row[0], row[1]): row for row in rows }
+        return records
+
+    @staticmethod
+    def show_output(path, delimiter, limit=None, website=None, ongoing=None):
+        """
+        Show full crawling result in table format. Rows are streamed from output, so only shown rows are kept in memory.
+
+        Parameters
+        ----------
+            path        : str. Pathname for output file directory (result directory).
+            delimiter   : str. Delimiter used for separating data.
+            limit       : int (default=None). Maximum number of shown rows.
+            website     : str (default=None). Only show rows of this website.
+            ongoing     : int (default=None). Only show ongoing (1) or completed (0) rows.
 
         Returns
         -------
             output      : list. Output data in 2D list format.
         """
-        out_path = f'{path}/outputs.txt'
-        with open(out_path, 'r', encoding="utf-8") as f:
-            raw = f.read()[:-1]
-        output = [row.split(delimiter) for row in raw.split('\n')]
+        header, rows = OutputHandler._iter_rows(path, delimiter, website, ongoing)
 
         # Format Visualization
-        header, content = OutputHandler._output_viz(output)
+        content = OutputHandler._output_viz(rows, limit)
         formatted = [header] + content
         return formatted
 
     @staticmethod
-    def result(path, delimiter):
+    def result(path, delimiter, limit=None, website=None, ongoing=None):
         """
-        Show crawling result summary.
+        Show crawling result summary. Rows are streamed from output, so only shown rows are kept in memory.
 
         Parameters
         ----------
             path        : str. Pathname for output file directory (result directory).
             delimiter   : str. Delimiter used for separating data.
+            limit       : int (default=None). Maximum number of shown rows (most recently updated first).
+            website     : str (default=None). Only show rows of this website.
+            ongoing     : int (default=None). Only show ongoing (1) or completed (0) rows.
         """
-        out_path = f'{path}/outputs.txt'
-        with open(out_path, 'r', encoding="utf-8") as f:
-            raw = f.read()
-        result = [row.split(delimiter) for row in raw.strip().split('\n')]
-        header, content = OutputHandler._result_viz(result)
+        fields = ['website', 'alias', 'updated_at', 'latest_chapter', 'latest_chapter_link']
+        _, rows = OutputHandler._iter_rows(path, delimiter, website, ongoing, fields)
+        header, content = OutputHandler._result_viz(rows, limit)
         formatted = [header] + content
         return formatted
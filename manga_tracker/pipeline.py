@@ -0,0 +1,148 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from queue import Queue
+from threading import Thread
+import multiprocessing
+
+from .extractor import Extractor
+
+_EXTRACTORS = {}
+
+def _init_worker(extractors):
+    """
+    Keep run's extractors in parser worker process, so selectors are sent and compiled once per worker.
+
+    Parameters
+    ----------
+        extractors  : dict. Extractor for each website.
+    """
+    global _EXTRACTORS
+    _EXTRACTORS = extractors
+
+def _parse_worker(website, content, encoding=None):
+    """
+    Parse page content in parser worker process.
+
+    Parameters
+    ----------
+        website : str. Website's name of page.
+        content : bytes. Page content.
+        encoding: str (default=None). Charset of response.
+
+    Returns
+    -------
+        data    : dict. Extracted data from web scraping in dictionary format.
+        timings : dict. Parse and preprocess durations.
+    """
+    from . import MangaTracker
+    timings = {}
+    data = MangaTracker._parse(content, _EXTRACTORS[website], timings, encoding)
+    return data, timings
+
+class ParsePipeline:
+    """
+    [Class] Fetch-parse-write pipeline. Fetchers push raw pages to a bounded queue, parser worker processes
+    turn pages into records and a single writer thread load records to output and log files. Workers are
+    started by forkserver (or spawn if unavailable), since forking a process with running fetcher and writer
+    threads can deadlock on locks held at fork time.
+    """
+    START_METHODS = ('forkserver', 'spawn')
+
+    def __init__(self, extractors, parse_workers, queue_size, writer, failed=None):
+        """
+        Parameters
+        ----------
+            extractors      : dict. Extractor for each website.
+            parse_workers   : int. Number of parser worker processes.
+            queue_size      : int. Maximum number of pages waiting to be parsed (and records waiting to be written).
+            writer          : function. Callback with (website, alias, url, response, headers, data, timings)
+                              parameters to load a record. Called from writer thread only.
+            failed          : function (default=None). Callback with (website, alias, url, error) parameters
+                              upon page that can't be parsed. Parse error stops the pipeline if not given.
+        """
+        self._raw = Queue(maxsize=queue_size)
+        self._parsed = Queue(maxsize=queue_size)
+        self._writer = writer
+        self._failed = failed
+        self._error = None
+        method = next(m for m in ParsePipeline.START_METHODS if (m in multiprocessing.get_all_start_methods()))
+        self._pool = ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context(method),
+                                         initializer=_init_worker, initargs=(extractors,))
+        self._threads = [Thread(target=self._dispatch, daemon=True), Thread(target=self._write, daemon=True)]
+        for thread in self._threads:
+            thread.start()
+
+    # Private Method
+    def _dispatch(self):
+        """
+        Submit raw pages to parser workers. Page with cached data is passed through without parsing.
+        """
+        while True:
+            item = self._raw.get()
+            if (item is None):
+                self._parsed.put(None)
+                break
+            website, alias, url, response, headers, content, data, timings = item
+            if (data is None):
+                encoding = Extractor.charset((headers or {}).get('Content-Type'))
+                try:
+                    future = self._pool.submit(_parse_worker, website, content, encoding)
+                except Exception as e:
+                    future = Future()  # e.g. worker can't be started, page fails instead of stalling pipeline
+                    future.set_exception(e)
+            else:
+                future = Future()
+                future.set_result((data, {}))
+            self._parsed.put(((website, alias, url, response, headers, timings), future))
+
+    def _write(self):
+        """
+        Wait for parsed records and load them in order of arrival.
+        """
+        while True:
+            item = self._parsed.get()
+            if (item is None):
+                break
+            (website, alias, url, response, headers, timings), future = item
+            if (self._error is not None):
+                continue
+            try:
+                data, parse_timings = future.result()
+            except Exception as e:
+                if (self._failed is None):
+                    self._error = e
+                else:
+                    self._failed(website, alias, url, e)
+                continue
+            try:
+                self._writer(website, alias, url, response, headers, data, {**(timings or {}), **parse_timings})
+            except Exception as e:
+                self._error = e
+
+    # Public Method
+    def put(self, website, alias, url, response, headers, content, data=None, timings=None):
+        """
+        Push fetched page to pipeline. Block when the queue is full.
+
+        Parameters
+        ----------
+            website : str. Website's name of page.
+            alias   : str. Manga's alias of page.
+            url     : str. Manga (target) main page URL.
+            response: int. Request status code while trying to get web page.
+            headers : dict. Response headers.
+            content : bytes. Page content.
+            data    : dict (default=None). Already extracted data (e.g. from cache). Page is not parsed if given.
+            timings : dict (default=None). Fetch timings of page.
+        """
+        self._raw.put((website, alias, url, response, headers, content, data, timings))
+
+    def close(self):
+        """
+        Wait until all pushed pages are written and stop workers. Re-raise first error from writer.
+        """
+        self._raw.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._pool.shutdown()
+        if (self._error is not None):
+            raise self._error
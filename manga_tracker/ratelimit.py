@@ -0,0 +1,218 @@
+from datetime import datetime, timezone
+from threading import Lock
+from urllib.parse import urlparse
+import time
+
+class RateLimiter:
+    """
+    [Class] Adaptive token bucket rate limiter for a single host.
+    """
+    THROTTLE_CODES = (429, 503)
+    HEALTHY_STREAK = 10
+
+    def __init__(self, rate, max_rate=None, min_rate=None, burst=1):
+        """
+        Parameters
+        ----------
+            rate        : float. Initial request rate (request per second).
+            max_rate    : float (default=None). Upper bound of request rate. Default to 4 times of initial rate.
+            min_rate    : float (default=None). Lower bound of request rate. Default to 1/8 of initial rate.
+            burst       : int (default=1). Bucket capacity (maximum requests that can be sent back-to-back).
+        """
+        self.rate = rate
+        self.base_rate = rate
+        self.max_rate = max_rate if (max_rate) else rate * 4
+        self.min_rate = min_rate if (min_rate) else rate / 8
+        self.burst = burst
+
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._blocked_until = 0
+        self._streak = 0
+        self._requests = 0
+        self._first = None
+        self._latest = None
+        self._lock = Lock()
+
+    # Private Method
+    def _refill(self, now):
+        """
+        Refill bucket with tokens generated since last refill.
+
+        Parameters
+        ----------
+            now     : float. Current monotonic time.
+        """
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    @staticmethod
+    def _retry_after(value):
+        """
+        Convert Retry-After header value into seconds.
+
+        Parameters
+        ----------
+            value   : str. Retry-After header value (delay in seconds or HTTP date).
+
+        Returns
+        -------
+            seconds : float. Delay in seconds. 0 if value is missing or invalid.
+        """
+        if (not value):
+            return 0
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+        from email.utils import parsedate_to_datetime
+
+        try:
+            retry_dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return 0
+        return max((retry_dt - datetime.now(timezone.utc)).total_seconds(), 0)
+
+    # Public Method
+    @staticmethod
+    def host(url):
+        """
+        Get host of URL as rate limiter key.
+
+        Parameters
+        ----------
+            url     : str. Target page URL.
+
+        Returns
+        -------
+            host    : str. Host (netloc) of URL.
+        """
+        return urlparse(url).netloc
+
+    @staticmethod
+    def group_rate(group, default_delay):
+        """
+        Get initial request rate of bounty group, from its "rate" key (request per second) or derived from its
+        "delay" key (seconds between requests).
+
+        Parameters
+        ----------
+            group           : dict. Group (website) and its Manga targets information.
+            default_delay   : float. Delay between requests (in seconds) for group without rate setting.
+
+        Returns
+        -------
+            rate            : float. Request rate (request per second).
+        """
+        if ('rate' in group):
+            if (group['rate'] <= 0):
+                raise ValueError(f"Rate of '{group['website']}' group must be positive, got {group['rate']}")
+            return group['rate']
+        delay = group.get('delay', default_delay)
+        if (delay <= 0):
+            raise ValueError(f"Delay of '{group['website']}' group must be positive, got {delay} (use \"rate\" for fast crawl)")
+        return 1 / delay
+
+    @staticmethod
+    def from_groups(groups, default_delay, limiters=None):
+        """
+        Create rate limiter for every host in bounty groups. Rate is read from group's "rate", "max_rate"
+        and "min_rate" keys (request per second), or derived from group's "delay" if not defined
+        (see `group_rate`). Non positive rate or delay raises ValueError.
+
+        Parameters
+        ----------
+            groups          : list. List of groups (website) and its Manga targets information.
+            default_delay   : float. Delay between requests (in seconds) for group without rate setting.
+            limiters        : dict (default=None). Existing rate limiters to reuse, new hosts are added to it.
+
+        Returns
+        -------
+            limiters        : dict. Rate limiter for each host.
+        """
+        limiters = {} if (limiters is None) else limiters
+        for group in groups:
+            rate = RateLimiter.group_rate(group, default_delay)
+            for (_, url) in group['targets']:
+                host = RateLimiter.host(url)
+                if (host not in limiters):
+                    limiters[host] = RateLimiter(rate, group.get('max_rate'), group.get('min_rate'))
+        return limiters
+
+    def reserve(self):
+        """
+        Reserve a token from bucket.
+
+        Returns
+        -------
+            wait    : float. Seconds to wait before reserved request can be sent.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(self._blocked_until - now, (1 - self._tokens) / self.rate, 0)
+            self._tokens -= 1
+            self._requests += 1
+            self._latest = now + wait
+            if (self._first is None):
+                self._first = self._latest
+        return wait
+
+    def acquire(self):
+        """
+        Block until a request is allowed to be sent.
+        """
+        wait = self.reserve()
+        if (wait > 0):
+            time.sleep(wait)
+
+    def feedback(self, response, retry_after=None):
+        """
+        Adapt request rate from response. Rate is halved on throttling response and slowly increased
+        after a streak of healthy responses.
+
+        Parameters
+        ----------
+            response    : int. Request status code.
+            retry_after : str (default=None). Retry-After header value from response.
+
+        Returns
+        -------
+            throttled   : boolean. True if response is a throttling response.
+        """
+        with self._lock:
+            if (response in RateLimiter.THROTTLE_CODES):
+                self._streak = 0
+                self.rate = max(self.min_rate, self.rate / 2)
+                delay = RateLimiter._retry_after(retry_after)
+                if (delay):
+                    self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+                return True
+            if (response < 500):
+                self._streak += 1
+                if (self._streak >= RateLimiter.HEALTHY_STREAK):
+                    self._streak = 0
+                    self.rate = min(self.max_rate, self.rate + self.base_rate / 4)
+            return False
+
+    def reset_stats(self):
+        """
+        Reset request statistics used by effective rate. Adapted rate and Retry-After block are kept.
+        """
+        with self._lock:
+            self._requests = 0
+            self._first = None
+            self._latest = None
+
+    def effective_rate(self):
+        """
+        Get average request rate between first and latest request.
+
+        Returns
+        -------
+            rate    : float. Average sent request per second.
+        """
+        with self._lock:
+            if (self._requests < 2) or (self._latest == self._first):
+                return self.rate
+            return (self._requests - 1) / (self._latest - self._first)
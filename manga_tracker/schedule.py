@@ -0,0 +1,206 @@
+from datetime import datetime
+from os.path import exists, join
+import heapq
+import json
+
+class Scheduler:
+    """
+    [Static Class] Handler to estimate targets' update cadence and decide which targets are due to be checked.
+    """
+    MIN_INTERVAL = 60 * 60
+    MAX_INTERVAL = 7 * 24 * 60 * 60
+    COMPLETED_INTERVAL = 30 * 24 * 60 * 60
+    RETRY_INTERVAL = 5 * 60
+    HISTORY = 10
+    PATTERN = '%d-%m-%Y %H:%M'
+
+    # Private Method
+    @staticmethod
+    def _key(website, alias):
+        return f'{website}|{alias}'
+
+    @staticmethod
+    def _path(result_path):
+        return join(result_path, 'schedule.json')
+
+    # Public Method
+    @staticmethod
+    def load(result_path):
+        """
+        Read schedule state of result directory.
+
+        Parameters
+        ----------
+            result_path : str. Pathname for output and log directory.
+
+        Returns
+        -------
+            state       : dict. Check and update history for each target.
+        """
+        path = Scheduler._path(result_path)
+        if (not exists(path)):
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.loads(f.read())
+
+    @staticmethod
+    def save(result_path, state):
+        """
+        Write schedule state to result directory.
+
+        Parameters
+        ----------
+            result_path : str. Pathname for output and log directory.
+            state       : dict. Check and update history for each target.
+        """
+        with open(Scheduler._path(result_path), 'w', encoding='utf-8') as f:
+            f.write(json.dumps(state))
+
+    @staticmethod
+    def observe(state, website, alias, data, now):
+        """
+        Record a check of target. Target whose update time can't be read is checked again after `MIN_INTERVAL`.
+
+        Parameters
+        ----------
+            state   : dict. Check and update history for each target.
+            website : str. Website's name of target.
+            alias   : str. Manga's alias of target.
+            data    : dict. Extracted data of target ('ongoing' and 'updated_at' are used).
+            now     : float. Check time as epoch seconds.
+        """
+        entry = state.setdefault(Scheduler._key(website, alias), {'history': []})
+        entry['checked_at'] = now
+        entry['failures'] = 0
+        entry['ongoing'] = int(data['ongoing'])
+        try:
+            updated_at = datetime.strptime(data['updated_at'], Scheduler.PATTERN).timestamp()
+        except (TypeError, ValueError):
+            entry['undated'] = True
+            return
+        entry.pop('undated', None)
+        if (updated_at not in entry['history']):
+            entry['history'] = sorted(entry['history'] + [updated_at])[-Scheduler.HISTORY:]
+
+    @staticmethod
+    def fail(state, website, alias, now):
+        """
+        Record a failed check of target, so target is retried after a backoff instead of being due immediately.
+
+        Parameters
+        ----------
+            state   : dict. Check and update history for each target.
+            website : str. Website's name of target.
+            alias   : str. Manga's alias of target.
+            now     : float. Check time as epoch seconds.
+        """
+        entry = state.setdefault(Scheduler._key(website, alias), {'history': []})
+        entry['checked_at'] = now
+        entry['failures'] = entry.get('failures', 0) + 1
+
+    @staticmethod
+    def interval(entry, now):
+        """
+        Get interval between two checks of target. Completed target is checked rarely, while ongoing target is
+        checked twice per its estimated update cadence (mean gap of observed updates, or age of latest update).
+        Target which failed its latest checks is retried with exponential backoff.
+
+        Parameters
+        ----------
+            entry       : dict. Check and update history of target.
+            now         : float. Current time as epoch seconds.
+
+        Returns
+        -------
+            interval    : float. Interval in seconds.
+        """
+        failures = entry.get('failures', 0)
+        if (failures):
+            return min(Scheduler.RETRY_INTERVAL * 2 ** (failures - 1), Scheduler.MAX_INTERVAL)
+        if (not entry['ongoing']):
+            return Scheduler.COMPLETED_INTERVAL
+        history = entry['history']
+        if (entry.get('undated')) or (not history):
+            return Scheduler.MIN_INTERVAL
+        if (len(history) >= 2):
+            cadence = (history[-1] - history[0]) / (len(history) - 1)
+        else:
+            cadence = now - history[-1]
+        return min(max(cadence / 2, Scheduler.MIN_INTERVAL), Scheduler.MAX_INTERVAL)
+
+    @staticmethod
+    def due_at(state, website, alias, now):
+        """
+        Get next check time of target.
+
+        Parameters
+        ----------
+            state   : dict. Check and update history for each target.
+            website : str. Website's name of target.
+            alias   : str. Manga's alias of target.
+            now     : float. Current time as epoch seconds.
+
+        Returns
+        -------
+            due     : float. Next check time as epoch seconds (0 if target was never checked).
+        """
+        entry = state.get(Scheduler._key(website, alias))
+        if (entry is None) or ((not entry['history']) and (not entry.get('failures')) and (not entry.get('undated'))):
+            return 0
+        return entry['checked_at'] + Scheduler.interval(entry, now)
+
+    @staticmethod
+    def plan(groups, state, previous, now):
+        """
+        Split bounty targets into due targets and targets which previous record can be carried forward. Target
+        without previous record is skipped until due if it failed its latest check.
+
+        Parameters
+        ----------
+            groups      : list. List of groups (website) and its Manga targets information.
+            state       : dict. Check and update history for each target.
+            previous    : dict. Previous output record for each (website, alias).
+            now         : float. Current time as epoch seconds.
+
+        Returns
+        -------
+            due_groups  : list. Groups with due targets only.
+            carried     : list. Previous records of not due targets.
+        """
+        due_groups, carried = [], []
+        for group in groups:
+            website = group['website']
+            targets = []
+            for (alias, url) in group['targets']:
+                record = previous.get((website, alias))
+                if (Scheduler.due_at(state, website, alias, now) > now):
+                    if (record is not None):
+                        carried.append(record)
+                        continue
+                    if (state[Scheduler._key(website, alias)].get('failures')):
+                        continue
+                targets.append([alias, url])
+            due_groups.append({**group, 'targets': targets})
+        return due_groups, carried
+
+    @staticmethod
+    def queue(groups, state, now):
+        """
+        Build priority queue of bounty targets ordered by next check time.
+
+        Parameters
+        ----------
+            groups  : list. List of groups (website) and its Manga targets information.
+            state   : dict. Check and update history for each target.
+            now     : float. Current time as epoch seconds.
+
+        Returns
+        -------
+            queue   : list. Heap of (due, website, alias) of every target.
+        """
+        queue = [
+            (Scheduler.due_at(state, group['website'], alias, now), group['website'], alias)
+            for group in groups for (alias, _) in group['targets']
+        ]
+        heapq.heapify(queue)
+        return queue
@@ -1,5 +1,5 @@
 import click
-from terminaltables import AsciiTable
+import json
 
 from .. import MangaTracker
 from .utils import (configure_cli,
@@ -7,29 +7,103 @@ from .utils import (configure_cli,
                     cvt_target_to_table,
                     cvt_header_to_table,
                     cvt_idx_to_target,
-                    cvt_output_to_table)
+                    cvt_output_to_table,
+                    cvt_filters,
+                    output_filters)
 
 @click.group()
 @click.pass_context
 @click.version_option(version='1.0')
-def cli(ctx):
+@click.option('--backend', type=click.Choice(['text', 'sqlite', 'columnar']),
+                help="Output backend (default from configuration).")
+def cli(ctx, backend):
     """
     CLI Program to Track Updated Manga using Web-Scraping (bs4) with customizeable Manga Targets (Bounty) List.
     """
     ctx.ensure_object(dict)
     ctx.obj = configure_cli()
+    if (backend):
+        ctx.obj['BACKEND'] = backend
+    MangaTracker.set_backend(ctx.obj['BACKEND'])
 
 @cli.command('crawl')
 @click.pass_context
 @click.option('--silent', is_flag=True,
                 help="Flag to silence progress messages.")
-def crawl(ctx, silent):
+@click.option('--async', 'use_async', is_flag=True,
+                help="Flag to crawl in asyncio mode with pooled HTTP connections.")
+@click.option('--max-inflight', default=8, show_default=True,
+                help="Maximum number of in-flight requests in async mode.")
+@click.option('--no-cache', is_flag=True,
+                help="Flag to always download full page instead of conditional request.")
+@click.option('--extractor', default='stream', show_default=True,
+                type=click.Choice(['stream', 'soup']),
+                help="Page extractor backend.")
+@click.option('--parse-workers', default=0, show_default=True,
+                help="Number of parser processes. Pages are parsed by fetchers if 0.")
+@click.option('--queue-size', default=64, show_default=True,
+                help="Maximum number of fetched pages waiting to be parsed.")
+@click.option('--incremental', is_flag=True,
+                help="Flag to only crawl targets that are likely updated and carry forward the others.")
+@click.option('--resume', is_flag=True,
+                help="Flag to continue interrupted job from its checkpoint, skipping completed targets.")
+@click.option('--shard',
+                help="Only crawl targets of this shard, as 'i/N' (shard i of N). Merge shards with merge command.")
+def crawl(ctx, silent, use_async, max_inflight, no_cache, extractor, parse_workers, queue_size, incremental, resume, shard):
     """
     Start web-crawling process with targets from bounty list.
     """
-    groups = MangaTracker.init_job(ctx.obj['BOUNTY_DIR'], ctx.obj['RESULT_DIR'], ctx.obj['COLUMNS'], ctx.obj['DELIMITER'], silent=silent)
-    MangaTracker.crawl(groups, ctx.obj['RESULT_DIR'], ctx.obj['COLUMNS'], ctx.obj['DELIMITER'], silent)
-    MangaTracker.end_job(ctx.obj['RESULT_DIR'], silent)
+    if (shard):
+        try:
+            MangaTracker.parse_shard(shard)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="'--shard'")
+    try:
+        groups = MangaTracker.init_job(ctx.obj['BOUNTY_DIR'], ctx.obj['RESULT_DIR'], ctx.obj['COLUMNS'], ctx.obj['DELIMITER'], silent=silent,
+                                       incremental=incremental, resume=resume, shard=shard)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    if (use_async):
+        MangaTracker.crawl_async(groups, ctx.obj['RESULT_DIR'], ctx.obj['COLUMNS'], ctx.obj['DELIMITER'], silent, max_inflight, not no_cache, extractor,
+                                 parse_workers, queue_size)
+    else:
+        MangaTracker.crawl(groups, ctx.obj['RESULT_DIR'], ctx.obj['COLUMNS'], ctx.obj['DELIMITER'], silent, not no_cache, extractor,
+                           parse_workers, queue_size)
+    MangaTracker.end_job(ctx.obj['RESULT_DIR'], silent, ctx.obj['DELIMITER'])
+
+@cli.command('merge')
+@click.pass_context
+@click.argument('shard_dirs', nargs=-1, required=True, type=click.Path(exists=True, file_okay=False))
+@click.option('--silent', is_flag=True,
+                help="Flag to silence progress messages.")
+def merge(ctx, shard_dirs, silent):
+    """
+    Merge result directories of sharded crawls into result directory.
+    """
+    MangaTracker.merge(ctx.obj['RESULT_DIR'], list(shard_dirs), ctx.obj['COLUMNS'], ctx.obj['DELIMITER'], silent)
+
+@cli.command('watch')
+@click.pass_context
+@click.option('--silent', is_flag=True,
+                help="Flag to silence progress messages.")
+@click.option('--poll', default=60, show_default=True,
+                help="Maximum seconds between checks of bounty list and due targets.")
+@click.option('--no-cache', is_flag=True,
+                help="Flag to always download full page instead of conditional request.")
+@click.option('--extractor', default='stream', show_default=True,
+                type=click.Choice(['stream', 'soup']),
+                help="Page extractor backend.")
+@click.option('--max-jobs', default=0, show_default=True,
+                help="Stop after this number of jobs (0 to run until interrupted).")
+def watch(ctx, silent, poll, no_cache, extractor, max_jobs):
+    """
+    Keep tracking targets, crawling each target when it is due by its update cadence.
+    """
+    try:
+        MangaTracker.watch(ctx.obj['BOUNTY_DIR'], ctx.obj['RESULT_DIR'], ctx.obj['COLUMNS'], ctx.obj['DELIMITER'], silent, poll,
+                           not no_cache, extractor, max_jobs)
+    except ValueError as e:
+        raise click.ClickException(str(e))
 
 @cli.command('show-bounty')
 @click.pass_context
@@ -151,6 +225,26 @@ def update_target(ctx, **kw):
                 message = MangaTracker.update_target(*result, **new_target, path=ctx.obj['BOUNTY_DIR'])
             click.echo(message)
 
+@cli.command('import-targets')
+@click.pass_context
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--yes', '-y', is_flag=True,
+                help="Flag to import without confirmation.")
+def import_targets(ctx, path, yes):
+    """
+    Import targets from CSV or JSON file to bounty list.
+    """
+    targets = MangaTracker.read_targets(path)
+    if (not targets):
+        click.echo("No target found in import file!")
+        return
+    if (yes) or (click.confirm(f"Import {len(targets)} target(s) from '{path}'?")):
+        mutations = [('add', website, alias, link) for website, alias, link in targets]
+        applied, errors = MangaTracker.apply_mutations(ctx.obj['BOUNTY_DIR'], mutations)
+        for error in errors:
+            click.echo(error)
+        click.echo(f"Successfully import {applied} of {len(targets)} target(s)")
+
 @cli.command('show-log')
 @click.pass_context
 def show_log(ctx):
@@ -162,32 +256,81 @@ def show_log(ctx):
 
 @cli.command('show-output')
 @click.pass_context
-def show_output(ctx):
+@output_filters
+def show_output(ctx, **kw):
     """
     Show full crawling output in table format.
     """
-    output = MangaTracker.show_output(ctx.obj['RESULT_DIR'], ctx.obj['DELIMITER'])
+    output = MangaTracker.show_output(ctx.obj['RESULT_DIR'], ctx.obj['DELIMITER'], **cvt_filters(kw))
     click.echo(cvt_output_to_table(output).table)
 
 @cli.command('result')
 @click.pass_context
-def result(ctx):
+@output_filters
+def result(ctx, **kw):
     """
     Show crawling result summary.
     """
-    result = MangaTracker.result(ctx.obj['RESULT_DIR'], ctx.obj['DELIMITER'])
-    meta = MangaTracker.extract_meta(ctx.obj['RESULT_DIR'])
-    tcount = int(meta['counter'][0])
+    meta, counts, result = MangaTracker.summary(ctx.obj['RESULT_DIR'], ctx.obj['DELIMITER'], **cvt_filters(kw))
+    tcount = int(meta['counter'].split()[0]) if (meta.get('due') is None) else meta['due']
     scount = int(meta['success'])
+    hcount = int(meta['cache_hit'])
+    fcount = int(meta['failed'])
     report = (f"{'Job ID':12}: {meta['job_id']}\n"
               f"{'Start Time':12}: {meta['start_time']}\n"
               f"{'End Time':12}: {meta['end_time']}\n"
               f"{'Bounty Path':12}: {meta['bounty_path']}\n"
               f"{'Result Path':12}: {meta['result_path']}\n"
-              f"{'Counter':12}: {meta['counter']}\n"
-              f"{'Success':12}: {scount} ({(tcount/scount)*100:.0f}%)\n")
+              f"{'Counter':12}: {meta['counter']}{'' if (meta.get('due') is None) else f', {tcount} due'}\n"
+              f"{'Success':12}: {f'{scount} ({(scount/tcount)*100:.0f}%)' if (tcount) else 'nothing due'}\n"
+              f"{'Cache Hit':12}: {hcount} ({(hcount/scount)*100 if (scount) else 0:.0f}%)\n"
+              f"{'Failed':12}: {fcount}\n"
+              f"{'Updated':12}: {', '.join(f'{label} {count}' for label, count in counts.items())}\n")
     click.echo(report)
     click.echo(cvt_output_to_table(result).table)
 
+@cli.command('stats')
+@click.pass_context
+def stats(ctx):
+    """
+    Show latency percentiles per stage and website of latest job.
+    """
+    from terminaltables import AsciiTable
+
+    job_id, stages, hosts = MangaTracker.stats(ctx.obj['RESULT_DIR'])
+    if (job_id is None):
+        click.echo("No metrics found! Run crawl first.")
+        return
+    click.echo(f"{'Job ID':12}: {job_id}\n")
+    stage_rows = [[stage, website, count] + [f'{ms:.1f}' for ms in pct] for stage, website, count, *pct in stages]
+    click.echo(AsciiTable([['Stage', 'Website', 'Count', 'p50 (ms)', 'p95 (ms)', 'p99 (ms)']] + stage_rows).table)
+    host_rows = [[host, count, nbytes] + [f'{ms:.1f}' for ms in pct] for host, count, nbytes, *pct in hosts]
+    click.echo(AsciiTable([['Host', 'Requests', 'Bytes', 'Fetch p50 (ms)', 'Fetch p95 (ms)', 'Fetch p99 (ms)']] + host_rows).table)
+
+@cli.command('changes')
+@click.pass_context
+@click.option('--json', 'as_json', is_flag=True,
+                help="Print one JSON record per changed target instead of table.")
+def changes(ctx, as_json):
+    """
+    Show targets with new chapter since previous job.
+    """
+    from terminaltables import AsciiTable
+
+    job_id, changes = MangaTracker.changes(ctx.obj['RESULT_DIR'])
+    if (as_json):
+        for change in changes:
+            click.echo(json.dumps(change))
+        return
+    if (job_id is None):
+        click.echo("No change set found! Run crawl first.")
+        return
+    click.echo(f"{'Job ID':12}: {job_id}\n")
+    if (not changes):
+        click.echo("No new chapter since previous job.")
+        return
+    rows = [[c['website'], c['alias'], c['previous_chapter'], c['latest_chapter'], c['updated_at']] for c in changes]
+    click.echo(AsciiTable([['Website', 'Alias', 'Previous Chapter', 'Latest Chapter', 'Updated At']] + rows).table)
+
 if __name__ == '__main__':
     cli(obj=configure_cli())
@@ -1,6 +1,6 @@
 from os import getcwd
 from os.path import realpath, join, dirname
-from terminaltables import AsciiTable
+import click
 
 def configure_cli():
     """
@@ -14,7 +14,8 @@ def configure_cli():
         'BOUNTY_DIR': realpath(join(join(dirname(dirname(__file__)), 'params'), 'bounty.json')),
         'RESULT_DIR': realpath(join(getcwd(), 'result')),
         'COLUMNS': ['website', 'alias', 'title', 'ongoing', 'updated_at', 'latest_chapter', 'latest_chapter_link'],
-        'DELIMITER':'|'
+        'DELIMITER':'|',
+        'BACKEND': 'text'
     }
     return cfg
 
@@ -31,6 +32,8 @@ def cvt_group_to_table(group):
         tbl_website : AsciiTable. Website header as AsciiTable object.
         tbl_targets : AsciiTable. List of targets information as AsciiTable object.
     """
+    from terminaltables import AsciiTable
+
     header = ['Title', 'Link']
     tbl_website = AsciiTable([[f'Website: {group[0]}']])
     tbl_targets = AsciiTable([header] + group[1:])
@@ -47,6 +50,8 @@ def cvt_target_to_table(target, new=False):
     Returns:
         preview_tbl : AsciiTable Object. Table format from target.
     """
+    from terminaltables import AsciiTable
+
     keys = ['website', 'newalias', 'newlink'] if (new) else ['website', 'alias', 'link']
     columns = ["Website", "Alias", "URL"]
     values = ["[no changes]" if (target[key] == "") else target[key] for key in keys]
@@ -65,6 +70,8 @@ def cvt_header_to_table(header):
     Returns:
         header_tbl  : AsciiTable Object. Header string as AsciiTable object.
     """
+    from terminaltables import AsciiTable
+
     header_tbl = AsciiTable([[header]])
     return header_tbl
 
@@ -97,5 +104,38 @@ def cvt_output_to_table(output):
     Returns:
         output_tbl  : AsciiTable Object. Table format from ouput data.
     """
+    from terminaltables import AsciiTable
+
     output_tbl = AsciiTable(output)
     return output_tbl
+
+def output_filters(func):
+    """
+    Add rows limit and filter options to output viewing command.
+
+    Parameters:
+        func        : function. Click command function.
+
+    Returns:
+        func        : function. Click command function with filter options.
+    """
+    func = click.option('--status', type=click.Choice(['ongoing', 'completed']),
+                            help="Only show ongoing or completed targets.")(func)
+    func = click.option('--website', '-w', default=None,
+                            help="Only show targets from this website.")(func)
+    func = click.option('--limit', '-n', default=None, type=int,
+                            help="Maximum number of shown rows.")(func)
+    return func
+
+def cvt_filters(kw):
+    """
+    Convert output filter options into output handler parameters.
+
+    Parameters:
+        kw          : dict. Command options with 'limit', 'website' and 'status' keys.
+
+    Returns:
+        filters     : dict. Output handler parameters.
+    """
+    ongoing = None if (kw['status'] is None) else int(kw['status'] == 'ongoing')
+    return {'limit': kw['limit'], 'website': kw['website'], 'ongoing': ongoing}
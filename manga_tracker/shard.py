@@ -0,0 +1,87 @@
+import bisect
+
+class ShardRing:
+    """
+    [Class] Consistent hash ring to partition targets between crawl nodes by URL. Each shard owns many points
+    (virtual nodes) of the ring, so targets are spread evenly and only a fraction of targets move between
+    shards when number of shards changes.
+    """
+    REPLICAS = 64
+
+    def __init__(self, count, replicas=None):
+        """
+        Parameters
+        ----------
+            count       : int. Number of shards.
+            replicas    : int (default=None). Number of ring points per shard. Default to REPLICAS.
+        """
+        replicas = replicas or ShardRing.REPLICAS
+        points = sorted(
+            (ShardRing._hash(f'shard-{index}-{replica}'), index)
+            for index in range(count) for replica in range(replicas)
+        )
+        self.count = count
+        self._keys = [key for key, _ in points]
+        self._shards = [index for _, index in points]
+
+    # Private Method
+    @staticmethod
+    def _hash(value):
+        from hashlib import md5
+        return int(md5(value.encode('utf-8')).hexdigest()[:16], 16)
+
+    # Public Method
+    @staticmethod
+    def parse(shard):
+        """
+        Parse shard option in 'i/N' format.
+
+        Parameters
+        ----------
+            shard   : str. Shard number (1 to N) and number of shards, e.g. '2/4'.
+
+        Returns
+        -------
+            index   : int. Zero-based shard index.
+            count   : int. Number of shards.
+        """
+        try:
+            number, count = (int(part) for part in shard.split('/'))
+        except ValueError:
+            raise ValueError(f"Shard '{shard}' is not in 'i/N' format!")
+        if (count < 1) or (not 1 <= number <= count):
+            raise ValueError(f"Shard '{shard}' is out of range, shard number must be between 1 and N!")
+        return number - 1, count
+
+    def shard_of(self, url):
+        """
+        Get shard which owns URL.
+
+        Parameters
+        ----------
+            url     : str. Manga (target) main page URL.
+
+        Returns
+        -------
+            index   : int. Zero-based shard index.
+        """
+        position = bisect.bisect(self._keys, ShardRing._hash(url)) % len(self._keys)
+        return self._shards[position]
+
+    def partition(self, groups, index):
+        """
+        Get targets owned by shard.
+
+        Parameters
+        ----------
+            groups  : list. List of groups (website) and its Manga targets information.
+            index   : int. Zero-based shard index.
+
+        Returns
+        -------
+            groups  : list. Groups with targets owned by shard only.
+        """
+        return [
+            {**group, 'targets': [[alias, url] for (alias, url) in group['targets'] if (self.shard_of(url) == index)]}
+            for group in groups
+        ]
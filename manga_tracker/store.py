@@ -0,0 +1,187 @@
+from datetime import datetime
+from os.path import join
+from threading import Lock
+import sqlite3
+
+class SQLiteStore:
+    """
+    [Class] SQLite-backed result store. Every job keeps one row per target, so history of all jobs is preserved.
+    """
+    BATCH_SIZE = 100
+    PATTERN = '%d-%m-%Y %H:%M'
+    FIELDS = ('website', 'alias', 'title', 'ongoing', 'updated_at', 'latest_chapter', 'latest_chapter_link')
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS jobs ('
+        '  job_id INTEGER PRIMARY KEY AUTOINCREMENT,'
+        '  started_at TEXT NOT NULL)',
+        'CREATE TABLE IF NOT EXISTS records ('
+        '  job_id INTEGER NOT NULL REFERENCES jobs (job_id),'
+        '  website TEXT NOT NULL,'
+        '  alias TEXT NOT NULL,'
+        '  title TEXT,'
+        '  ongoing INTEGER,'
+        '  updated_at TEXT,'
+        '  updated_ts INTEGER,'
+        '  latest_chapter TEXT,'
+        '  latest_chapter_link TEXT,'
+        '  PRIMARY KEY (job_id, website, alias))',
+        'CREATE INDEX IF NOT EXISTS idx_records_target ON records (website, alias)',
+        'CREATE INDEX IF NOT EXISTS idx_records_updated ON records (updated_ts)',
+    )
+    _stores = {}
+    _stores_lock = Lock()
+
+    def __init__(self, path):
+        """
+        Parameters
+        ----------
+            path    : str. Pathname for result directory.
+        """
+        self.path = join(path, 'outputs.db')
+        self._lock = Lock()
+        self._batch = []
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            for statement in SQLiteStore.SCHEMA:
+                self._conn.execute(statement)
+
+    # Private Method
+    @staticmethod
+    def _timestamp(date_str):
+        """
+        Convert output date string into epoch seconds.
+
+        Parameters
+        ----------
+            date_str    : str. Date in output format.
+
+        Returns
+        -------
+            timestamp   : int. Date as epoch seconds (None if date can't be parsed).
+        """
+        try:
+            return int(datetime.strptime(date_str, SQLiteStore.PATTERN).timestamp())
+        except (TypeError, ValueError):
+            return None
+
+    def _latest_job(self):
+        """
+        Get id of latest job (None if there is no job yet).
+        """
+        row = self._conn.execute('SELECT MAX(job_id) FROM jobs').fetchone()
+        return row[0]
+
+    # Public Method
+    @staticmethod
+    def open(path):
+        """
+        Get store of result directory. Store is opened once per process and shared between threads.
+
+        Parameters
+        ----------
+            path    : str. Pathname for result directory.
+
+        Returns
+        -------
+            store   : SQLiteStore. Result store.
+        """
+        with SQLiteStore._stores_lock:
+            if (path not in SQLiteStore._stores):
+                SQLiteStore._stores[path] = SQLiteStore(path)
+            return SQLiteStore._stores[path]
+
+    def start_job(self):
+        """
+        Register new job. Following inserted rows belong to this job.
+        """
+        with self._lock:
+            self._flush()
+            with self._conn:
+                self._conn.execute('INSERT INTO jobs (started_at) VALUES (?)', (datetime.now().isoformat(),))
+
+    def insert(self, row):
+        """
+        Add row to latest job. Rows are written in batch transaction.
+
+        Parameters
+        ----------
+            row     : list. Row values in output columns order.
+        """
+        with self._lock:
+            self._batch.append(tuple(row))
+            if (len(self._batch) >= SQLiteStore.BATCH_SIZE):
+                self._flush()
+
+    def _flush(self):
+        """
+        Write pending rows in a single transaction. Caller must hold store's lock.
+        """
+        if (not self._batch):
+            return
+        job_id = self._latest_job()
+        rows = [
+            (job_id, w, a, t, int(o), u, SQLiteStore._timestamp(u), c, l) for (w, a, t, o, u, c, l) in self._batch
+        ]
+        with self._conn:
+            self._conn.executemany('INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        self._batch = []
+
+    def flush(self):
+        """
+        Write pending rows.
+        """
+        with self._lock:
+            self._flush()
+
+    def iter_records(self, order='website, alias', website=None, ongoing=None, limit=None, fields=None):
+        """
+        Iterate rows of latest job lazily.
+
+        Parameters
+        ----------
+            order   : str (default='website, alias'). SQL ordering of rows.
+            website : str (default=None). Only get rows of this website.
+            ongoing : int (default=None). Only get ongoing (1) or completed (0) rows.
+            limit   : int (default=None). Maximum number of rows.
+            fields  : list (default=None). Fields to be read. Other fields are returned as empty string.
+
+        Yields
+        ------
+            row     : list. Row in output columns order (as string values).
+        """
+        self.flush()
+        where, params = ['job_id = ?'], []
+        if (website is not None):
+            where.append('website = ?')
+            params.append(website)
+        if (ongoing is not None):
+            where.append('ongoing = ?')
+            params.append(int(ongoing))
+        selected = [field if (fields is None or field in fields) else "''" for field in SQLiteStore.FIELDS]
+        query = f'SELECT {", ".join(selected)} FROM records WHERE {" AND ".join(where)} ORDER BY {order}'
+        if (limit is not None):
+            query += f' LIMIT {int(limit)}'
+
+        with self._lock:
+            cursor = self._conn.execute(query, [self._latest_job()] + params)
+        while True:
+            with self._lock:
+                chunk = cursor.fetchmany(SQLiteStore.BATCH_SIZE)
+            if (not chunk):
+                break
+            for row in chunk:
+                yield [str(val) for val in row]
+
+    def records(self, order='website, alias'):
+        """
+        Get rows of latest job.
+
+        Parameters
+        ----------
+            order   : str (default='website, alias'). SQL ordering of rows.
+
+        Returns
+        -------
+            rows    : list. Rows in output columns order (as string values).
+        """
+        return list(self.iter_records(order))
@@ -0,0 +1,159 @@
+from datetime import date
+from itertools import islice
+from os import replace, stat
+from os.path import exists, join
+import heapq
+import json
+
+from .log import LogHandler
+from .output import OutputHandler
+
+class ResultSummary:
+    """
+    [Static Class] Handler to precompute result view. Sorted result rows, update time group counts and job meta
+    are written to summary file (summary.jsonl) when job ends, so result is rendered without reading outputs
+    or log. Summary is rebuilt if output, log, backend or current date is changed.
+    """
+    FILENAME = 'summary.jsonl'
+    SOURCES = {
+        'text': ('outputs.txt',),
+        'sqlite': ('outputs.db',),
+        'columnar': (join('outputs.col', 'meta.json'),),
+    }
+    LOGS = ('logs.txt', 'logs.jsonl')
+    FIELDS = ['website', 'alias', 'ongoing', 'updated_at', 'latest_chapter', 'latest_chapter_link']
+
+    # Private Method
+    @staticmethod
+    def _signature(path):
+        """
+        Get modification time and size of files which summary is built from.
+
+        Parameters
+        ----------
+            path        : str. Pathname for result directory.
+
+        Returns
+        -------
+            signature   : list. [name, mtime, size] of each file (mtime and size are None if file doesn't exist).
+        """
+        signature = []
+        for name in ResultSummary.SOURCES[OutputHandler.backend] + ResultSummary.LOGS:
+            try:
+                info = stat(join(path, name))
+                signature.append([name, info.st_mtime_ns, info.st_size])
+            except FileNotFoundError:
+                signature.append([name, None, None])
+        return signature
+
+    @staticmethod
+    def _open(path, check=True):
+        """
+        Open summary file and read its header.
+
+        Parameters
+        ----------
+            path    : str. Pathname for result directory.
+            check   : boolean (default=True). Flag to discard summary which is outdated.
+
+        Returns
+        -------
+            summary : dict. Summary header (None if summary doesn't exist or is outdated).
+            f       : file. Summary file positioned at first row (None if summary is None).
+        """
+        filepath = join(path, ResultSummary.FILENAME)
+        if (not exists(filepath)):
+            return None, None
+        f = open(filepath, 'r', encoding='utf-8')
+        try:
+            summary = json.loads(f.readline())
+        except ValueError:
+            summary = None
+        if (summary is not None) and (check):
+            if (summary['date'] != date.today().isoformat()) or (summary['backend'] != OutputHandler.backend) \
+                or (summary['signature'] != ResultSummary._signature(path)):
+                summary = None
+        if (summary is None):
+            f.close()
+            return None, None
+        return summary, f
+
+    # Public Method
+    @staticmethod
+    def build(path, delimiter):
+        """
+        Build summary of latest job and write it to summary file. First line of summary file is summary header
+        (job meta, result header and counts), followed by one sorted result row per line.
+
+        Parameters
+        ----------
+            path        : str. Pathname for result directory.
+            delimiter   : str. Delimiter used for separating data.
+        """
+        signature = ResultSummary._signature(path)
+        _, rows = OutputHandler._iter_rows(path, delimiter, fields=ResultSummary.FIELDS)
+        status = {'1': [], '0': []}
+        for row in rows:
+            status[row[3]].append(row)
+
+        # Sort each status, then merge them with status as last column
+        counts, contents = {}, []
+        for ongoing, status_rows in status.items():
+            header, content = OutputHandler._result_viz(status_rows, label=False)
+            for row in content:
+                website_counts = counts.setdefault(ongoing, {}).setdefault(row[3], [0] * len(OutputHandler.LABELS))
+                website_counts[row[0] - 1] += 1
+            contents.append([row + [ongoing] for row in content])
+
+        summary = {
+            'date': date.today().isoformat(),
+            'backend': OutputHandler.backend,
+            'signature': signature,
+            'meta': LogHandler.extract_meta(path),
+            'header': header,
+            'counts': counts,
+        }
+        filepath = join(path, ResultSummary.FILENAME)
+        with open(f'{filepath}.tmp', 'w', encoding='utf-8') as f:
+            f.write(json.dumps(summary) + '\n')
+            for row in heapq.merge(*contents, key=OutputHandler._result_key):
+                f.write(json.dumps(row) + '\n')
+        replace(f'{filepath}.tmp', filepath)
+
+    @staticmethod
+    def result(path, delimiter, limit=None, website=None, ongoing=None):
+        """
+        Show crawling result summary from precomputed summary. Summary is rebuilt first if it is outdated, and
+        only rows up to limit are read.
+
+        Parameters
+        ----------
+            path        : str. Pathname for result directory.
+            delimiter   : str. Delimiter used for separating data.
+            limit       : int (default=None). Maximum number of shown rows (most recently updated first).
+            website     : str (default=None). Only show rows of this website.
+            ongoing     : int (default=None). Only show ongoing (1) or completed (0) rows.
+
+        Returns
+        -------
+            meta        : dict. Meta information of latest job.
+            counts      : dict. Number of shown targets (before limit) for each update time label.
+            output      : list. Result data in 2D list format.
+        """
+        summary, f = ResultSummary._open(path)
+        if (summary is None):
+            ResultSummary.build(path, delimiter)
+            summary, f = ResultSummary._open(path, check=False)
+
+        with f:
+            selected = ('1', '0') if (ongoing is None) else (str(int(ongoing)),)
+            counts = [0] * len(OutputHandler.LABELS)
+            for s in selected:
+                for site, site_counts in summary['counts'].get(s, {}).items():
+                    if (website is None) or (site == website):
+                        counts = [a + b for a, b in zip(counts, site_counts)]
+
+            rows = (json.loads(line) for line in f)
+            rows = (row for row in rows if ((row[-1] in selected) and ((website is None) or (row[3] == website))))
+            content = [[OutputHandler.LABELS[row[0]]] + row[1:-1] for row in islice(rows, limit)]
+        return summary['meta'], dict(zip(OutputHandler.LABELS.values(), counts)), [summary['header']] + content
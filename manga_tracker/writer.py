@@ -0,0 +1,214 @@
+from os import getpid, kill
+from os.path import join
+from threading import Lock, current_thread, main_thread
+import atexit
+import signal
+import time
+
+class JobWriter:
+    """
+    [Class] Job-scoped buffered writer. Output and log files are opened once per job, and lines are written
+    when buffer reaches size or time threshold, on job end, on interpreter exit (e.g. after crash) or on SIGTERM.
+    """
+    FILES = {
+        'logs': ('logs.txt', None),
+        'outputs': ('outputs.txt', 'utf-8'),
+        'failures': ('failures.jsonl', 'utf-8'),
+        'events': ('logs.jsonl', 'utf-8'),
+    }
+    _writers = {}
+    _writers_lock = Lock()
+    _sigterm = None
+    _sigterm_installed = False
+
+    def __init__(self, path, max_lines=256, interval=5.0):
+        """
+        Parameters
+        ----------
+            path        : str. Pathname for output and log directory (result directory).
+            max_lines   : int (default=256). Number of buffered lines that trigger flush.
+            interval    : float (default=5.0). Seconds since last flush that trigger flush.
+        """
+        self.path = path
+        self.max_lines = max_lines
+        self.interval = interval
+        self._lock = Lock()
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._files = {}
+
+    # Private Method
+    def _file(self, name):
+        """
+        Get file handle, opening it on first use. Caller must hold writer's lock.
+
+        Parameters
+        ----------
+            name    : str. File name key ('logs', 'outputs', 'failures' or 'events').
+
+        Returns
+        -------
+            f       : file. File handle in append mode.
+        """
+        if (name not in self._files):
+            filename, encoding = JobWriter.FILES[name]
+            self._files[name] = open(join(self.path, filename), 'a', encoding=encoding)
+        return self._files[name]
+
+    def _flush(self):
+        """
+        Write buffered lines to files. Caller must hold writer's lock.
+        """
+        touched = set()
+        for name, line in self._buffer:
+            self._file(name).write(line)
+            touched.add(name)
+        for name in touched:
+            self._files[name].flush()
+        self._buffer = []
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def _flush_all(timeout=-1):
+        """
+        Flush every open writer. Registered to run on interpreter exit.
+
+        Parameters
+        ----------
+            timeout : float (default=-1). Seconds to wait for each writer's lock (-1 to wait forever). Writer is
+                      skipped if its lock is not acquired in time (e.g. held by thread interrupted by signal).
+        """
+        with JobWriter._writers_lock:
+            writers = list(JobWriter._writers.values())
+        for writer in writers:
+            writer.flush(timeout)
+
+    @staticmethod
+    def _on_sigterm(signum, frame):
+        """
+        Flush every open writer on SIGTERM, then let previous handler (or default action) end the process.
+        """
+        JobWriter._flush_all(timeout=1)
+        previous = JobWriter._sigterm
+        if (callable(previous)):
+            previous(signum, frame)
+            return
+        signal.signal(signal.SIGTERM, previous if (previous is not None) else signal.SIG_DFL)
+        kill(getpid(), signal.SIGTERM)
+
+    @staticmethod
+    def _install_sigterm():
+        """
+        Install SIGTERM handler once. Signal handler can only be installed from main thread.
+        """
+        if (JobWriter._sigterm_installed) or (current_thread() is not main_thread()):
+            return
+        JobWriter._sigterm = signal.signal(signal.SIGTERM, JobWriter._on_sigterm)
+        JobWriter._sigterm_installed = True
+
+    # Public Method
+    @staticmethod
+    def open(path, max_lines=256, interval=5.0):
+        """
+        Open writer for job in result directory. Previously opened writer of the same directory is closed.
+
+        Parameters
+        ----------
+            path        : str. Pathname for output and log directory (result directory).
+            max_lines   : int (default=256). Number of buffered lines that trigger flush.
+            interval    : float (default=5.0). Seconds since last flush that trigger flush.
+
+        Returns
+        -------
+            writer      : JobWriter. Opened writer.
+        """
+        JobWriter._install_sigterm()
+        JobWriter.close_job(path)
+        writer = JobWriter(path, max_lines, interval)
+        with JobWriter._writers_lock:
+            JobWriter._writers[path] = writer
+        return writer
+
+    @staticmethod
+    def get(path):
+        """
+        Get opened writer of result directory.
+
+        Parameters
+        ----------
+            path    : str. Pathname for output and log directory (result directory).
+
+        Returns
+        -------
+            writer  : JobWriter. Opened writer (None if no job is running).
+        """
+        return JobWriter._writers.get(path)
+
+    @staticmethod
+    def close_job(path):
+        """
+        Flush and close writer of result directory, if any.
+
+        Parameters
+        ----------
+            path    : str. Pathname for output and log directory (result directory).
+        """
+        with JobWriter._writers_lock:
+            writer = JobWriter._writers.pop(path, None)
+        if (writer):
+            writer.close()
+
+    def write(self, name, line, truncate=False):
+        """
+        Buffer a line.
+
+        Parameters
+        ----------
+            name    : str. File name key ('logs', 'outputs', 'failures' or 'events').
+            line    : str. Line to be written (with line break).
+            truncate: boolean (default=False). Flag to empty the file before writing the line. The line is written
+                      immediately, so file is never left empty (e.g. without header) if process is killed.
+        """
+        with self._lock:
+            if (truncate):
+                self._buffer = [item for item in self._buffer if (item[0] != name)]
+                self._flush()
+                f = self._file(name)
+                f.truncate(0)
+                f.write(line)
+                f.flush()
+                return
+            self._buffer.append((name, line))
+            if (len(self._buffer) >= self.max_lines) or (time.monotonic() - self._last_flush >= self.interval):
+                self._flush()
+
+    def flush(self, timeout=-1):
+        """
+        Write all buffered lines.
+
+        Parameters
+        ----------
+            timeout : float (default=-1). Seconds to wait for writer's lock (-1 to wait forever).
+
+        Returns
+        -------
+            flushed : boolean. False if lock is not acquired in time.
+        """
+        if (not self._lock.acquire(timeout=timeout)):
+            return False
+        try:
+            self._flush()
+        finally:
+            self._lock.release()
+        return True
+
+    def close(self):
+        """
+        Write all buffered lines and close files.
+        """
+        with self._lock:
+            self._flush()
+            for f in self._files.values():
+                f.close()
+
+atexit.register(JobWriter._flush_all)
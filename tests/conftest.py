@@ -0,0 +1,124 @@
+from collections import Counter
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from os.path import dirname, join
+import glob
+import json
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+PAGES_DIR = join(dirname(__file__), 'pages')
+ROOT = dirname(dirname(__file__))
+
+class _PageHandler(SimpleHTTPRequestHandler):
+    """
+    Serve saved pages and count requests of each path (with query). First request to /slow/<page> hangs for
+    a while before the page is served, so a crawl can be interrupted mid-way.
+    """
+    requests = Counter()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with _PageHandler.lock:
+            _PageHandler.requests[self.path] += 1
+            first = _PageHandler.requests[self.path] == 1
+        if (self.path.startswith('/slow/')) and (first):
+            time.sleep(10)
+        return super().do_GET()
+
+    def translate_path(self, path):
+        return super().translate_path(path[len('/slow'):] if (path.startswith('/slow/')) else path)
+
+    def log_message(self, *args):
+        pass
+
+def saved_pages():
+    """
+    Get names of saved MangaBat pages, each has golden extracted data (<name>.json) next to it. Pages keep full
+    layout (head, menus, scripts, comments and chapter list trimmed to recent chapters), and cover non UTF-8 charset,
+    character references, nested markup in fields and panel-like markup outside the panel.
+    """
+    return sorted(path.split('/')[-1][:-5] for path in glob.glob(join(PAGES_DIR, '*.html')))
+
+@pytest.fixture
+def page():
+    """
+    Read saved page content and its golden extracted data by page name.
+    """
+    def _read(name):
+        with open(join(PAGES_DIR, f'{name}.html'), 'rb') as f:
+            content = f.read()
+        with open(join(PAGES_DIR, f'{name}.json'), 'r', encoding='utf-8') as f:
+            golden = json.loads(f.read())
+        return content, golden
+    return _read
+
+def requests_of(path):
+    """
+    Get number of requests to path (with query) of stand-in website.
+    """
+    with _PageHandler.lock:
+        return _PageHandler.requests[path]
+
+def wait_request(path, timeout=10):
+    """
+    Wait until path (with query) of stand-in website is requested.
+    """
+    deadline = time.monotonic() + timeout
+    while (requests_of(path) == 0):
+        if (time.monotonic() >= deadline):
+            raise TimeoutError(f'{path} was not requested')
+        time.sleep(0.05)
+
+@pytest.fixture(scope='session')
+def site():
+    """
+    Serve saved MangaBat pages over HTTP as a stand-in website.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), partial(_PageHandler, directory=PAGES_DIR))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+def write_bounty(path, targets, website='MangaBat'):
+    """
+    Write bounty file with one group, crawled without rate limit delay.
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'groups': [{'website': website, 'rate': 100, 'targets': targets}]}))
+
+def start_job(bounty_path, result_path, **kw):
+    """
+    Start a crawl job (init, crawl and end) in a separate process.
+    """
+    script = (
+        'import sys\n'
+        'from manga_tracker import MangaTracker\n'
+        'from manga_tracker.scripts.utils import configure_cli\n'
+        'cfg = configure_cli()\n'
+        f'groups = MangaTracker.init_job({bounty_path!r}, {result_path!r}, cfg["COLUMNS"], cfg["DELIMITER"], True, **{kw!r})\n'
+        'MangaTracker.crawl(groups, sys.argv[1], cfg["COLUMNS"], cfg["DELIMITER"], True)\n'
+        'MangaTracker.end_job(sys.argv[1], True, cfg["DELIMITER"])\n'
+    )
+    return subprocess.Popen([sys.executable, '-c', script, result_path], cwd=ROOT)
+
+def wait_checkpoint(result_path, count, timeout=10):
+    """
+    Wait until checkpoint of running job holds count records (checkpoint is written unbuffered).
+    """
+    deadline = time.monotonic() + timeout
+    while (time.monotonic() < deadline):
+        try:
+            with open(join(result_path, 'checkpoint.jsonl'), 'r', encoding='utf-8') as f:
+                if (len(f.read().splitlines()) - 1 >= count):
+                    return
+        except FileNotFoundError:
+            pass
+        time.sleep(0.05)
+    raise TimeoutError(f'checkpoint of {result_path} did not reach {count} record(s)')
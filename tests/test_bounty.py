@@ -0,0 +1,73 @@
+import json
+
+from manga_tracker.bounty import BountyHandler, BountyStore
+
+def _bounty(tmp_path, targets=()):
+    path = str(tmp_path / 'bounty.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'groups': [{'website': 'MangaBat', 'targets': [list(t) for t in targets]}]}))
+    return path
+
+def _journal(path):
+    with open(f'{path}.journal', 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _aliases(path):
+    return [alias for alias, _ in BountyHandler.read_bounty(path)[0]['targets']]
+
+def test_edits_are_replayed_from_journal(tmp_path):
+    path = _bounty(tmp_path, [('a', 'https://read.example/a')])
+    bounty_list, group_id = BountyHandler.check_target(path, 'MangaBat', 'b', duplicate=True)
+    BountyHandler.add_target(bounty_list, group_id, 'MangaBat', 'b', 'https://read.example/b', path)
+    bounty_list, group_id, target_id = BountyHandler.check_target(path, 'MangaBat', 'a')
+    BountyHandler.update_target(bounty_list, group_id, target_id, 'MangaBat', 'c', '', path)
+
+    assert len(_journal(path).splitlines()) == 2
+    assert _aliases(path) == ['c', 'b']
+    with open(path, 'r', encoding='utf-8') as f:
+        assert json.loads(f.read())['groups'][0]['targets'] == [['a', 'https://read.example/a']]
+
+def test_import_batch_is_one_journal_record(tmp_path):
+    path = _bounty(tmp_path, [('a', 'https://read.example/a')])
+    csv_path = tmp_path / 'targets.csv'
+    csv_path.write_text('website,alias,link\nMangaBat,a,https://read.example/a\nMangaBat,b,https://read.example/b\n'
+                        'MangaBat,c,https://read.example/c\nOther,d,https://read.example/d\n', encoding='utf-8')
+    targets = BountyHandler.read_targets(str(csv_path))
+    applied, errors = BountyHandler.apply_mutations(path, [('add', *target) for target in targets])
+
+    assert applied == 2 and len(errors) == 2
+    assert len(_journal(path).splitlines()) == 1
+    assert _aliases(path) == ['a', 'b', 'c']
+
+def test_truncated_last_batch_is_dropped(tmp_path):
+    path = _bounty(tmp_path)
+    BountyHandler.apply_mutations(path, [('add', 'MangaBat', 'a', 'https://read.example/a')])
+    BountyHandler.apply_mutations(path, [('add', 'MangaBat', alias, f'https://read.example/{alias}') for alias in 'bcd'])
+
+    # Crash in the middle of writing the second batch
+    content = _journal(path)
+    with open(f'{path}.journal', 'w', encoding='utf-8') as f:
+        f.write(content[:-20])
+    assert _aliases(path) == ['a']
+
+    # Next edit starts on its own line and is replayed
+    BountyHandler.apply_mutations(path, [('add', 'MangaBat', 'e', 'https://read.example/e')])
+    assert _aliases(path) == ['a', 'e']
+
+def test_journal_is_compacted_into_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(BountyHandler, 'JOURNAL_LIMIT', 200)
+    path = _bounty(tmp_path)
+    for alias in 'abcdef':
+        BountyHandler.apply_mutations(path, [('add', 'MangaBat', alias, f'https://read.example/{alias}')])
+        BountyHandler.apply_mutations(path, [('update', 'MangaBat', alias, '', f'https://read.example/{alias}/')])
+
+    with open(path, 'r', encoding='utf-8') as f:
+        snapshot = json.loads(f.read())
+    assert snapshot['seq'] > 0 and len(_journal(path)) < 200
+    assert _aliases(path) == list('abcdef')
+    assert BountyHandler.read_bounty(path)[0]['targets'][0] == ['a', 'https://read.example/a/']
+
+    # Fresh store reads the compacted snapshot
+    BountyStore._stores.pop(path)
+    store = BountyStore.open(path)
+    assert store.load() and [alias for alias, _ in store.groups[0]['targets']] == list('abcdef')
@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+from manga_tracker import MangaTracker
+from manga_tracker.cache import ValidatorCache
+from manga_tracker.extractor import ExtractorRegistry, StreamExtractor
+
+URL = 'https://read.example/a'
+DATA = {'title': 'A', 'ongoing': 1}
+
+def _fake_fetch(monkeypatch, statuses):
+    """
+    Replace page request with responses of given statuses, recording request headers.
+    """
+    requests = []
+    def _fetch(url, session=None, limiter=None, reserved=False, headers=None, timings=None):
+        requests.append(headers or {})
+        return SimpleNamespace(status_code=statuses.pop(0), headers={'ETag': '"v2"'}, content=b'')
+    monkeypatch.setattr(MangaTracker, '_fetch', staticmethod(_fetch))
+    return requests
+
+def test_cache_is_saved_and_loaded(tmp_path):
+    cache = ValidatorCache(str(tmp_path / 'cache.json'))
+    cache.store(URL, {'ETag': '"v1"', 'Last-Modified': 'Sat, 01 Jan 2026 00:00:00 GMT'}, DATA, 'x')
+    cache.store('https://read.example/b', {}, DATA, 'x')
+    cache.save()
+
+    cache = ValidatorCache(str(tmp_path / 'cache.json'))
+    assert cache.headers(URL, 'x') == {'If-None-Match': '"v1"', 'If-Modified-Since': 'Sat, 01 Jan 2026 00:00:00 GMT'}
+    assert cache.headers('https://read.example/b', 'x') == {}
+    assert cache.hit(URL, 'x') == DATA and (cache.hits, cache.lookups) == (1, 2)
+
+def test_other_extractor_version_is_not_reused(tmp_path):
+    cache = ValidatorCache(str(tmp_path / 'cache.json'))
+    cache.store(URL, {'ETag': '"v1"'}, DATA, 'old')
+    assert cache.headers(URL, 'new') == {} and cache.hit(URL, 'new') is None and cache.hits == 0
+
+    layout = ExtractorRegistry.LAYOUTS['MangaBat']
+    selectors = {**layout['selectors'], 'title': 'h2'}
+    assert StreamExtractor(layout['panel'], layout['selectors']).version == ExtractorRegistry.get('MangaBat', 'soup').version
+    assert StreamExtractor(layout['panel'], selectors).version != ExtractorRegistry.get('MangaBat').version
+
+def test_not_modified_without_entry_is_refetched(tmp_path, monkeypatch):
+    cache = ValidatorCache(str(tmp_path / 'cache.json'))
+    cache.store(URL, {'ETag': '"v1"'}, DATA, 'x')
+    requests = _fake_fetch(monkeypatch, [304, 200])
+    cache._entries.clear()
+    monkeypatch.setattr(cache, 'headers', lambda url, version=None: {'If-None-Match': '"v1"'})
+
+    req, data = MangaTracker._fetch_cached(URL, cache=cache, version='x')
+    assert (req.status_code, data) == (200, None)
+    assert requests == [{'If-None-Match': '"v1"'}, {}]
+
+def test_not_modified_reuses_data_of_same_version(tmp_path, monkeypatch):
+    cache = ValidatorCache(str(tmp_path / 'cache.json'))
+    cache.store(URL, {'ETag': '"v1"'}, DATA, 'x')
+    requests = _fake_fetch(monkeypatch, [304])
+    req, data = MangaTracker._fetch_cached(URL, cache=cache, version='x')
+    assert (req.status_code, data) == (304, DATA) and requests == [{'If-None-Match': '"v1"'}]
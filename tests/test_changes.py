@@ -0,0 +1,52 @@
+from manga_tracker import MangaTracker
+from manga_tracker.changes import ChangeSet
+from manga_tracker.scripts.utils import configure_cli
+from conftest import write_bounty
+
+def _data(chapter):
+    return {'title': 'A', 'latest_chapter': chapter, 'latest_chapter_link': f'https://read.example/a/{chapter}',
+            'updated_at': '01-01-2026 00:00'}
+
+def test_changed_latest_chapter_is_recorded(tmp_path):
+    path = str(tmp_path)
+    changeset = ChangeSet.open(path, 'job1')
+    changeset.record('MangaBat', 'a', _data('Chapter 1'))
+    changeset.record('MangaBat', 'b', _data('Chapter 5'))
+    changeset.save()
+    assert ChangeSet.read(path) == ('job1', [])
+
+    changeset = ChangeSet.open(path, 'job2')
+    changeset.record('MangaBat', 'a', _data('Chapter 2'))
+    changeset.record('MangaBat', 'b', _data('Chapter 5'))
+    changeset.save()
+    job_id, changes = ChangeSet.read(path)
+    assert job_id == 'job2' and [(c['alias'], c['previous_chapter'], c['latest_chapter']) for c in changes] \
+        == [('a', 'Chapter 1', 'Chapter 2')]
+
+    ChangeSet.open(path, 'job3').save()
+    assert ChangeSet.read(path) == ('job3', [])
+
+def test_merge_combines_shard_changes(tmp_path):
+    for shard, alias in (('s1', 'a'), ('s2', 'b')):
+        (tmp_path / shard).mkdir()
+        for job_id, chapter in (('job1', 'Chapter 1'), ('job2', 'Chapter 2')):
+            changeset = ChangeSet.open(str(tmp_path / shard), job_id)
+            changeset.record('MangaBat', alias, _data(chapter))
+            changeset.save()
+    ChangeSet.merge(str(tmp_path), [str(tmp_path / 's1'), str(tmp_path / 's2')])
+    job_id, changes = ChangeSet.read(str(tmp_path))
+    assert job_id == 'job2' and [c['alias'] for c in changes] == ['a', 'b']
+
+def test_crawl_records_changes_between_jobs(tmp_path, site, page):
+    cfg = configure_cli()
+    bounty_path, result_path = str(tmp_path / 'bounty.json'), str(tmp_path / 'result')
+    for name in ('solo_leveling', 'entities'):
+        write_bounty(bounty_path, [['a', f'{site}/{name}.html'], ['b', f'{site}/nested.html']])
+        groups = MangaTracker.init_job(bounty_path, result_path, cfg['COLUMNS'], cfg['DELIMITER'], True)
+        MangaTracker.crawl(groups, result_path, cfg['COLUMNS'], cfg['DELIMITER'], True)
+        MangaTracker.end_job(result_path, True, cfg['DELIMITER'])
+        job_id, changes = ChangeSet.read(result_path)
+        assert job_id == MangaTracker.extract_meta(result_path)['job_id']
+    before, after = page('solo_leveling')[1], page('entities')[1]
+    assert [(c['alias'], c['previous_chapter'], c['latest_chapter']) for c in changes] \
+        == [('a', before['latest_chapter'], after['latest_chapter'])]
@@ -0,0 +1,55 @@
+from os.path import exists, join
+import json
+
+from manga_tracker import MangaTracker
+from manga_tracker.checkpoint import Checkpoint
+from manga_tracker.scripts.utils import configure_cli
+from conftest import requests_of, saved_pages, start_job, wait_checkpoint, wait_request, write_bounty
+
+GROUPS = [{'website': 'MangaBat', 'targets': [['a', 'https://read.example/a'], ['b', 'https://read.example/b']]}]
+
+def test_resumed_checkpoint_keeps_records_and_fallback(tmp_path):
+    path, rows = str(tmp_path), [['MangaBat', 'a', 'Old A'], ['MangaBat', 'b', 'Old B']]
+    checkpoint = Checkpoint.start(path, 'job', GROUPS, rows)
+    checkpoint.record('MangaBat', 'a', 200, ['MangaBat', 'a', 'New A'])
+    with open(join(path, Checkpoint.FILENAME), 'a', encoding='utf-8') as f:
+        f.write('{"website": "MangaBat", "alias": "b", "resp')  # Killed while appending
+    checkpoint._file.close()
+
+    checkpoint = Checkpoint.resume(path)
+    assert checkpoint.job_id == 'job' and [entry['row'] for entry in checkpoint.entries] == [['MangaBat', 'a', 'New A']]
+    assert checkpoint.crawled() == {('MangaBat', 'a')}
+    assert checkpoint.remaining() == [{'website': 'MangaBat', 'targets': [['b', 'https://read.example/b']]}]
+    assert checkpoint.failed() == [['MangaBat', 'b', 'Old B']]
+    with open(join(path, Checkpoint.FILENAME), 'r', encoding='utf-8') as f:
+        assert [json.loads(line)['job_id' if (i == 0) else 'alias'] for i, line in enumerate(f)] == ['job', 'a']
+
+    checkpoint.finish()
+    assert Checkpoint.resume(path) is None
+
+def test_killed_job_is_resumed_without_refetch(tmp_path, site):
+    cfg = configure_cli()
+    paths = [f'/{page}.html?resume' for page in saved_pages()] + ['/slow/nested.html?resume', '/nested.html?after']
+    aliases = saved_pages() + ['slow', 'after']
+    bounty_path, result_path = str(tmp_path / 'bounty.json'), str(tmp_path / 'result')
+    write_bounty(bounty_path, [[alias, f'{site}{path}'] for alias, path in zip(aliases, paths)])
+
+    proc = start_job(bounty_path, result_path)
+    wait_checkpoint(result_path, len(saved_pages()))
+    wait_request('/slow/nested.html?resume')
+    proc.kill()
+    proc.wait()
+    assert requests_of('/slow/nested.html?resume') == 1 and requests_of('/nested.html?after') == 0
+
+    groups = MangaTracker.init_job(bounty_path, result_path, cfg['COLUMNS'], cfg['DELIMITER'], True, resume=True)
+    assert [alias for (alias, _) in groups[0]['targets']] == ['slow', 'after']
+    MangaTracker.crawl(groups, result_path, cfg['COLUMNS'], cfg['DELIMITER'], True)
+    MangaTracker.end_job(result_path, True, cfg['DELIMITER'])
+
+    # Only the target in flight when job was killed is requested again
+    assert {path: requests_of(path) for path in paths} == {**{path: 1 for path in paths}, '/slow/nested.html?resume': 2}
+    with open(join(result_path, 'outputs.txt'), 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    assert lines[0].split('|')[:2] == ['website', 'alias']
+    assert sorted(line.split('|')[1] for line in lines[1:]) == sorted(aliases)
+    assert not exists(join(result_path, Checkpoint.FILENAME))
@@ -0,0 +1,80 @@
+from os.path import dirname
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from manga_tracker.columnar import ColumnarStore
+
+ROOT = dirname(dirname(__file__))
+
+def _rows(count, prefix='a'):
+    return [
+        ['MangaBat', f'{prefix}{i}', f'T{prefix}{i}', str(i % 3 % 2), f'{i % 28 + 1:02d}-01-2026 10:{i % 60:02d}',
+         f'Chapter {i}', f'https://read.example/{prefix}{i}']
+        for i in range(count)
+    ]
+
+def test_insert_flushes_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(ColumnarStore, 'BATCH_SIZE', 7)
+    store = ColumnarStore(str(tmp_path))
+    store.start_job()
+    rows = _rows(30)
+    for row in rows:
+        store.insert(row)
+    assert store.meta['rows'] == 28 and len(store._batch) == 2
+
+    store.flush()
+    assert store.records() == rows
+    assert ColumnarStore(str(tmp_path)).records() == rows
+
+@pytest.mark.parametrize('crash_at', ['_append_bits', '_commit'])
+def test_interrupted_flush_is_rolled_back(tmp_path, crash_at):
+    # Job with 5 committed rows, then a process killed in the middle of flushing 3 more rows
+    script = textwrap.dedent(f'''
+        import os
+        from manga_tracker.columnar import ColumnarStore
+        from tests.test_columnar import _rows
+        store = ColumnarStore({str(tmp_path)!r})
+        store.start_job()
+        for row in _rows(5):
+            store.insert(row)
+        store.flush()
+        setattr(ColumnarStore, {crash_at!r}, lambda *args: os._exit(1))
+        for row in _rows(3, 'b'):
+            store.insert(row)
+        store.flush()
+    ''')
+    proc = subprocess.run([sys.executable, '-c', script], cwd=ROOT)
+    assert proc.returncode == 1
+
+    store = ColumnarStore(str(tmp_path))
+    assert store.records() == _rows(5)
+    store.start_job()
+    for row in _rows(11, 'c'):
+        store.insert(row)
+    store.flush()
+    assert store.records() == _rows(11, 'c')
+    assert ColumnarStore(str(tmp_path)).records() == _rows(11, 'c')
+
+def test_failed_flush_keeps_pending_rows(tmp_path, monkeypatch):
+    store = ColumnarStore(str(tmp_path))
+    store.start_job()
+    for row in _rows(5):
+        store.insert(row)
+    store.flush()
+
+    def _fail(*args):
+        raise OSError('disk full')
+    append_bits = ColumnarStore._append_bits
+    monkeypatch.setattr(ColumnarStore, '_append_bits', _fail)
+    for row in _rows(3, 'b'):
+        store.insert(row)
+    with pytest.raises(OSError):
+        store.flush()
+
+    monkeypatch.setattr(ColumnarStore, '_append_bits', append_bits)
+    store.flush()
+    assert store.records() == _rows(5) + _rows(3, 'b')
+    assert ColumnarStore(str(tmp_path)).records() == _rows(5) + _rows(3, 'b')
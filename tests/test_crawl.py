@@ -0,0 +1,44 @@
+from os.path import join
+import json
+
+from manga_tracker import MangaTracker
+from manga_tracker.scripts.utils import configure_cli
+from conftest import saved_pages, write_bounty
+
+def _run(tmp_path, site, name, use_async=False, **kw):
+    cfg = configure_cli()
+    targets = [[page, f'{site}/{page}.html'] for page in saved_pages()] + [['missing', f'{site}/missing.html'],
+                                                                           ['invalid', f'{site}/invalid/not_manga.html']]
+    bounty_path, result_path = str(tmp_path / f'{name}.json'), str(tmp_path / name)
+    write_bounty(bounty_path, targets)
+
+    groups = MangaTracker.init_job(bounty_path, result_path, cfg['COLUMNS'], cfg['DELIMITER'], silent=True)
+    if (use_async):
+        MangaTracker.crawl_async(groups, result_path, cfg['COLUMNS'], cfg['DELIMITER'], True, **kw)
+    else:
+        MangaTracker.crawl(groups, result_path, cfg['COLUMNS'], cfg['DELIMITER'], True, **kw)
+    MangaTracker.end_job(result_path, True, cfg['DELIMITER'])
+    with open(join(result_path, 'outputs.txt'), 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    return lines[0], sorted(lines[1:])
+
+def test_crawl_async_matches_crawl(tmp_path, site, page):
+    header, rows = _run(tmp_path, site, 'sync', use_async=False)
+    assert (header, rows) == _run(tmp_path, site, 'async', use_async=True)
+
+    records = {row.split('|')[1]: dict(zip(header.split('|'), row.split('|'))) for row in rows}
+    assert sorted(records) == saved_pages()
+    for name, record in records.items():
+        _, golden = page(name)
+        assert {key: record[key] for key in golden} == {key: str(val) for key, val in golden.items()}
+
+def _failures(result_path):
+    with open(join(result_path, 'failures.jsonl'), 'r', encoding='utf-8') as f:
+        return {record['alias']: record['stage'] for record in map(json.loads, f)}
+
+def test_parse_workers_match_inline_parse(tmp_path, site):
+    inline = _run(tmp_path, site, 'inline')
+    assert _run(tmp_path, site, 'workers', parse_workers=2) == inline
+    assert _run(tmp_path, site, 'workers_async', use_async=True, parse_workers=2) == inline
+    for name in ('inline', 'workers', 'workers_async'):
+        assert _failures(str(tmp_path / name)) == {'missing': 'fetch', 'invalid': 'parse'}
@@ -0,0 +1,71 @@
+from bs4 import BeautifulSoup
+import pytest
+
+from manga_tracker import MangaTracker
+from manga_tracker.extractor import Extractor, ExtractorRegistry
+from conftest import saved_pages, write_bounty
+
+def _baseline_scrape(content):
+    """
+    Extraction of original `MangaTracker._scrape` (before pluggable extractors), without the request.
+    """
+    page = BeautifulSoup(content, 'html.parser')
+    info_panel = page.find('div', class_="story-info-right")
+    info_table = info_panel.find('table').find('tbody').find_all('tr')
+    info_extent = info_panel.find('div').find_all("p")
+    extracted = {
+        'title': info_panel.find('h1').text,
+        'ongoing': info_table[2].find_all('td')[1].text,
+        'updated_at': info_extent[0].find_all('span')[1].text,
+        'latest_chapter': info_extent[3].find_all('span')[1].find('a').text,
+        'latest_chapter_link': info_extent[3].find_all('span')[1].find('a')['href'],
+    }
+    return MangaTracker._preproccess(extracted)
+
+@pytest.mark.parametrize('name', saved_pages())
+def test_baseline_matches_golden(page, name):
+    content, golden = page(name)
+    assert _baseline_scrape(content) == golden
+
+@pytest.mark.parametrize('backend', sorted(ExtractorRegistry.BACKENDS))
+@pytest.mark.parametrize('name', saved_pages())
+def test_extractor_matches_golden(page, name, backend):
+    content, golden = page(name)
+    assert MangaTracker._parse(content, ExtractorRegistry.get('MangaBat', backend)) == golden
+
+@pytest.mark.parametrize('backend', sorted(ExtractorRegistry.BACKENDS))
+def test_extractor_uses_response_charset(page, backend):
+    content, golden = page('cp1252')
+    content = content.replace(b'<meta http-equiv="Content-Type" content="text/html; charset=windows-1252" />', b'')
+    assert b'charset' not in content
+    encoding = Extractor.charset('text/html; charset=windows-1252')
+    assert MangaTracker._parse(content, ExtractorRegistry.get('MangaBat', backend), encoding=encoding) == golden
+
+def test_extractor_needs_backend():
+    with pytest.raises(TypeError):
+        Extractor(('div', 'story-info-right'), {'title': 'h1'})
+
+def test_charset():
+    assert Extractor.charset('text/html; charset="UTF-8"') == 'UTF-8'
+    assert Extractor.charset('text/html') is None
+    assert Extractor.charset(None) is None
+
+def test_unknown_website_has_no_layout(tmp_path):
+    with pytest.raises(ValueError, match='Other'):
+        ExtractorRegistry.build([{'website': 'Other', 'targets': []}])
+
+    bounty_path, result_path = tmp_path / 'bounty.json', tmp_path / 'result'
+    write_bounty(str(bounty_path), [['a', 'https://other.example/a']], website='Other')
+    with pytest.raises(ValueError, match='Other'):
+        MangaTracker.init_job(str(bounty_path), str(result_path), ['website'], '|', silent=True)
+    assert not result_path.exists()
+
+@pytest.mark.parametrize('backend', sorted(ExtractorRegistry.BACKENDS))
+def test_group_layout_overrides_registered_layout(page, backend):
+    content, golden = page(saved_pages()[0])
+    layout = {'panel': ['div', 'story-info-right'], 'selectors': {'title': 'h1', 'status': 'table tbody tr[2] td[1]'}}
+    extractors = ExtractorRegistry.build([{'website': 'Mirror', 'layout': layout, 'targets': []}], backend)
+    extracted = extractors['Mirror'].extract(content)
+    assert extracted['title'] == golden['title'] and set(extracted) == {'title', 'status'}
+    with pytest.raises(ValueError):
+        ExtractorRegistry.get('Mirror', backend, {'panel': ['div', 'story-info-right']})
@@ -0,0 +1,66 @@
+import json
+
+from manga_tracker.log import LogHandler
+
+def _job(path, aliases, bounty_path='bounty.json', failed=()):
+    path.mkdir()
+    path = str(path)
+    LogHandler.log_start(path, True)
+    LogHandler.log_bounty(path, bounty_path, len(aliases) + len(failed), 1, True)
+    LogHandler.logging(path, f'[Init] Output file successfully created at "{path}"', True, event='output_init')
+    for alias in aliases:
+        LogHandler.log_scrape(path, alias, 200, True, 'MangaBat')
+    for alias in failed:
+        LogHandler.log_failure(path, 'MangaBat', alias, f'https://read.example/{alias}', 'fetch', OSError('down'), True, 404)
+    LogHandler.log_end(path, True)
+    return path
+
+def _events(path):
+    with open(f'{path}/logs.jsonl', 'r', encoding='utf-8') as f:
+        summary = json.loads(f.readline())
+        return summary, [json.loads(line) for line in f]
+
+def test_events_are_structured(tmp_path):
+    path = _job(tmp_path / 'result', ['a'], failed=['b'])
+    summary, events = _events(path)
+    assert [event['event'] for event in events] == \
+        ['job_start', 'job_start_time', 'bounty', 'output_init', 'scrape', 'failure', 'job_end']
+    assert {event['job_id'] for event in events} == {summary['job_id']}
+    assert events[4]['website'] == 'MangaBat' and events[4]['alias'] == 'a' and events[4]['status'] == 200
+    assert events[5]['stage'] == 'fetch' and events[5]['status'] == 404 and events[5]['error'] == 'OSError'
+
+def test_summary_is_rewritten_on_job_end(tmp_path):
+    path = _job(tmp_path / 'fixed', ['a', 'b'], failed=['c'])
+    with open(f'{path}/logs.jsonl', 'rb') as f:
+        assert len(f.readline()) == LogHandler.SUMMARY_SIZE
+    summary, events = _events(path)
+    assert (summary['success'], summary['failed']) == (2, 1) and summary['end_time'] is not None
+    assert len(events) == 8
+
+    # Summary which outgrows fixed size rewrites whole log
+    long_path = 'x' * LogHandler.SUMMARY_SIZE
+    path = _job(tmp_path / 'grown', ['a'], bounty_path=long_path)
+    summary, events = _events(path)
+    assert summary['bounty_path'] == long_path and summary['end_time'] is not None
+    assert [event['event'] for event in events][-1] == 'job_end' and len(events) == 6
+    assert LogHandler.extract_meta(path)['success'] == 1
+
+def test_merge_logs(tmp_path):
+    shards = [_job(tmp_path / 'shard0', ['a', 'b']), _job(tmp_path / 'shard1', ['c'], failed=['d'])]
+    (tmp_path / 'merged').mkdir()
+    path = str(tmp_path / 'merged')
+    LogHandler.merge_logs(path, shards, True)
+
+    summary, events = _events(path)
+    assert (summary['targets'], summary['success'], summary['failed']) == (4, 3, 1)
+    assert [event['event'] for event in events] == \
+        ['job_start', 'job_start_time', 'bounty', 'output_init', 'scrape', 'scrape', 'scrape', 'failure', 'merge', 'job_end']
+    assert [event['alias'] for event in events if (event['event'] == 'scrape')] == ['a', 'b', 'c']
+
+    with open(f'{path}/logs.txt', 'r') as f:
+        lines = f.read().splitlines()
+    assert [line[22:] for line in lines] == [event['message'] for event in events]
+    with open(f'{path}/failures.jsonl', 'r', encoding='utf-8') as f:
+        assert [json.loads(line)['alias'] for line in f] == ['d']
+    meta = LogHandler.extract_meta(path)
+    assert meta['end_time'] == summary['end_time'] and meta['counter'] == '4 target(s) from 1 website(s)'
@@ -0,0 +1,24 @@
+from datetime import date, timedelta
+
+from manga_tracker.output import OutputHandler
+
+def _row(alias, updated_at, ongoing='1'):
+    return ['MangaBat', alias, f'Title {alias}', ongoing, updated_at, f'Chapter {alias}', f'https://read.example/{alias}']
+
+def test_result_limit_keeps_most_recent_rows():
+    old = (date.today() - timedelta(days=60)).strftime('%d-%m-%Y')
+    rows = [
+        _row('a', f'{old} 09:00'),
+        _row('b', f'{old} 23:30'),
+        _row('c', '01-02-2003 10:00'),
+        _row('d', f'{old} 10:00'),
+    ]
+    _, content = OutputHandler._result_viz(rows, limit=2)
+    assert [row[2] for row in content] == ['b', 'd']
+
+    _, content = OutputHandler._result_viz(rows)
+    assert [row[2] for row in content] == ['b', 'd', 'a', 'c']
+
+def test_output_viz_labels_status():
+    content = OutputHandler._output_viz([_row('a', '01-02-2003 10:00', '1'), _row('b', '01-02-2003 10:00', '0')])
+    assert [row[3] for row in content] == ['Ongoing', 'Completed']
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+import time
+
+import pytest
+
+from manga_tracker import MangaTracker
+from manga_tracker.ratelimit import RateLimiter
+
+def _group(**kw):
+    return {'website': 'MangaBat', 'targets': [['a', 'https://read.example/a']], **kw}
+
+def test_rate_is_derived_from_delay():
+    assert RateLimiter.from_groups([_group(delay=4)], 10)['read.example'].rate == 0.25
+    assert RateLimiter.from_groups([_group()], 10)['read.example'].rate == 0.1
+    assert RateLimiter.from_groups([_group(rate=2, delay=0)], 10)['read.example'].rate == 2
+
+@pytest.mark.parametrize('setting', [{'delay': 0}, {'delay': -1}, {'rate': 0}])
+def test_non_positive_rate_is_rejected(setting):
+    with pytest.raises(ValueError, match="'MangaBat' group"):
+        RateLimiter.from_groups([_group(**setting)], 10)
+
+@pytest.mark.parametrize('status', RateLimiter.THROTTLE_CODES)
+def test_throttling_halves_rate_down_to_min_rate(status):
+    limiter = RateLimiter(8, min_rate=3)
+    assert limiter.feedback(status) and limiter.rate == 4
+    assert limiter.feedback(status) and limiter.rate == 3
+    for _ in range(RateLimiter.HEALTHY_STREAK):
+        assert not limiter.feedback(200)
+    assert limiter.rate == 5
+
+@pytest.mark.parametrize('retry_after', ['30', 'date'])
+def test_retry_after_blocks_requests(retry_after):
+    if (retry_after == 'date'):
+        retry_after = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    limiter = RateLimiter(100)
+    limiter.feedback(429, retry_after)
+    assert 28 < limiter.reserve() <= 30
+
+def test_fetch_retries_throttled_request_after_retry_after():
+    sent = []
+    def get(url, headers=None, timeout=None):
+        sent.append(time.monotonic())
+        status = 429 if (len(sent) == 1) else 200
+        return SimpleNamespace(status_code=status, headers={'Retry-After': '0.3'} if (status == 429) else {}, content=b'')
+
+    limiter = RateLimiter(100)
+    req = MangaTracker._fetch('https://read.example/a', SimpleNamespace(get=get), limiter)
+    assert req.status_code == 200 and len(sent) == 2
+    assert sent[1] - sent[0] >= 0.3 and limiter.rate == 50
@@ -0,0 +1,75 @@
+from datetime import datetime
+
+from click.testing import CliRunner
+
+from manga_tracker import MangaTracker
+from manga_tracker.ratelimit import RateLimiter
+from manga_tracker.schedule import Scheduler
+from manga_tracker.scripts import cli_interface
+from manga_tracker.scripts.utils import configure_cli
+from conftest import saved_pages, write_bounty
+
+GROUPS = [{'website': 'MangaBat', 'targets': [['a', 'https://read.example/a'], ['b', 'https://read.example/b']]}]
+
+def test_failed_target_is_retried_with_backoff():
+    state, now = {}, 1000.0
+    Scheduler.fail(state, 'MangaBat', 'a', now)
+    assert Scheduler.due_at(state, 'MangaBat', 'a', now) == now + Scheduler.RETRY_INTERVAL
+    Scheduler.fail(state, 'MangaBat', 'a', now)
+    assert Scheduler.due_at(state, 'MangaBat', 'a', now) == now + 2 * Scheduler.RETRY_INTERVAL
+    for _ in range(20):
+        Scheduler.fail(state, 'MangaBat', 'a', now)
+    assert Scheduler.due_at(state, 'MangaBat', 'a', now) == now + Scheduler.MAX_INTERVAL
+
+def test_plan_skips_failed_target_until_due():
+    state, now = {}, 1000.0
+    Scheduler.fail(state, 'MangaBat', 'a', now)
+    previous = {}
+    groups, carried = Scheduler.plan(GROUPS, state, previous, now + 1)
+    assert groups[0]['targets'] == [['b', 'https://read.example/b']] and carried == []
+
+    previous = {('MangaBat', 'a'): ['MangaBat', 'a']}
+    groups, carried = Scheduler.plan(GROUPS, state, previous, now + 1)
+    assert groups[0]['targets'] == [['b', 'https://read.example/b']] and carried == [['MangaBat', 'a']]
+
+    groups, carried = Scheduler.plan(GROUPS, state, previous, now + Scheduler.RETRY_INTERVAL)
+    assert groups[0]['targets'] == GROUPS[0]['targets'] and carried == []
+
+def test_observe_resets_failures():
+    state, now = {}, 1000.0
+    Scheduler.fail(state, 'MangaBat', 'a', now)
+    Scheduler.observe(state, 'MangaBat', 'a', {'ongoing': '0', 'updated_at': '01-01-2026 00:00'}, now)
+    assert Scheduler.due_at(state, 'MangaBat', 'a', now) == now + Scheduler.COMPLETED_INTERVAL
+
+def test_unreadable_update_time_is_checked_after_min_interval():
+    state, now = {}, datetime(2026, 2, 1).timestamp()
+    Scheduler.observe(state, 'MangaBat', 'a', {'ongoing': 1, 'updated_at': 'Oct 17,2026 - 10:05 AM'}, now)
+    assert Scheduler.due_at(state, 'MangaBat', 'a', now) == now + Scheduler.MIN_INTERVAL
+
+    Scheduler.observe(state, 'MangaBat', 'a', {'ongoing': 1, 'updated_at': '01-01-2026 00:00'}, now)
+    Scheduler.observe(state, 'MangaBat', 'a', {'ongoing': 1, 'updated_at': None}, now)
+    assert Scheduler.due_at(state, 'MangaBat', 'a', now) == now + Scheduler.MIN_INTERVAL
+    Scheduler.observe(state, 'MangaBat', 'a', {'ongoing': 1, 'updated_at': '01-01-2026 00:00'}, now)
+    assert Scheduler.due_at(state, 'MangaBat', 'a', now) == now + Scheduler.MAX_INTERVAL
+
+def test_result_reports_nothing_due(tmp_path, site, monkeypatch):
+    cfg = configure_cli()
+    cfg.update(BOUNTY_DIR=str(tmp_path / 'bounty.json'), RESULT_DIR=str(tmp_path / 'result'))
+    write_bounty(cfg['BOUNTY_DIR'], [[name, f'{site}/{name}.html'] for name in saved_pages()])
+    for incremental in (False, True):
+        groups = MangaTracker.init_job(cfg['BOUNTY_DIR'], cfg['RESULT_DIR'], cfg['COLUMNS'], cfg['DELIMITER'], True,
+                                       incremental=incremental)
+        MangaTracker.crawl(groups, cfg['RESULT_DIR'], cfg['COLUMNS'], cfg['DELIMITER'], True)
+        MangaTracker.end_job(cfg['RESULT_DIR'], True, cfg['DELIMITER'])
+    assert sum(len(group['targets']) for group in groups) == 0
+
+    monkeypatch.setattr(cli_interface, 'configure_cli', lambda: dict(cfg))
+    report = CliRunner().invoke(cli_interface.cli, ['result']).output
+    assert 'Success     : nothing due' in report and f'{len(saved_pages())} target(s) from 1 website(s), 0 due' in report
+
+def test_limiters_are_reused():
+    limiters = RateLimiter.from_groups(GROUPS, 10)
+    limiters['read.example'].feedback(429)
+    groups = GROUPS + [{'website': 'Other', 'targets': [['c', 'https://other.example/c']]}]
+    reused = RateLimiter.from_groups(groups, 10, limiters)
+    assert reused is limiters and reused['read.example'].rate == 0.05 and 'other.example' in reused
@@ -0,0 +1,58 @@
+from os.path import join
+
+import pytest
+
+from manga_tracker import MangaTracker
+from manga_tracker.changes import ChangeSet
+from manga_tracker.shard import ShardRing
+from manga_tracker.scripts.utils import configure_cli
+from conftest import saved_pages, write_bounty
+
+URLS = [f'https://read.example/manga-{i}' for i in range(1000)]
+
+def test_parse():
+    assert ShardRing.parse('2/4') == (1, 4)
+    for shard in ('0/4', '5/4', '1/0', 'a/4', '2'):
+        with pytest.raises(ValueError):
+            ShardRing.parse(shard)
+
+def test_every_target_is_owned_by_one_shard():
+    groups = [{'website': 'MangaBat', 'targets': [[f'a{i}', url] for i, url in enumerate(URLS)]}]
+    ring = ShardRing(3)
+    parts = [ring.partition(groups, index)[0]['targets'] for index in range(3)]
+    assert sorted(target for part in parts for target in part) == sorted(groups[0]['targets'])
+    assert all(200 < len(part) < 467 for part in parts)
+    assert [ShardRing(3).shard_of(url) for url in URLS] == [ring.shard_of(url) for url in URLS]
+
+def test_adding_shard_moves_few_targets():
+    before, after = ShardRing(4), ShardRing(5)
+    moved = [url for url in URLS if (before.shard_of(url) != after.shard_of(url))]
+    assert all(after.shard_of(url) == 4 for url in moved) and len(moved) < 0.35 * len(URLS)
+
+def _read(path, name):
+    with open(join(path, name), 'r', encoding='utf-8') as f:
+        return f.read().splitlines()
+
+def test_merged_shards_match_single_crawl(tmp_path, site):
+    cfg = configure_cli()
+    bounty_path = str(tmp_path / 'bounty.json')
+    targets = [[f'{name}-{i}', f'{site}/{name}.html?shard={i}'] for name in saved_pages() for i in range(4)]
+    write_bounty(bounty_path, targets)
+    shards = {'full': None, 's1': '1/2', 's2': '2/2'}
+    for name, shard in shards.items():
+        result_path = str(tmp_path / name)
+        groups = MangaTracker.init_job(bounty_path, result_path, cfg['COLUMNS'], cfg['DELIMITER'], True, shard=shard)
+        MangaTracker.crawl(groups, result_path, cfg['COLUMNS'], cfg['DELIMITER'], True)
+        MangaTracker.end_job(result_path, True, cfg['DELIMITER'])
+    ring = ShardRing(2)
+    for index, name in enumerate(('s1', 's2')):
+        aliases = sorted(line.split(cfg['DELIMITER'])[1] for line in _read(str(tmp_path / name), 'outputs.txt')[1:])
+        assert aliases == sorted(alias for alias, url in targets if (ring.shard_of(url) == index))
+
+    merged = str(tmp_path / 'merged')
+    MangaTracker.merge(merged, [str(tmp_path / 's1'), str(tmp_path / 's2')], cfg['COLUMNS'], cfg['DELIMITER'], True)
+    full = _read(str(tmp_path / 'full'), 'outputs.txt')
+    output = _read(merged, 'outputs.txt')
+    assert output[0] == full[0] and sorted(output[1:]) == sorted(full[1:])
+    assert MangaTracker.extract_meta(merged)['success'] == len(targets)
+    assert ChangeSet.read(merged) == (MangaTracker.extract_meta(str(tmp_path / 's1'))['job_id'], [])
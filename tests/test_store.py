@@ -0,0 +1,52 @@
+import pytest
+
+from manga_tracker.output import OutputHandler
+from manga_tracker.store import SQLiteStore
+
+COLUMNS = ['website', 'alias', 'title', 'ongoing', 'updated_at', 'latest_chapter', 'latest_chapter_link']
+
+def _data(i):
+    return {
+        'title': f'Title {i}', 'ongoing': i % 2, 'updated_at': f'{i % 28 + 1:02d}-01-2026 10:{i % 60:02d}',
+        'latest_chapter': f'Chapter {i}', 'latest_chapter_link': f'https://read.example/{i}',
+    }
+
+def _job(path, count):
+    OutputHandler.init_output(path, COLUMNS, '|')
+    for i in range(count):
+        OutputHandler.load_data(path, 'MangaBat' if (i % 3) else 'Other', f'a{i}', _data(i), COLUMNS, '|')
+    OutputHandler.flush(path)
+
+@pytest.fixture
+def sqlite(monkeypatch):
+    monkeypatch.setattr(OutputHandler, 'backend', 'sqlite')
+
+def test_sqlite_round_trip(tmp_path, sqlite):
+    path = str(tmp_path)
+    _job(path, 5)
+    _job(path, 3)
+    rows = list(SQLiteStore.open(path).iter_records())
+    assert rows == [
+        ['Other' if (i % 3 == 0) else 'MangaBat', f'a{i}'] + [str(_data(i)[col]) for col in COLUMNS[2:]]
+        for i in (1, 2, 0)
+    ]
+    assert SQLiteStore.open(path).records() == rows
+    assert list(SQLiteStore.open(path).iter_records(website='Other', ongoing=0)) == [rows[2]]
+
+@pytest.mark.parametrize('backend', ['sqlite', 'columnar'])
+def test_views_match_text_backend(tmp_path, monkeypatch, backend):
+    (tmp_path / 'text').mkdir()
+    _job(str(tmp_path / 'text'), 2 * SQLiteStore.BATCH_SIZE + 7)
+    views = lambda path: (
+        OutputHandler.show_output(path, '|'),
+        OutputHandler.show_output(path, '|', limit=5, website='MangaBat', ongoing=1),
+        OutputHandler.result(path, '|'),
+        OutputHandler.result(path, '|', limit=5, website='Other', ongoing=0),
+        OutputHandler.read_records(path, '|'),
+    )
+    expected = views(str(tmp_path / 'text'))
+
+    monkeypatch.setattr(OutputHandler, 'backend', backend)
+    (tmp_path / backend).mkdir()
+    _job(str(tmp_path / backend), 2 * SQLiteStore.BATCH_SIZE + 7)
+    assert views(str(tmp_path / backend)) == expected
@@ -0,0 +1,59 @@
+from datetime import date, timedelta
+from os.path import join
+
+from manga_tracker import MangaTracker
+from manga_tracker import summary as summary_module
+from manga_tracker.output import OutputHandler
+from manga_tracker.summary import ResultSummary
+from manga_tracker.scripts.utils import configure_cli
+from conftest import write_bounty
+
+def _crawl(tmp_path, site):
+    cfg = configure_cli()
+    bounty_path, result_path = str(tmp_path / 'bounty.json'), str(tmp_path / 'result')
+    write_bounty(bounty_path, [['a', f'{site}/solo_leveling.html'], ['b', f'{site}/nested.html']])
+    groups = MangaTracker.init_job(bounty_path, result_path, cfg['COLUMNS'], cfg['DELIMITER'], True)
+    MangaTracker.crawl(groups, result_path, cfg['COLUMNS'], cfg['DELIMITER'], True)
+    MangaTracker.end_job(result_path, True, cfg['DELIMITER'])
+    return result_path, cfg['DELIMITER']
+
+def _is_current(path):
+    summary, f = ResultSummary._open(path)
+    if (f is not None):
+        f.close()
+    return summary is not None
+
+def test_changed_output_rebuilds_summary(tmp_path, site):
+    path, delimiter = _crawl(tmp_path, site)
+    assert OutputHandler.backend == 'text' and _is_current(path)
+    _, _, output = ResultSummary.result(path, delimiter)
+    assert sorted(row[2] for row in output[1:]) == ['a', 'b']
+
+    # Copy row of 'a' as new target 'c'
+    with open(join(path, 'outputs.txt'), 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    row = next(line.split(delimiter) for line in lines[1:] if (line.split(delimiter)[1] == 'a'))
+    row[1] = 'c'
+    with open(join(path, 'outputs.txt'), 'a', encoding='utf-8') as f:
+        f.write(delimiter.join(row) + '\n')
+    assert not _is_current(path)
+
+    _, counts, output = ResultSummary.result(path, delimiter)
+    assert sorted(row[2] for row in output[1:]) == ['a', 'b', 'c'] and sum(counts.values()) == 3
+    assert _is_current(path)
+
+def test_new_day_or_log_invalidates_summary(tmp_path, site, monkeypatch):
+    path, delimiter = _crawl(tmp_path, site)
+    assert _is_current(path)
+
+    class _Tomorrow(date):
+        @classmethod
+        def today(cls):
+            return date.today() + timedelta(days=1)
+    monkeypatch.setattr(summary_module, 'date', _Tomorrow)
+    assert not _is_current(path)
+    monkeypatch.undo()
+
+    with open(join(path, 'logs.txt'), 'a', encoding='utf-8') as f:
+        f.write('\n')
+    assert not _is_current(path)
@@ -0,0 +1,38 @@
+from os.path import join
+import signal
+
+import pytest
+
+from conftest import saved_pages, start_job, wait_checkpoint, write_bounty
+
+def _targets(site, tmp_path):
+    return [[page, f'{site}/{page}.html'] for page in saved_pages()] + [['slow', f'{site}/slow/nested.html?{tmp_path.name}']]
+
+def _lines(result_path, name):
+    with open(join(result_path, name), 'r', encoding='utf-8') as f:
+        return f.read().splitlines()
+
+def test_killed_job_keeps_output_header(tmp_path, site):
+    bounty_path, result_path = str(tmp_path / 'bounty.json'), str(tmp_path / 'result')
+    write_bounty(bounty_path, _targets(site, tmp_path))
+    proc = start_job(bounty_path, result_path)
+    wait_checkpoint(result_path, len(saved_pages()))
+    proc.kill()
+    proc.wait()
+
+    lines = _lines(result_path, 'outputs.txt')
+    assert lines[0].split('|')[:2] == ['website', 'alias']
+
+@pytest.mark.parametrize('incremental', [False, True])
+def test_terminated_job_flushes_buffer(tmp_path, site, incremental):
+    bounty_path, result_path = str(tmp_path / 'bounty.json'), str(tmp_path / 'result')
+    write_bounty(bounty_path, _targets(site, tmp_path))
+    proc = start_job(bounty_path, result_path, incremental=incremental)
+    wait_checkpoint(result_path, len(saved_pages()))
+    proc.terminate()
+    assert proc.wait() == -signal.SIGTERM
+
+    lines = _lines(result_path, 'outputs.txt')
+    assert lines[0].split('|')[:2] == ['website', 'alias']
+    assert sorted(line.split('|')[1] for line in lines[1:]) == saved_pages()
+    assert any('[Init]' in line for line in _lines(result_path, 'logs.txt'))